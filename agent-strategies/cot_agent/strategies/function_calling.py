@@ -1,7 +1,11 @@
 import base64
 import json
+import logging
+import threading
 import time
 from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from copy import deepcopy
 from typing import Any, Optional, cast
 
@@ -31,11 +35,13 @@ from dify_plugin.interfaces.agent import (
     ToolEntity,
     ToolInvokeMeta,
 )
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ValidationInfo, field_validator
 
 from strategies.tool_allowlist import coerce_allowed_tools, filter_allowed_tools
 from strategies.tool_response import should_forward_file_message
 
+logger = logging.getLogger(__name__)
+
 THINK_START = "<think>"
 THINK_END = "</think>"
 
@@ -100,6 +106,8 @@ class FunctionCallingParams(BaseModel):
     files: list[File] | None = None
     allowed_tools: list[str] | None = None
     maximum_iterations: int = 3
+    max_concurrent_tool_calls: int = 1
+    tool_call_timeout: float = 0
     context: list[ContextItem] | None = None
 
     @field_validator("files", mode="before")
@@ -109,12 +117,31 @@ class FunctionCallingParams(BaseModel):
             return [item for item in value if item is not None]
         return value
 
+    @field_validator("max_concurrent_tool_calls", "tool_call_timeout", mode="before")
+    @classmethod
+    def default_unset_concurrency_options(cls, value: Any, info: ValidationInfo) -> Any:
+        if value is None or value == "":
+            return cls.model_fields[info.field_name].default
+        return value
+
     @field_validator("allowed_tools", mode="before")
     @classmethod
     def normalize_allowed_tools(cls, value: Any) -> list[str] | None:
         return coerce_allowed_tools(value)
 
 
+class _ToolCallClock:
+    """When a concurrent tool call left the queue and started running."""
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.started_at: float | None = None
+
+    def start(self, started_at: float) -> None:
+        self.started_at = started_at
+        self.started.set()
+
+
 class FunctionCallingAgentStrategy(AgentStrategy):
     query: str = ""
     instruction: str | None = ""
@@ -504,179 +531,52 @@ class FunctionCallingAgentStrategy(AgentStrategy):
                             name=tool_call_name,
                         )
                     )
+            elif fc_params.max_concurrent_tool_calls > 1 and len(tool_calls) > 1:
+                yield from self._invoke_tool_calls_concurrently(
+                    tool_calls=tool_calls,
+                    tool_instances=tool_instances,
+                    round_log=round_log,
+                    max_workers=fc_params.max_concurrent_tool_calls,
+                    timeout=fc_params.tool_call_timeout or None,
+                    tool_responses=tool_responses,
+                    current_thoughts=current_thoughts,
+                )
             else:
                 for tool_call_id, tool_call_name, tool_call_args in tool_calls:
                     tool_instance = tool_instances.get(tool_call_name)
                     tool_call_started_at = time.perf_counter()
-                    tool_call_log = self.create_log_message(
-                        label=f"CALL {tool_call_name}",
-                        data={},
-                        metadata={
-                            LogMetadata.STARTED_AT: time.perf_counter(),
-                            LogMetadata.PROVIDER: tool_instance.identity.provider
-                            if tool_instance
-                            else "",
-                        },
-                        parent=round_log,
-                        status=ToolInvokeMessage.LogMessage.LogStatus.START,
+                    tool_call_log = self._create_tool_call_log(
+                        tool_call_name=tool_call_name,
+                        tool_instance=tool_instance,
+                        round_log=round_log,
                     )
                     yield tool_call_log
                     if not tool_instance:
-                        tool_response = {
-                            "tool_call_id": tool_call_id,
-                            "tool_call_name": tool_call_name,
-                            "tool_response": f"there is not a tool named {tool_call_name}",
-                            "meta": ToolInvokeMeta.error_instance(
-                                f"there is not a tool named {tool_call_name}"
-                            ).to_dict(),
-                        }
+                        tool_response = self._unknown_tool_response(
+                            tool_call_id, tool_call_name
+                        )
                     else:
-                        # invoke tool
-                        try:
-                            provider_type = ToolProviderType(tool_instance.provider_type)
-                            tool_invoke_responses = self.session.tool.invoke(
-                                provider_type=provider_type,
-                                provider=tool_instance.identity.provider,
-                                tool_name=tool_instance.identity.name,
-                                parameters={
-                                    **tool_instance.runtime_parameters,
-                                    **tool_call_args,
-                                },
-                            )
-                            tool_result = ""
-                            for tool_invoke_response in tool_invoke_responses:
-                                if (
-                                    tool_invoke_response.type
-                                    == ToolInvokeMessage.MessageType.TEXT
-                                ):
-                                    tool_result += self._format_tool_response(
-                                        response=tool_invoke_response,
-                                        provider_type=provider_type,
-                                    )
-                                elif (
-                                    tool_invoke_response.type
-                                    == ToolInvokeMessage.MessageType.LINK
-                                ):
-                                    tool_result += (
-                                        "result link: "
-                                        + cast(
-                                            ToolInvokeMessage.TextMessage,
-                                            tool_invoke_response.message,
-                                        ).text
-                                        + "."
-                                        + " please tell user to check it."
-                                    )
-                                    if should_forward_file_message(tool_invoke_response):
-                                        yield tool_invoke_response
-                                elif tool_invoke_response.type in {
-                                    ToolInvokeMessage.MessageType.IMAGE_LINK,
-                                    ToolInvokeMessage.MessageType.IMAGE,
-                                }:
-                                    # Extract the file path or URL from the message
-                                    if hasattr(tool_invoke_response.message, "text"):
-                                        file_info = cast(
-                                            ToolInvokeMessage.TextMessage,
-                                            tool_invoke_response.message,
-                                        ).text
-                                        # Try to create a blob message with the file content
-                                        try:
-                                            # If it's a local file path, try to read it
-                                            if file_info.startswith("/files/"):
-                                                import os
-
-                                                if os.path.exists(file_info):
-                                                    with open(file_info, "rb") as f:
-                                                        file_content = f.read()
-                                                    # Create a blob message with the file content
-                                                    blob_response = self.create_blob_message(
-                                                        blob=file_content,
-                                                        meta={
-                                                            "mime_type": "image/png",
-                                                            "filename": os.path.basename(
-                                                                file_info
-                                                            ),
-                                                        },
-                                                    )
-                                                    yield blob_response
-                                        except Exception as e:
-                                            yield self.create_text_message(
-                                                f"Failed to create blob message: {e}"
-                                            )
-                                    tool_result += (
-                                        "image has been created and sent to user already, "
-                                        + "you do not need to create it, just tell the user to check it now."
-                                    )
-                                    # TODO: convert to agent invoke message
-                                    yield tool_invoke_response
-                                elif (
-                                    tool_invoke_response.type
-                                    == ToolInvokeMessage.MessageType.JSON
-                                ):
-                                    tool_result += self._format_tool_response(
-                                        response=tool_invoke_response,
-                                        provider_type=provider_type,
-                                    )
-                                elif (
-                                    tool_invoke_response.type
-                                    == ToolInvokeMessage.MessageType.VARIABLE
-                                ):
-                                    tool_result += self._format_tool_response(
-                                        response=tool_invoke_response,
-                                        provider_type=provider_type,
-                                    )
-                                elif (
-                                    tool_invoke_response.type
-                                    == ToolInvokeMessage.MessageType.BLOB
-                                ):
-                                    tool_result += "Generated file ... "
-                                    # TODO: convert to agent invoke message
-                                    yield tool_invoke_response
-                                elif (
-                                    tool_invoke_response.type
-                                    == ToolInvokeMessage.MessageType.FILE
-                                ):
-                                    tool_result += "Generated file ... "
-                                    yield tool_invoke_response
-                                else:
-                                    tool_result += (
-                                        f"tool response: {tool_invoke_response.message!r}."
-                                    )
-                        except Exception as e:
-                            tool_result = f"tool invoke error: {e!s}"
-                        tool_response = {
-                            "tool_call_id": tool_call_id,
-                            "tool_call_name": tool_call_name,
-                            "tool_call_input": {
-                                **tool_instance.runtime_parameters,
-                                **tool_call_args,
-                            },
-                            "tool_response": tool_result,
-                        }
+                        tool_result = yield from self._invoke_tool(
+                            tool_instance, tool_call_args
+                        )
+                        tool_response = self._tool_response(
+                            tool_call_id=tool_call_id,
+                            tool_call_name=tool_call_name,
+                            tool_instance=tool_instance,
+                            tool_call_args=tool_call_args,
+                            tool_result=tool_result,
+                        )
 
-                    yield self.finish_log_message(
-                        log=tool_call_log,
-                        data={
-                            "output": tool_response,
-                        },
-                        metadata={
-                            LogMetadata.STARTED_AT: tool_call_started_at,
-                            LogMetadata.PROVIDER: tool_instance.identity.provider
-                            if tool_instance
-                            else "",
-                            LogMetadata.FINISHED_AT: time.perf_counter(),
-                            LogMetadata.ELAPSED_TIME: time.perf_counter()
-                            - tool_call_started_at,
-                        },
+                    yield self._finish_tool_call_log(
+                        tool_call_log=tool_call_log,
+                        tool_response=tool_response,
+                        tool_instance=tool_instance,
+                        started_at=tool_call_started_at,
+                        finished_at=time.perf_counter(),
+                    )
+                    self._record_tool_response(
+                        tool_response, tool_responses, current_thoughts
                     )
-                    tool_responses.append(tool_response)
-                    if tool_response["tool_response"] is not None:
-                        current_thoughts.append(
-                            ToolPromptMessage(
-                                content=str(tool_response["tool_response"]),
-                                tool_call_id=tool_call_id,
-                                name=tool_call_name,
-                            )
-                        )
             # After handling all tool calls, insert a blank line so the next assistant thought
             # appears on a new line in the user interface.
             if tool_calls:
@@ -750,6 +650,363 @@ class FunctionCallingAgentStrategy(AgentStrategy):
             }
         )
 
+    def _invoke_tool(
+        self, tool_instance: ToolEntity, tool_call_args: dict[str, Any]
+    ) -> Generator[AgentInvokeMessage, None, str]:
+        """
+        Invoke a tool, yielding the messages forwarded to the user.
+
+        Returns the tool result text that is fed back to the model.
+        """
+        try:
+            provider_type = ToolProviderType(tool_instance.provider_type)
+            tool_invoke_responses = self.session.tool.invoke(
+                provider_type=provider_type,
+                provider=tool_instance.identity.provider,
+                tool_name=tool_instance.identity.name,
+                parameters={
+                    **tool_instance.runtime_parameters,
+                    **tool_call_args,
+                },
+            )
+            tool_result = ""
+            for tool_invoke_response in tool_invoke_responses:
+                if (
+                    tool_invoke_response.type
+                    == ToolInvokeMessage.MessageType.TEXT
+                ):
+                    tool_result += self._format_tool_response(
+                        response=tool_invoke_response,
+                        provider_type=provider_type,
+                    )
+                elif (
+                    tool_invoke_response.type
+                    == ToolInvokeMessage.MessageType.LINK
+                ):
+                    tool_result += (
+                        "result link: "
+                        + cast(
+                            ToolInvokeMessage.TextMessage,
+                            tool_invoke_response.message,
+                        ).text
+                        + "."
+                        + " please tell user to check it."
+                    )
+                    if should_forward_file_message(tool_invoke_response):
+                        yield tool_invoke_response
+                elif tool_invoke_response.type in {
+                    ToolInvokeMessage.MessageType.IMAGE_LINK,
+                    ToolInvokeMessage.MessageType.IMAGE,
+                }:
+                    # Extract the file path or URL from the message
+                    if hasattr(tool_invoke_response.message, "text"):
+                        file_info = cast(
+                            ToolInvokeMessage.TextMessage,
+                            tool_invoke_response.message,
+                        ).text
+                        # Try to create a blob message with the file content
+                        try:
+                            # If it's a local file path, try to read it
+                            if file_info.startswith("/files/"):
+                                import os
+
+                                if os.path.exists(file_info):
+                                    with open(file_info, "rb") as f:
+                                        file_content = f.read()
+                                    # Create a blob message with the file content
+                                    blob_response = self.create_blob_message(
+                                        blob=file_content,
+                                        meta={
+                                            "mime_type": "image/png",
+                                            "filename": os.path.basename(
+                                                file_info
+                                            ),
+                                        },
+                                    )
+                                    yield blob_response
+                        except Exception as e:
+                            yield self.create_text_message(
+                                f"Failed to create blob message: {e}"
+                            )
+                    tool_result += (
+                        "image has been created and sent to user already, "
+                        + "you do not need to create it, just tell the user to check it now."
+                    )
+                    # TODO: convert to agent invoke message
+                    yield tool_invoke_response
+                elif (
+                    tool_invoke_response.type
+                    == ToolInvokeMessage.MessageType.JSON
+                ):
+                    tool_result += self._format_tool_response(
+                        response=tool_invoke_response,
+                        provider_type=provider_type,
+                    )
+                elif (
+                    tool_invoke_response.type
+                    == ToolInvokeMessage.MessageType.VARIABLE
+                ):
+                    tool_result += self._format_tool_response(
+                        response=tool_invoke_response,
+                        provider_type=provider_type,
+                    )
+                elif (
+                    tool_invoke_response.type
+                    == ToolInvokeMessage.MessageType.BLOB
+                ):
+                    tool_result += "Generated file ... "
+                    # TODO: convert to agent invoke message
+                    yield tool_invoke_response
+                elif (
+                    tool_invoke_response.type
+                    == ToolInvokeMessage.MessageType.FILE
+                ):
+                    tool_result += "Generated file ... "
+                    yield tool_invoke_response
+                else:
+                    tool_result += (
+                        f"tool response: {tool_invoke_response.message!r}."
+                    )
+        except Exception as e:
+            tool_result = f"tool invoke error: {e!s}"
+        return tool_result
+
+    def _invoke_tool_calls_concurrently(
+        self,
+        *,
+        tool_calls: list[tuple[str, str, dict[str, Any]]],
+        tool_instances: dict[str, ToolEntity],
+        round_log: AgentInvokeMessage,
+        max_workers: int,
+        timeout: float | None,
+        tool_responses: list[dict[str, Any]],
+        current_thoughts: list[PromptMessage],
+    ) -> Generator[AgentInvokeMessage, None, None]:
+        """
+        Run the tool calls of one round on a bounded worker pool.
+
+        Messages forwarded by each tool, the finish log entries and the
+        ToolPromptMessages are emitted in the order the model issued the calls.
+        A call that does not finish within `timeout` seconds of starting, or
+        that is still queued `timeout` seconds after the round reaches it, is
+        reported to the model as an error and its output is discarded.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(tool_calls)),
+            thread_name_prefix="fc-tool-call",
+        )
+        try:
+            pending = []
+            for tool_call_id, tool_call_name, tool_call_args in tool_calls:
+                tool_instance = tool_instances.get(tool_call_name)
+                tool_call_log = self._create_tool_call_log(
+                    tool_call_name=tool_call_name,
+                    tool_instance=tool_instance,
+                    round_log=round_log,
+                )
+                yield tool_call_log
+                clock = _ToolCallClock()
+                future = (
+                    executor.submit(
+                        self._collect_tool_invocation,
+                        tool_instance,
+                        tool_call_args,
+                        clock,
+                    )
+                    if tool_instance
+                    else None
+                )
+                pending.append(
+                    (
+                        tool_call_id,
+                        tool_call_name,
+                        tool_call_args,
+                        tool_instance,
+                        tool_call_log,
+                        future,
+                        clock,
+                    )
+                )
+
+            for (
+                tool_call_id,
+                tool_call_name,
+                tool_call_args,
+                tool_instance,
+                tool_call_log,
+                future,
+                clock,
+            ) in pending:
+                waited_at = time.perf_counter()
+                if future is None:
+                    tool_response = self._unknown_tool_response(
+                        tool_call_id, tool_call_name
+                    )
+                    started_at = finished_at = waited_at
+                else:
+                    try:
+                        tool_result, messages, started_at, finished_at = (
+                            self._await_tool_call(future, clock, timeout)
+                        )
+                    except FuturesTimeoutError:
+                        if not future.cancel():
+                            logger.warning(
+                                "Tool call %s (%s) timed out after %ss and keeps running in the background",
+                                tool_call_id,
+                                tool_call_name,
+                                timeout,
+                            )
+                        tool_result = f"tool invoke error: timed out after {timeout}s"
+                        messages = []
+                        started_at = clock.started_at or waited_at
+                        finished_at = time.perf_counter()
+                    yield from messages
+                    tool_response = self._tool_response(
+                        tool_call_id=tool_call_id,
+                        tool_call_name=tool_call_name,
+                        tool_instance=tool_instance,
+                        tool_call_args=tool_call_args,
+                        tool_result=tool_result,
+                    )
+
+                yield self._finish_tool_call_log(
+                    tool_call_log=tool_call_log,
+                    tool_response=tool_response,
+                    tool_instance=tool_instance,
+                    started_at=started_at,
+                    finished_at=finished_at,
+                )
+                self._record_tool_response(tool_response, tool_responses, current_thoughts)
+        finally:
+            # do not block the round on calls that timed out
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _await_tool_call(
+        future: Future, clock: _ToolCallClock, timeout: float | None
+    ) -> tuple[str, list[AgentInvokeMessage], float, float]:
+        """
+        Wait for a call until `timeout` seconds after it started running.
+
+        A call still queued behind busy workers gets `timeout` seconds to start.
+        """
+        if timeout is None:
+            return future.result()
+        if not clock.started.wait(timeout):
+            raise FuturesTimeoutError()
+        remaining = clock.started_at + timeout - time.perf_counter()
+        return future.result(timeout=max(remaining, 0))
+
+    def _collect_tool_invocation(
+        self,
+        tool_instance: ToolEntity,
+        tool_call_args: dict[str, Any],
+        clock: Optional[_ToolCallClock] = None,
+    ) -> tuple[str, list[AgentInvokeMessage], float, float]:
+        """
+        Drain `_invoke_tool` in a worker thread so its messages can be replayed in order.
+        """
+        started_at = time.perf_counter()
+        if clock is not None:
+            clock.start(started_at)
+        messages: list[AgentInvokeMessage] = []
+        invocation = self._invoke_tool(tool_instance, tool_call_args)
+        while True:
+            try:
+                messages.append(next(invocation))
+            except StopIteration as stop:
+                return stop.value, messages, started_at, time.perf_counter()
+
+    def _create_tool_call_log(
+        self,
+        *,
+        tool_call_name: str,
+        tool_instance: ToolEntity | None,
+        round_log: AgentInvokeMessage,
+    ) -> AgentInvokeMessage:
+        return self.create_log_message(
+            label=f"CALL {tool_call_name}",
+            data={},
+            metadata={
+                LogMetadata.STARTED_AT: time.perf_counter(),
+                LogMetadata.PROVIDER: tool_instance.identity.provider
+                if tool_instance
+                else "",
+            },
+            parent=round_log,
+            status=ToolInvokeMessage.LogMessage.LogStatus.START,
+        )
+
+    def _finish_tool_call_log(
+        self,
+        *,
+        tool_call_log: AgentInvokeMessage,
+        tool_response: dict[str, Any],
+        tool_instance: ToolEntity | None,
+        started_at: float,
+        finished_at: float,
+    ) -> AgentInvokeMessage:
+        return self.finish_log_message(
+            log=tool_call_log,
+            data={
+                "output": tool_response,
+            },
+            metadata={
+                LogMetadata.STARTED_AT: started_at,
+                LogMetadata.PROVIDER: tool_instance.identity.provider
+                if tool_instance
+                else "",
+                LogMetadata.FINISHED_AT: finished_at,
+                LogMetadata.ELAPSED_TIME: finished_at - started_at,
+            },
+        )
+
+    @staticmethod
+    def _unknown_tool_response(tool_call_id: str, tool_call_name: str) -> dict[str, Any]:
+        return {
+            "tool_call_id": tool_call_id,
+            "tool_call_name": tool_call_name,
+            "tool_response": f"there is not a tool named {tool_call_name}",
+            "meta": ToolInvokeMeta.error_instance(
+                f"there is not a tool named {tool_call_name}"
+            ).to_dict(),
+        }
+
+    @staticmethod
+    def _tool_response(
+        *,
+        tool_call_id: str,
+        tool_call_name: str,
+        tool_instance: ToolEntity,
+        tool_call_args: dict[str, Any],
+        tool_result: str,
+    ) -> dict[str, Any]:
+        return {
+            "tool_call_id": tool_call_id,
+            "tool_call_name": tool_call_name,
+            "tool_call_input": {
+                **tool_instance.runtime_parameters,
+                **tool_call_args,
+            },
+            "tool_response": tool_result,
+        }
+
+    @staticmethod
+    def _record_tool_response(
+        tool_response: dict[str, Any],
+        tool_responses: list[dict[str, Any]],
+        current_thoughts: list[PromptMessage],
+    ) -> None:
+        tool_responses.append(tool_response)
+        if tool_response["tool_response"] is not None:
+            current_thoughts.append(
+                ToolPromptMessage(
+                    content=str(tool_response["tool_response"]),
+                    tool_call_id=tool_response["tool_call_id"],
+                    name=tool_response["tool_call_name"],
+                )
+            )
+
     def check_tool_calls(self, llm_result_chunk: LLMResultChunk) -> bool:
         """
         Check if there is any tool call in llm result chunk
@@ -1,6 +1,8 @@
 import base64
 import json
 import sys
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import Mock
@@ -18,6 +20,7 @@ from dify_plugin.entities.model.message import (
     AssistantPromptMessage,
     ImagePromptMessageContent,
     TextPromptMessageContent,
+    ToolPromptMessage,
 )
 from dify_plugin.entities.tool import ToolInvokeMessage, ToolProviderType
 from dify_plugin.file.file import File, FileType
@@ -458,5 +461,168 @@ class TestFunctionCallingAllowedTools(unittest.TestCase):
         invoke.assert_not_called()
 
 
+class TestFunctionCallingConcurrentToolCalls(unittest.TestCase):
+    @staticmethod
+    def _tool(name: str) -> ToolEntity:
+        return ToolEntity.model_validate(
+            {
+                "identity": {
+                    "author": "test",
+                    "name": name,
+                    "label": {"en_US": name},
+                    "provider": "test",
+                },
+                "provider_type": "builtin",
+                "runtime_parameters": {},
+            }
+        )
+
+    def _invoke(self, tool_invoke, **parameters):
+        calls = [
+            _make_tool_call("call-1", "slow", "{}"),
+            _make_tool_call("call-2", "fast", "{}"),
+            _make_tool_call("call-3", "missing", "{}"),
+        ]
+        session = Mock()
+        session.model.llm.invoke.side_effect = [
+            LLMResult(
+                model="test-model",
+                message=AssistantPromptMessage(content="", tool_calls=calls),
+                usage=LLMUsage.empty_usage(),
+            ),
+            LLMResult(
+                model="test-model",
+                message=AssistantPromptMessage(content="done", tool_calls=[]),
+                usage=LLMUsage.empty_usage(),
+            ),
+        ]
+        session.tool.invoke.side_effect = tool_invoke
+        strategy = FunctionCallingAgentStrategy(runtime=Mock(), session=session)
+        messages = list(
+            strategy._invoke(
+                {
+                    "query": "look things up",
+                    "instruction": "Use the tools",
+                    "model": AgentModelConfig(
+                        provider="test", model="test-model", mode="chat"
+                    ),
+                    "tools": [self._tool("slow"), self._tool("fast")],
+                    "maximum_iterations": 3,
+                    **parameters,
+                }
+            )
+        )
+        second_prompt = session.model.llm.invoke.call_args_list[1].kwargs[
+            "prompt_messages"
+        ]
+        return messages, second_prompt
+
+    @staticmethod
+    def _text(text: str) -> ToolInvokeMessage:
+        return ToolInvokeMessage(
+            type=ToolInvokeMessage.MessageType.TEXT,
+            message=ToolInvokeMessage.TextMessage(text=text),
+        )
+
+    def test_results_keep_model_order(self):
+        def tool_invoke(tool_name, **kwargs):
+            if tool_name == "slow":
+                time.sleep(0.05)
+            return iter([self._text(f"{tool_name} result")])
+
+        _, prompt = self._invoke(tool_invoke, max_concurrent_tool_calls=4)
+
+        tool_messages = [m for m in prompt if isinstance(m, ToolPromptMessage)]
+        self.assertEqual(
+            [m.tool_call_id for m in tool_messages], ["call-1", "call-2", "call-3"]
+        )
+        self.assertEqual(tool_messages[0].content, "slow result")
+        self.assertEqual(tool_messages[1].content, "fast result")
+        self.assertEqual(tool_messages[2].content, "there is not a tool named missing")
+
+    def test_calls_overlap(self):
+        barrier = threading.Barrier(2, timeout=2)
+
+        def tool_invoke(tool_name, **kwargs):
+            barrier.wait()
+            return iter([self._text(tool_name)])
+
+        _, prompt = self._invoke(tool_invoke, max_concurrent_tool_calls=2)
+
+        tool_messages = [m for m in prompt if isinstance(m, ToolPromptMessage)]
+        self.assertEqual([m.content for m in tool_messages][:2], ["slow", "fast"])
+
+    def test_timeout_is_reported_to_model(self):
+        release = threading.Event()
+
+        def tool_invoke(tool_name, **kwargs):
+            if tool_name == "slow":
+                release.wait(2)
+            return iter([self._text(tool_name)])
+
+        try:
+            _, prompt = self._invoke(
+                tool_invoke, max_concurrent_tool_calls=2, tool_call_timeout=0.05
+            )
+        finally:
+            release.set()
+
+        tool_messages = [m for m in prompt if isinstance(m, ToolPromptMessage)]
+        self.assertIn("timed out", tool_messages[0].content)
+        self.assertEqual(tool_messages[1].content, "fast")
+
+    def test_timeout_counts_from_each_call_start(self):
+        def tool_invoke(tool_name, **kwargs):
+            time.sleep(0.3)
+            return iter([self._text(tool_name)])
+
+        _, prompt = self._invoke(
+            tool_invoke, max_concurrent_tool_calls=2, tool_call_timeout=0.2
+        )
+
+        # both calls started together, so waiting on the first must not extend the second
+        tool_messages = [m for m in prompt if isinstance(m, ToolPromptMessage)]
+        self.assertIn("timed out", tool_messages[0].content)
+        self.assertIn("timed out", tool_messages[1].content)
+
+    def test_forwarded_files_follow_call_order(self):
+        def file_link(name: str) -> ToolInvokeMessage:
+            return ToolInvokeMessage(
+                type=ToolInvokeMessage.MessageType.LINK,
+                message=ToolInvokeMessage.TextMessage(text=f"/files/tools/{name}"),
+                meta={"tool_file_id": name},
+            )
+
+        links = {"slow": file_link("slow.pdf"), "fast": file_link("fast.pdf")}
+
+        def tool_invoke(tool_name, **kwargs):
+            if tool_name == "slow":
+                time.sleep(0.05)
+            return iter([links[tool_name]])
+
+        messages, _ = self._invoke(tool_invoke, max_concurrent_tool_calls=2)
+
+        forwarded = [m for m in messages if m in links.values()]
+        self.assertEqual(forwarded, [links["slow"], links["fast"]])
+
+    def test_unset_options_default_to_sequential(self):
+        params = FunctionCallingParams(
+            query="q",
+            instruction=None,
+            model={
+                "provider": "test/provider",
+                "model": "test-model",
+                "mode": "chat",
+                "completion_params": {},
+            },
+            tools=None,
+            max_concurrent_tool_calls=None,
+            tool_call_timeout=None,
+        )
+
+        self.assertEqual(params.max_concurrent_tool_calls, 1)
+        self.assertEqual(params.tool_call_timeout, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,6 +12,10 @@ from dify_plugin.errors.tool import ToolProviderCredentialValidationError
 from dify_plugin.interfaces.datasource.website import WebsiteCrawlDatasource
 from requests import HTTPError
 
+POLL_INITIAL_INTERVAL = 1.0
+POLL_MAX_INTERVAL = 10.0
+POLL_BACKOFF = 1.5
+
 
 def build_crawl_payload(datasource_parameters: Mapping[str, Any]) -> dict[str, Any]:
     crawl_sub_pages = datasource_parameters.get("crawl_subpages", True)
@@ -69,42 +73,60 @@ class CrawlDatasource(WebsiteCrawlDatasource):
             crawl_res.status = "processing"
             yield self.create_crawl_message(crawl_res)
 
+            # pages are delivered as they complete: each processing update carries
+            # only the new ones, the final update carries every crawled page
+            all_pages: list[WebSiteInfoDetail] = []
+            delivered: set[str] = set()
+            skip = 0
+            interval = POLL_INITIAL_INTERVAL
             while True:
-                status = app.check_crawl_status(job_id=job_id)
+                status = app.check_crawl_status(job_id=job_id, skip=skip)
+                if status["status"] == "failed":
+                    raise HTTPError(
+                        f"Job {job_id} failed: {status.get('error', 'Unknown error')}"
+                    )
+
+                url_data_list, skip = app._collect_new_crawl_pages(status, skip)
+                new_pages = self._new_pages(url_data_list, delivered)
+                all_pages.extend(new_pages)
+                crawl_res.total = status["total"] or 0
+                crawl_res.completed = status["completed"] or 0
+
                 if status["status"] == "completed":
-                    self._process_completed_job(app, status, crawl_res)
                     crawl_res.status = "completed"
-                    crawl_res.total = status["total"] or 0
-                    crawl_res.completed = status["completed"] or 0
+                    crawl_res.web_info_list = all_pages
                     yield self.create_crawl_message(crawl_res)
                     break
-                elif status["status"] == "failed":
-                    raise HTTPError(
-                        f"Job {job_id} failed: {status.get('error', 'Unknown error')}"
-                    )
+
+                crawl_res.status = "processing"
+                crawl_res.web_info_list = new_pages
+                yield self.create_crawl_message(crawl_res)
+                if new_pages:
+                    interval = POLL_INITIAL_INTERVAL
                 else:
-                    crawl_res.status = "processing"
-                    crawl_res.total = status["total"] or 0
-                    crawl_res.completed = status["completed"] or 0
-                    yield self.create_crawl_message(crawl_res)
-                    time.sleep(5)
+                    interval = min(interval * POLL_BACKOFF, POLL_MAX_INTERVAL)
+                time.sleep(interval)
 
         except Exception as e:
             raise ValueError(f"An error occurred: {e!s}")
 
     @staticmethod
-    def _process_completed_job(app: FirecrawlApp, status: dict, crawl_res: WebSiteInfo):
-        url_data_list = app._collect_all_crawl_pages(status)
-        _format_res = app.format_crawl_status_response(
-            status["status"], status, url_data_list
-        )
-
-        crawl_res.web_info_list = [
-            WebSiteInfoDetail(
-                source_url=item["source_url"],
-                content=item["content"] or "",
-                title=item["title"] or "",
-                description=item["description"] or "",
+    def _new_pages(
+        url_data_list: list[dict[str, Any]], delivered: set[str]
+    ) -> list[WebSiteInfoDetail]:
+        new_pages = []
+        for item in url_data_list:
+            source_url = item["source_url"]
+            if source_url:
+                if source_url in delivered:
+                    continue
+                delivered.add(source_url)
+            new_pages.append(
+                WebSiteInfoDetail(
+                    source_url=source_url,
+                    content=item["content"] or "",
+                    title=item["title"] or "",
+                    description=item["description"] or "",
+                )
             )
-            for item in _format_res["data"]
-        ]
+        return new_pages
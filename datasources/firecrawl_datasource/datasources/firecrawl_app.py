@@ -115,8 +115,11 @@ class FirecrawlApp:
             return self._monitor_job_status(job_id=job_id, poll_interval=poll_interval)
         return response
 
-    def check_crawl_status(self, job_id: str):
+    def check_crawl_status(self, job_id: str, skip: int = 0):
         endpoint = f"{self.base_url.rstrip('/')}/v2/crawl/{job_id}"
+        if skip:
+            # results are paginated; skip the documents that were already read
+            endpoint = f"{endpoint}?skip={skip}"
         response = self._request("GET", endpoint)
         if response is None:
             raise HTTPError(
@@ -178,6 +181,35 @@ class FirecrawlApp:
             current_page = next_response
         return url_data_list
 
+    def _collect_new_crawl_pages(
+        self, first_page: dict[str, Any], skip: int = 0
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Collect the documents of a status response that start at offset ``skip``.
+
+        Follows ``next`` links like ``_collect_all_crawl_pages`` but also works
+        while the crawl is still running, and returns the offset to pass as
+        ``skip`` on the next status check so that documents are read only once.
+        """
+        url_data_list: list[dict[str, Any]] = []
+        current_page = first_page
+        while True:
+            data = current_page.get("data") or []
+            for item in data:
+                if isinstance(item, dict) and "metadata" in item and "markdown" in item:
+                    url_data_list.append(self._extract_common_fields(item))
+            skip += len(data)
+            next_url: str | None = current_page.get("next")
+            # an empty page with a next link would otherwise loop forever
+            if not next_url or not data:
+                break
+            next_response = self._request("GET", next_url)
+            if next_response is None:
+                raise HTTPError(
+                    "Failed to fetch next crawl page after multiple retries"
+                )
+            current_page = next_response
+        return url_data_list, skip
+
     def format_crawl_status_response(
         self,
         status: str,
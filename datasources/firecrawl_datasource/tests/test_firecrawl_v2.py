@@ -112,6 +112,39 @@ def test_collects_v2_next_page(monkeypatch: pytest.MonkeyPatch) -> None:
     assert request.call_args.args[:2] == ("GET", next_url)
 
 
+def test_collects_only_new_pages_while_crawl_is_running(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    request = Mock(
+        return_value=response(
+            200,
+            {
+                "status": "scraping",
+                "total": 3,
+                "completed": 2,
+                "data": [
+                    {
+                        "markdown": "second",
+                        "metadata": {"sourceURL": "https://example.com/second"},
+                    }
+                ],
+            },
+        )
+    )
+    monkeypatch.setattr("datasources.firecrawl_app.requests.request", request)
+    app = FirecrawlApp(api_key="fc-test")
+
+    status = app.check_crawl_status("job-id", skip=1)
+    result, skip = app._collect_new_crawl_pages(status, skip=1)
+
+    assert request.call_args.args[:2] == (
+        "GET",
+        "https://api.firecrawl.dev/v2/crawl/job-id?skip=1",
+    )
+    assert [item["content"] for item in result] == ["second"]
+    assert skip == 2
+
+
 def test_failed_v2_status_preserves_error_message(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
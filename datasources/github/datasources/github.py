@@ -1,5 +1,10 @@
+from collections import OrderedDict
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import base64
 import markdown
@@ -14,6 +19,25 @@ from dify_plugin.entities.datasource import (
 )
 from dify_plugin.interfaces.datasource.online_document import OnlineDocumentDatasource
 
+# Upper bound on concurrent API requests while discovering repository pages
+MAX_CONCURRENT_REQUESTS = 8
+# Total size of the ETag-validated response bodies kept for conditional requests
+RESPONSE_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+# Shared session so requests reuse pooled keep-alive connections
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENT_REQUESTS),
+)
+
+# (token fingerprint, url, params) -> (etag, json body, body size); a 304 for
+# a cached ETag does not count against the GitHub rate limit. Only the page
+# discovery requests are cached, document contents are always fetched.
+_response_cache: "OrderedDict[tuple, tuple[str, Any, int]]" = OrderedDict()
+_response_cache_size = 0
+_response_cache_lock = threading.Lock()
+
 
 class GitHubDataSource(OnlineDocumentDatasource):
     
@@ -46,12 +70,51 @@ class GitHubDataSource(OnlineDocumentDatasource):
         elif response.status_code >= 400:
             raise ValueError(f"GitHub API error: {response.status_code} - {response.text}")
     
-    def _make_request(self, url: str, params: Optional[Dict] = None) -> Dict:
-        """Make API request and handle errors"""
+    def _make_request(self, url: str, params: Optional[Dict] = None, cache: bool = False) -> Dict:
+        """Make API request and handle errors
+
+        With `cache`, the response is kept by ETag and revalidated with a
+        conditional request next time.
+        """
+        global _response_cache_size
         headers = self._get_headers()
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        if not cache:
+            response = _session.get(url, headers=headers, params=params, timeout=30)
+            self._handle_rate_limit(response)
+            return response.json()
+
+        cache_key = (
+            hashlib.sha256(headers["Authorization"].encode()).hexdigest(),
+            url,
+            tuple(sorted((params or {}).items())),
+        )
+        with _response_cache_lock:
+            cached = _response_cache.get(cache_key)
+        if cached:
+            headers["If-None-Match"] = cached[0]
+        
+        response = _session.get(url, headers=headers, params=params, timeout=30)
+        if cached and response.status_code == 304:
+            with _response_cache_lock:
+                if cache_key in _response_cache:
+                    _response_cache.move_to_end(cache_key)
+            return cached[1]
+        
         self._handle_rate_limit(response)
-        return response.json()
+        data = response.json()
+        etag = response.headers.get("ETag")
+        size = len(response.content)
+        if etag and size <= RESPONSE_CACHE_MAX_BYTES:
+            with _response_cache_lock:
+                previous = _response_cache.pop(cache_key, None)
+                if previous:
+                    _response_cache_size -= previous[2]
+                _response_cache[cache_key] = (etag, data, size)
+                _response_cache_size += size
+                while _response_cache_size > RESPONSE_CACHE_MAX_BYTES:
+                    _, evicted = _response_cache.popitem(last=False)
+                    _response_cache_size -= evicted[2]
+        return data
     
     def _get_pages(self, datasource_parameters: dict[str, Any]) -> DatasourceGetPagesResponse:
         """Get GitHub page list (repositories, Issues, PRs)"""
@@ -60,7 +123,7 @@ class GitHubDataSource(OnlineDocumentDatasource):
             raise ValueError("Access token not found in credentials")
         
         # Get user information
-        user_info = self._make_request(f"{self.base_url}/user")
+        user_info = self._make_request(f"{self.base_url}/user", cache=True)
         workspace_name = f"{user_info.get('name', user_info.get('login'))}'s GitHub"
         workspace_icon = user_info.get('avatar_url', '')
         workspace_id = str(user_info.get('id', ''))
@@ -85,102 +148,113 @@ class GitHubDataSource(OnlineDocumentDatasource):
             raise ValueError(
                 f"Invalid 'type' parameter: {_type}. Allowed values are: all, owner, public, private, member.")
         
-        # Get user repositories
+        # Get user repositories, then discover their pages concurrently
         repos = self._get_repositories(visibility=visibility, affiliation=affiliation, _type=_type)
-        for repo in repos:
-            # Add repository as page
+        if repos:
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(repos))) as executor:
+                for repo_pages in executor.map(self._get_repository_pages, repos):
+                    pages.extend(repo_pages)
+        
+        online_document_info = OnlineDocumentInfo(
+            workspace_name=workspace_name,
+            workspace_icon=workspace_icon,
+            workspace_id=workspace_id,
+            pages=pages,
+            total=len(pages),
+        )
+        
+        return DatasourceGetPagesResponse(result=[online_document_info])
+    
+    def _get_repository_pages(self, repo: Dict) -> List[Dict]:
+        """Get the repository page with its README, recent Issues and PRs"""
+        pages = []
+        # Add repository as page
+        pages.append({
+            "page_id": f"repo:{repo['full_name']}",
+            "page_name": repo['name'],
+            "last_edited_time": repo.get("updated_at", ""),
+            "type": "repository",
+            "url": repo['html_url'],
+            "metadata": {
+                "description": repo.get("description", ""),
+                "language": repo.get("language", ""),
+                "stars": repo.get("stargazers_count", 0),
+                "updated_at": repo.get("updated_at", ""),
+                "private": repo.get("private", False)
+            }
+        })
+        
+        # Add README file (if exists)
+        try:
+            readme_info = self._make_request(f"{self.base_url}/repos/{repo['full_name']}/readme", cache=True)
             pages.append({
-                "page_id": f"repo:{repo['full_name']}",
-                "page_name": repo['name'],
+                "page_id": f"file:{repo['full_name']}:README.md",
+                "page_name": f"{repo['name']} - README",
                 "last_edited_time": repo.get("updated_at", ""),
-                "type": "repository",
-                "url": repo['html_url'],
+                "type": "file",
+                "url": readme_info.get('html_url', ''),
                 "metadata": {
-                    "description": repo.get("description", ""),
-                    "language": repo.get("language", ""),
-                    "stars": repo.get("stargazers_count", 0),
-                    "updated_at": repo.get("updated_at", ""),
-                    "private": repo.get("private", False)
+                    "repository": repo['full_name'],
+                    "file_path": "README.md",
+                    "size": readme_info.get('size', 0)
                 }
             })
-            
-            # Add README file (if exists)
-            try:
-                readme_info = self._make_request(f"{self.base_url}/repos/{repo['full_name']}/readme")
-                pages.append({
-                    "page_id": f"file:{repo['full_name']}:README.md",
-                    "page_name": f"{repo['name']} - README",
-                    "last_edited_time": repo.get("updated_at", ""),
-                    "type": "file",
-                    "url": readme_info.get('html_url', ''),
-                    "metadata": {
-                        "repository": repo['full_name'],
-                        "file_path": "README.md",
-                        "size": readme_info.get('size', 0)
-                    }
-                })
-            except ValueError:
-                pass  # README doesn't exist
-            
-            # Add popular Issues
-            try:
-                issues = self._make_request(
-                    f"{self.base_url}/repos/{repo['full_name']}/issues",
-                    params={"state": "all", "per_page": 5, "sort": "updated"}
-                )
-                for issue in issues:
-                    if "pull_request" not in issue:  # Exclude PRs
-                        pages.append({
-                            "page_id": f"issue:{repo['full_name']}:{issue['number']}",
-                            "page_name": f"Issue #{issue['number']}: {issue['title']}",
-                            "last_edited_time": issue.get('updated_at', ''),
-                            "type": "issue",
-                            "url": issue['html_url'],
-                            "metadata": {
-                                "repository": repo['full_name'],
-                                "issue_number": issue['number'],
-                                "state": issue['state'],
-                                "author": issue['user']['login'],
-                                "created_at": issue['created_at']
-                            }
-                        })
-            except ValueError:
-                pass  # Issues access failed
-            
-            # Add popular PRs
-            try:
-                prs = self._make_request(
-                    f"{self.base_url}/repos/{repo['full_name']}/pulls",
-                    params={"state": "all", "per_page": 5, "sort": "updated"}
-                )
-                for pr in prs:
+        except ValueError:
+            pass  # README doesn't exist
+        
+        # Add popular Issues
+        try:
+            issues = self._make_request(
+                f"{self.base_url}/repos/{repo['full_name']}/issues",
+                params={"state": "all", "per_page": 5, "sort": "updated"},
+                cache=True,
+            )
+            for issue in issues:
+                if "pull_request" not in issue:  # Exclude PRs
                     pages.append({
-                        "page_id": f"pr:{repo['full_name']}:{pr['number']}",
-                        "page_name": f"PR #{pr['number']}: {pr['title']}",
-                        "last_edited_time": pr.get('updated_at', ''),
-                        "type": "pull_request",
-                        "url": pr['html_url'],
+                        "page_id": f"issue:{repo['full_name']}:{issue['number']}",
+                        "page_name": f"Issue #{issue['number']}: {issue['title']}",
+                        "last_edited_time": issue.get('updated_at', ''),
+                        "type": "issue",
+                        "url": issue['html_url'],
                         "metadata": {
                             "repository": repo['full_name'],
-                            "pr_number": pr['number'],
-                            "state": pr['state'],
-                            "author": pr['user']['login'],
-                            "base_branch": pr['base']['ref'],
-                            "head_branch": pr['head']['ref']
+                            "issue_number": issue['number'],
+                            "state": issue['state'],
+                            "author": issue['user']['login'],
+                            "created_at": issue['created_at']
                         }
                     })
-            except ValueError:
-                pass  # PRs access failed
+        except ValueError:
+            pass  # Issues access failed
         
-        online_document_info = OnlineDocumentInfo(
-            workspace_name=workspace_name,
-            workspace_icon=workspace_icon,
-            workspace_id=workspace_id,
-            pages=pages,
-            total=len(pages),
-        )
+        # Add popular PRs
+        try:
+            prs = self._make_request(
+                f"{self.base_url}/repos/{repo['full_name']}/pulls",
+                params={"state": "all", "per_page": 5, "sort": "updated"},
+                cache=True,
+            )
+            for pr in prs:
+                pages.append({
+                    "page_id": f"pr:{repo['full_name']}:{pr['number']}",
+                    "page_name": f"PR #{pr['number']}: {pr['title']}",
+                    "last_edited_time": pr.get('updated_at', ''),
+                    "type": "pull_request",
+                    "url": pr['html_url'],
+                    "metadata": {
+                        "repository": repo['full_name'],
+                        "pr_number": pr['number'],
+                        "state": pr['state'],
+                        "author": pr['user']['login'],
+                        "base_branch": pr['base']['ref'],
+                        "head_branch": pr['head']['ref']
+                    }
+                })
+        except ValueError:
+            pass  # PRs access failed
         
-        return DatasourceGetPagesResponse(result=[online_document_info])
+        return pages
     
     def _get_repositories(self,
                           max_repos: int = 20,
@@ -195,7 +269,7 @@ class GitHubDataSource(OnlineDocumentDatasource):
             params["affiliation"] = affiliation
         if _type:
             params["type"] = _type
-        repos = self._make_request(f"{self.base_url}/user/repos", params)
+        repos = self._make_request(f"{self.base_url}/user/repos", params, cache=True)
         return repos
     
     def _get_content(self, page: GetOnlineDocumentPageContentRequest) -> Generator[DatasourceMessage, None, None]:
@@ -274,7 +348,7 @@ class GitHubDataSource(OnlineDocumentDatasource):
         else:
             download_url = file_info.get("download_url")
             if download_url:
-                response = requests.get(download_url, timeout=30)
+                response = _session.get(download_url, timeout=30)
                 response.raise_for_status()
                 content = response.text
             else:
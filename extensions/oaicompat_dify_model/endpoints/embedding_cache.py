@@ -0,0 +1,118 @@
+import base64
+import hashlib
+import json
+import logging
+import struct
+import time
+from typing import Any, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def pack_embedding(embedding: list[float]) -> str:
+    """
+    Pack an embedding as base64 of little-endian float32, the OpenAI `encoding_format: base64` layout.
+    """
+    return base64.b64encode(struct.pack(f"<{len(embedding)}f", *embedding)).decode("ascii")
+
+
+def unpack_embedding(packed: str) -> list[float]:
+    raw = base64.b64decode(packed)
+    return list(struct.unpack(f"<{len(raw) // 4}f", raw))
+
+
+class EmbeddingCache:
+    """
+    Content-hash embedding cache backed by plugin storage.
+
+    The cache is direct-mapped: the SHA-256 of the input text picks one of a fixed
+    number of slots per embedding model, and each slot key holds the digest, the
+    packed float32 vector and its expiry of the last text stored there. Storing a
+    text overwrites whatever its slot held, so there is no shared index to update
+    and storage stays within `max_bytes` no matter how requests interleave.
+
+    All vectors of a model have the same size, so the slot count is worked out from
+    the first stored entry and kept under a per-model key.
+    """
+
+    KEY_PREFIX = "oaicompat:embedding"
+    MAX_BYTES = 24 * 1024 * 1024
+
+    def __init__(self, storage: Any, model: Mapping[str, Any], ttl: int, max_bytes: int = MAX_BYTES):
+        self.storage = storage
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.namespace = hashlib.sha256(
+            json.dumps(
+                [model.get("provider"), model.get("model"), model.get("model_type")], sort_keys=True
+            ).encode("utf-8")
+        ).hexdigest()[:16]
+        self._slots: Optional[int] = None
+
+    def get_many(self, texts: list[str]) -> dict[str, list[float]]:
+        """Return the cached, unexpired embeddings among `texts`"""
+        slots = self._load_slots()
+        if not slots:
+            return {}
+        now = time.time()
+        found: dict[str, list[float]] = {}
+        for text in texts:
+            digest = self._digest(text)
+            try:
+                entry = json.loads(self.storage.get(self._slot_key(digest, slots)).decode("utf-8"))
+            except Exception:
+                # empty slot, unreadable entry or storage error: embed the text again
+                continue
+            if entry.get("digest") != digest or entry.get("expires_at", 0) <= now:
+                continue
+            found[text] = unpack_embedding(entry["embedding"])
+        return found
+
+    def set_many(self, embeddings: Mapping[str, list[float]]) -> None:
+        """Store the embeddings; failures are logged and skipped, caching is best effort"""
+        expires_at = time.time() + self.ttl
+        for text, embedding in embeddings.items():
+            digest = self._digest(text)
+            value = json.dumps(
+                {"digest": digest, "embedding": pack_embedding(embedding), "expires_at": expires_at}
+            ).encode("utf-8")
+            try:
+                slots = self._slots or self._load_slots() or self._save_slots(len(value))
+                self.storage.set(self._slot_key(digest, slots), value)
+            except Exception:
+                logger.warning("Failed to cache an embedding in namespace %s", self.namespace, exc_info=True)
+
+    def _load_slots(self) -> Optional[int]:
+        if self._slots is None:
+            try:
+                self._slots = int(self.storage.get(self._slots_key())) or None
+            except Exception:
+                return None
+        return self._slots
+
+    def _save_slots(self, entry_size: int) -> int:
+        # the same model always yields the same value, so concurrent writers agree
+        self._slots = max(1, self.max_bytes // entry_size)
+        self.storage.set(self._slots_key(), str(self._slots).encode("utf-8"))
+        return self._slots
+
+    def _digest(self, text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _slot_key(self, digest: str, slots: int) -> str:
+        return f"{self.KEY_PREFIX}:{self.namespace}:{int(digest, 16) % slots}"
+
+    def _slots_key(self) -> str:
+        return f"{self.KEY_PREFIX}_slots:{self.namespace}"
+
+
+def get_cache_ttl(settings: Mapping) -> Optional[int]:
+    """TTL in seconds from the `embedding_cache` setting, None when caching is disabled"""
+    value = settings.get("embedding_cache") or "disabled"
+    if value == "disabled":
+        return None
+    try:
+        ttl = int(value)
+    except (TypeError, ValueError):
+        return None
+    return ttl if ttl > 0 else None
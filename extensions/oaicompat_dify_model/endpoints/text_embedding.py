@@ -6,6 +6,7 @@ from dify_plugin.entities.model.text_embedding import (
     TextEmbeddingModelConfig,
 )
 from endpoints.auth import BaseAuth
+from endpoints.embedding_cache import EmbeddingCache, get_cache_ttl, pack_embedding
 
 
 class OaicompatDifyModelEndpoint(Endpoint, BaseAuth):
@@ -36,10 +37,30 @@ class OaicompatDifyModelEndpoint(Endpoint, BaseAuth):
         else:
             raise ValueError("Invalid input type")
 
-        text_embedding_response = self.session.model.text_embedding.invoke(
-            model_config=TextEmbeddingModelConfig(**model),
-            texts=texts,
-        )
+        encoding_format = data.get("encoding_format") or "float"
+        if encoding_format not in ("float", "base64"):
+            raise ValueError(f"Invalid encoding_format: {encoding_format}")
+
+        # Embed each distinct text once and scatter the results back
+        unique_texts = list(dict.fromkeys(texts))
+        cache_ttl = get_cache_ttl(settings)
+        cache = EmbeddingCache(self.session.storage, model, cache_ttl) if cache_ttl else None
+        embeddings: dict[str, list[float]] = cache.get_many(unique_texts) if cache else {}
+
+        missing = [text for text in unique_texts if text not in embeddings]
+        total_tokens = 0
+        model_name = model.get("model", "")
+        if missing:
+            text_embedding_response = self.session.model.text_embedding.invoke(
+                model_config=TextEmbeddingModelConfig(**model),
+                texts=missing,
+            )
+            fresh = dict(zip(missing, text_embedding_response.embeddings))
+            embeddings.update(fresh)
+            total_tokens = text_embedding_response.usage.total_tokens
+            model_name = text_embedding_response.model
+            if cache:
+                cache.set_many(fresh)
 
         return Response(
             json.dumps(
@@ -48,16 +69,20 @@ class OaicompatDifyModelEndpoint(Endpoint, BaseAuth):
                     "data": [
                         {
                             "object": "embedding",
-                            "embedding": embedding,
+                            "embedding": (
+                                pack_embedding(embeddings[text])
+                                if encoding_format == "base64"
+                                else embeddings[text]
+                            ),
                             "index": index,
                         }
-                        for index, embedding in enumerate(text_embedding_response.embeddings)
+                        for index, text in enumerate(texts)
                     ],
                     "usage": {
-                        "prompt_tokens": text_embedding_response.usage.total_tokens,
-                        "total_tokens": text_embedding_response.usage.total_tokens,
+                        "prompt_tokens": total_tokens,
+                        "total_tokens": total_tokens,
                     },
-                    "model": text_embedding_response.model,
+                    "model": model_name,
                 }
             ),
             status=200,
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class ConversationMemory:
+    """
+    Maps the message prefix of an OpenAI chat transcript to the Dify conversation
+    that already holds it, so that only the new tail has to be sent to the app.
+
+    After every answered turn, the fingerprint of (messages + answer) is stored with
+    the Dify conversation_id. The next request from the same chat starts with exactly
+    that prefix; any edit or regeneration changes the fingerprint and is a miss.
+
+    Plugin storage has no expiry, so every prefix key is also registered in one of
+    MAX_CONVERSATIONS slots chosen by its fingerprint. Taking a slot evicts the prefix
+    it held before, which bounds the keys an app keeps for abandoned chats.
+    """
+
+    KEY_PREFIX = "oaicompat:conversation"
+    MAX_CONVERSATIONS = 4096
+    OUTCOMES = ("hits", "misses", "new")
+
+    def __init__(self, storage: Any, app_id: str):
+        self.storage = storage
+        self.app_id = app_id
+
+    def fingerprint(self, messages: list[dict[str, Any]]) -> str:
+        normalized = [[message.get("role"), message.get("content")] for message in messages]
+        digest = hashlib.sha256(
+            json.dumps([self.app_id, normalized], ensure_ascii=False, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        return f"{self.KEY_PREFIX}:{self.app_id}:{digest}"
+
+    def lookup(self, messages: list[dict[str, Any]]) -> tuple[str, list[dict[str, Any]], str]:
+        """
+        Find the conversation for everything up to the last assistant message
+
+        returns:
+            - conversation_id: str, empty when the prefix is unknown
+            - tail: list of messages after the prefix, or all messages on a miss
+            - prefix_key: str, storage key of the matched prefix, empty on a miss
+        """
+        last_assistant = -1
+        for index in range(len(messages) - 1, -1, -1):
+            if messages[index].get("role") == "assistant":
+                last_assistant = index
+                break
+
+        if last_assistant < 0:
+            self._record("new")
+            return "", messages, ""
+
+        prefix_key = self.fingerprint(messages[: last_assistant + 1])
+        if self.storage.exist(prefix_key):
+            conversation_id = self.storage.get(prefix_key).decode("utf-8")
+            if conversation_id:
+                self._record("hits")
+                return conversation_id, messages[last_assistant + 1 :], prefix_key
+
+        self._record("misses")
+        return "", messages, ""
+
+    def remember(
+        self, messages: list[dict[str, Any]], answer: str, conversation_id: str, prefix_key: str = ""
+    ) -> None:
+        """Store the transcript including the answer, replacing the consumed prefix"""
+        if not conversation_id:
+            return
+        key = self.fingerprint([*messages, {"role": "assistant", "content": answer}])
+        self.storage.set(key, conversation_id.encode("utf-8"))
+        self._register(key)
+        if prefix_key and prefix_key != key:
+            # the Dify conversation has moved on; reusing the old prefix would mix branches
+            self.storage.delete(prefix_key)
+
+    def stats(self) -> dict[str, int]:
+        """Approximate counts; concurrent requests may lose an increment"""
+        stats = {}
+        for outcome in self.OUTCOMES:
+            key = self._stats_key(outcome)
+            try:
+                stats[outcome] = int(self.storage.get(key)) if self.storage.exist(key) else 0
+            except (ValueError, UnicodeDecodeError):
+                stats[outcome] = 0
+        return stats
+
+    def _register(self, key: str) -> None:
+        """Put the prefix key in its slot, deleting the prefix the slot held before"""
+        digest = key.rsplit(":", 1)[-1]
+        slot_key = f"{self.KEY_PREFIX}_slot:{self.app_id}:{int(digest, 16) % self.MAX_CONVERSATIONS}"
+        if self.storage.exist(slot_key):
+            evicted = self.storage.get(slot_key).decode("utf-8")
+            if evicted != key and self.storage.exist(evicted):
+                self.storage.delete(evicted)
+        self.storage.set(slot_key, key.encode("utf-8"))
+
+    def _record(self, outcome: str) -> None:
+        # one key per outcome keeps requests with different outcomes from
+        # overwriting each other; the counts are statistics, never fail a request for them
+        key = self._stats_key(outcome)
+        try:
+            count = int(self.storage.get(key)) if self.storage.exist(key) else 0
+            self.storage.set(key, str(count + 1).encode("utf-8"))
+        except Exception:
+            logger.warning("Failed to record conversation memory %s for app %s", outcome, self.app_id, exc_info=True)
+
+    def _stats_key(self, outcome: str) -> str:
+        return f"{self.KEY_PREFIX}_stats:{self.app_id}:{outcome}"
@@ -0,0 +1,28 @@
+import json
+from typing import Mapping
+from werkzeug import Request, Response
+from dify_plugin import Endpoint
+from endpoints.auth import BaseAuth
+from endpoints.conversation_memory import ConversationMemory
+
+class MemoryStats(Endpoint, BaseAuth):
+    def _invoke(self, r: Request, values: Mapping, settings: Mapping) -> Response:
+        """
+        Returns the hit/miss statistics of the conversation memory mode.
+        """
+        if not self.verify(r, settings):
+            return Response(
+                json.dumps({"message": "Unauthorized"}),
+                status=401,
+                content_type="application/json",
+            )
+        app_id: str = settings.get("app_id", {}).get("app_id", "")
+        if not app_id:
+            raise ValueError("App ID is required")
+
+        stats = ConversationMemory(self.session.storage, app_id).stats()
+        return Response(
+            json.dumps({"memory_mode": settings.get("memory_mode", "last_user_message"), **stats}),
+            status=200,
+            content_type="application/json",
+        )
@@ -3,6 +3,7 @@ from typing import Any, Generator, Mapping
 from werkzeug import Request, Response
 from dify_plugin import Endpoint
 from endpoints.auth import BaseAuth
+from endpoints.conversation_memory import ConversationMemory
 
 class OpenaiCompatible(Endpoint, BaseAuth):
     def _invoke(self, r: Request, values: Mapping, settings: Mapping) -> Response:
@@ -26,10 +27,20 @@ class OpenaiCompatible(Endpoint, BaseAuth):
             data = r.get_json()
             messages = data.get("messages", [])
             stream = data.get("stream", False)
-            conversation_id, query = self._get_memory(memory_mode, messages)
+            memory: ConversationMemory | None = None
+            prefix_key = ""
+            if memory_mode == "conversation":
+                memory = ConversationMemory(self.session.storage, app_id)
+                conversation_id, query, prefix_key = self._get_conversation_memory(memory, messages)
+            else:
+                conversation_id, query = self._get_memory(memory_mode, messages)
             inputs = data.get("inputs", {})
             inputs["messages"] = json.dumps(messages)
 
+            response_headers: dict[str, str] = {}
+            if memory:
+                response_headers["X-Memory-Cache"] = "hit" if conversation_id else "miss"
+
             if stream:
                 def generator():
                     response = self.session.app.chat.invoke(
@@ -39,6 +50,8 @@ class OpenaiCompatible(Endpoint, BaseAuth):
                         response_mode="streaming",
                         conversation_id=conversation_id,
                     )
+                    if memory:
+                        response = self._remember_stream(memory, messages, prefix_key, response)
                     return self._handle_chat_stream_message(app_id, response)
 
                 return Response(
@@ -48,6 +61,7 @@ class OpenaiCompatible(Endpoint, BaseAuth):
                     headers={
                         "Cache-Control": "no-cache",
                         "Transfer-Encoding": "chunked",
+                        **response_headers,
                     },
                 )
             else:
@@ -58,10 +72,15 @@ class OpenaiCompatible(Endpoint, BaseAuth):
                     response_mode="blocking",
                     conversation_id=conversation_id,
                 )
+                if memory:
+                    memory.remember(
+                        messages, response.get("answer", ""), response.get("conversation_id", ""), prefix_key
+                    )
                 return Response(
                     self._handle_chat_blocking_message(app_id, response),
                     status=200,
                     content_type="text/html",
+                    headers=response_headers,
                 )
         except ValueError as e:
             return Response(f"Error: {e}", status=400, content_type="text/plain")
@@ -127,9 +146,55 @@ class OpenaiCompatible(Endpoint, BaseAuth):
             return "", self.messages_to_text(messages)
         else:
             raise ValueError(
-                f"Invalid memory mode: {memory_mode}, only support last_user_message for now"
+                f"Invalid memory mode: {memory_mode}, only support last_user_message, all_messages or conversation"
             )
 
+    def _get_conversation_memory(
+        self, memory: ConversationMemory, messages: list[dict[str, Any]]
+    ) -> tuple[str, str, str]:
+        """
+        Resume the Dify conversation holding the message prefix, or replay all messages
+
+        returns:
+            - conversation_id: str
+            - query: str
+            - prefix_key: str
+        """
+        conversation_id, tail, prefix_key = memory.lookup(messages)
+        if not conversation_id:
+            return "", self.messages_to_text(messages), ""
+
+        if len(tail) == 1 and tail[0].get("role") == "user":
+            query = tail[0].get("content")
+        else:
+            query = self.messages_to_text(tail)
+        if not query:
+            raise ValueError("No user message found")
+
+        return conversation_id, query, prefix_key
+
+    def _remember_stream(
+        self,
+        memory: ConversationMemory,
+        messages: list[dict[str, Any]],
+        prefix_key: str,
+        generator: Generator[dict[str, Any], None, None],
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Pass the chat stream through, storing the conversation once the message ends
+        """
+        answer: list[str] = []
+        conversation_id = ""
+        for data in generator:
+            conversation_id = data.get("conversation_id") or conversation_id
+            if data.get("event") == "agent_message" or data.get("event") == "message":
+                answer.append(data.get("answer", ""))
+            elif data.get("event") == "message_file":
+                answer.append(f"[{data.get('id', 'none')}]({data.get('url', '')})")
+            elif data.get("event") == "message_end":
+                memory.remember(messages, "".join(answer), conversation_id, prefix_key)
+            yield data
+
     def _handle_chat_stream_message(
         self, app_id: str, generator: Generator[dict[str, Any], None, None]
     ) -> Generator[str, None, None]:
@@ -1,4 +1,8 @@
+import hashlib
 import json
+import logging
+import threading
+import time
 import traceback
 from typing import Mapping
 from werkzeug import Request, Response
@@ -7,8 +11,39 @@ from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from markdown_to_mrkdwn import SlackMarkdownConverter
 
+logger = logging.getLogger(__name__)
+
 converter = SlackMarkdownConverter()
 
+# Minimum interval between chat.update calls while streaming an answer
+STREAM_UPDATE_INTERVAL = 1.0
+
+# Seen event ids are kept in this many storage slots, one event id per slot
+SEEN_EVENT_SLOTS = 1024
+SEEN_EVENT_KEY_PREFIX = "slack_bot:seen_event"
+
+_clients: dict[str, WebClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(token: str) -> WebClient:
+    """Reuse one WebClient (and its connection pool) per bot token"""
+    with _clients_lock:
+        client = _clients.get(token)
+        if client is None:
+            client = _clients[token] = WebClient(token=token)
+        return client
+
+
+def build_blocks(text: str) -> list[dict]:
+    return [{
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": text
+        }
+    }]
+
 
 class SlackEndpoint(Endpoint):
     def _invoke(self, r: Request, values: Mapping, settings: Mapping) -> Response:
@@ -29,6 +64,8 @@ class SlackEndpoint(Endpoint):
             )
         
         if (data.get("type") == "event_callback"):
+            if self._is_duplicate_event(data.get("event_id")):
+                return Response(status=200, response="ok")
             event = data.get("event")
             if (event.get("type") == "app_mention"):
                 message = event.get("text", "")
@@ -36,7 +73,11 @@ class SlackEndpoint(Endpoint):
                     message = message.split("> ", 1)[1] if "> " in message else message
                     channel = event.get("channel", "")
                     token = settings.get("bot_token")
-                    client = WebClient(token=token)
+                    client = get_client(token)
+                    if settings.get("stream_reply"):
+                        thread_ts = event.get("thread_ts") or event.get("ts")
+                        self._reply_in_thread(client, settings["app"]["app_id"], message, channel, thread_ts)
+                        return Response(status=200, response="ok")
                     try: 
                         response = self.session.app.chat.invoke(
                             app_id=settings["app"]["app_id"],
@@ -49,13 +90,7 @@ class SlackEndpoint(Endpoint):
                             formatted_answer = converter.convert(answer)
                             
                             # Create proper mrkdwn block structure
-                            blocks = [{
-                                "type": "section",
-                                "text": {
-                                    "type": "mrkdwn",
-                                    "text": formatted_answer
-                                }
-                            }]
+                            blocks = build_blocks(formatted_answer)
                             result = client.chat_postMessage(
                                 channel=channel,
                                 text=formatted_answer,  # Fallback text
@@ -82,3 +117,64 @@ class SlackEndpoint(Endpoint):
                 return Response(status=200, response="ok")
         else:
             return Response(status=200, response="ok")
+
+    def _is_duplicate_event(self, event_id: str | None) -> bool:
+        """
+        Remember recent event ids in plugin storage, so Slack retries of an event are ignored.
+
+        Each event id gets its own slot key, so concurrent events do not overwrite each
+        other's records; a slot only forgets its event when a later event hashes to it.
+        """
+        if not event_id:
+            return False
+        slot = int(hashlib.sha256(event_id.encode("utf-8")).hexdigest(), 16) % SEEN_EVENT_SLOTS
+        key = f"{SEEN_EVENT_KEY_PREFIX}:{slot}"
+        storage = self.session.storage
+        if storage.exist(key) and storage.get(key).decode("utf-8", "replace") == event_id:
+            return True
+        storage.set(key, event_id.encode("utf-8"))
+        return False
+
+    def _reply_in_thread(self, client: WebClient, app_id: str, message: str, channel: str, thread_ts: str) -> None:
+        """
+        Post a placeholder in the thread, then stream the app answer into it with throttled chat.update calls.
+
+        A failed intermediate update (e.g. rate limited) is skipped; only the final update can fail the reply.
+        """
+        try:
+            placeholder = client.chat_postMessage(channel=channel, thread_ts=thread_ts, text="_Thinking..._", mrkdwn=True)
+            ts = placeholder["ts"]
+        except SlackApiError:
+            logger.exception("Failed to post the placeholder reply")
+            return
+
+        answer = ""
+        last_update = time.monotonic()
+        try:
+            response = self.session.app.chat.invoke(
+                app_id=app_id,
+                query=message,
+                inputs={},
+                response_mode="streaming",
+            )
+            for data in response:
+                if data.get("event") in ("message", "agent_message"):
+                    answer += data.get("answer", "")
+                    if answer and time.monotonic() - last_update >= STREAM_UPDATE_INTERVAL:
+                        try:
+                            client.chat_update(channel=channel, ts=ts, text=converter.convert(answer))
+                        except SlackApiError as e:
+                            logger.warning("Skipped a streaming update: %s", e)
+                        last_update = time.monotonic()
+            formatted_answer = converter.convert(answer)
+            client.chat_update(channel=channel, ts=ts, text=formatted_answer, blocks=build_blocks(formatted_answer))
+        except Exception as e:
+            logger.exception("Failed to stream the reply")
+            try:
+                client.chat_update(
+                    channel=channel,
+                    ts=ts,
+                    text="Sorry, I'm having trouble processing your request. Please try again later. " + str(e),
+                )
+            except SlackApiError:
+                pass
@@ -1,6 +1,8 @@
 import base64
+import hashlib
 import logging
 import json
+import time
 from typing import Mapping
 
 import requests
@@ -16,6 +18,16 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 logger.addHandler(plugin_logger_handler)
 
+# WeCom rejects stream content longer than this
+MAX_ANSWER_LENGTH = 5000
+# Throttle for partial answers written to storage while the app is streaming
+PARTIAL_WRITE_INTERVAL = 0.3  # seconds
+MAX_PARTIAL_WRITES = 200
+# Finished answers are kept for late refresh polls and duplicate detection in this
+# many storage slots, one message key per slot
+FINISHED_MESSAGE_SLOTS = 100
+FINISHED_MESSAGE_KEY_PREFIX = "wecom_msg_finished"
+
 
 def _decrypt_wecom_file(encrypted_bytes: bytes, encoding_aes_key: str) -> bytes:
     """Decrypt WeCom downloaded file with the callback EncodingAESKey (AES-256-CBC, PKCS7 padding, IV = first 16 bytes of key)."""
@@ -182,6 +194,68 @@ class WeComMessageEndpoint(Endpoint):
         )
         return json.dumps(encrypted, ensure_ascii=False)
 
+    def _write_stream_state(self, key: str, content: str, finish: bool) -> None:
+        state = {"content": content, "finish": finish}
+        self.session.storage.set(key, json.dumps(state, ensure_ascii=False).encode("utf-8"))
+
+    def _read_stream_state(self, key: str) -> tuple[str, bool]:
+        """Return (content so far, finished) for a message key."""
+        raw = self.session.storage.get(key).decode("utf-8")
+        try:
+            state = json.loads(raw)
+        except ValueError:
+            state = None
+        if isinstance(state, dict) and "finish" in state:
+            return str(state.get("content") or ""), bool(state.get("finish"))
+        # plain values written by earlier versions: a sentinel or the final answer
+        if raw == "processing":
+            return "", False
+        return raw, True
+
+    def _remember_finished(self, key: str) -> None:
+        """
+        Record a finished answer in its storage slot and delete the answer it evicts, so storage stays bounded.
+
+        Each message key hashes to its own slot key, so concurrent messages do not overwrite
+        each other's records the way a shared list would.
+        """
+        slot = int(hashlib.sha256(key.encode("utf-8")).hexdigest(), 16) % FINISHED_MESSAGE_SLOTS
+        slot_key = f"{FINISHED_MESSAGE_KEY_PREFIX}:{slot}"
+        storage = self.session.storage
+        if storage.exist(slot_key):
+            evicted = storage.get(slot_key).decode("utf-8", "replace")
+            if evicted != key and storage.exist(evicted):
+                storage.delete(evicted)
+        storage.set(slot_key, key.encode("utf-8"))
+
+    def _stream_answer(self, key: str, app_id: str, query: str, inputs: dict) -> str:
+        """
+        Invoke the app in streaming mode, writing throttled partial answers to storage
+        so that WeCom refresh polls can show the growing text.
+        """
+        response = self.session.app.chat.invoke(
+            app_id=app_id,
+            query=query,
+            inputs=inputs,
+            response_mode="streaming",
+        )
+        answer = ""
+        writes = 0
+        last_write = time.monotonic()
+        for chunk in response:
+            if chunk.get("event") not in ("message", "agent_message"):
+                continue
+            answer += chunk.get("answer") or ""
+            if (
+                writes < MAX_PARTIAL_WRITES
+                and len(answer) <= MAX_ANSWER_LENGTH
+                and time.monotonic() - last_write >= PARTIAL_WRITE_INTERVAL
+            ):
+                self._write_stream_state(key, answer, finish=False)
+                writes += 1
+                last_write = time.monotonic()
+        return answer
+
     def _invoke(self, r: Request, values: Mapping, settings: Mapping) -> Response:
         token = settings.get("token")
         encoding_key = settings.get("encoding_aes_key")
@@ -240,15 +314,11 @@ class WeComMessageEndpoint(Endpoint):
         
             stream_key = f"wecom_msg_{stream_id}"
             if self.session.storage.exist(stream_key):
-                result = self.session.storage.get(stream_key).decode("utf-8")
-                if result == "processing":
-                    logger.debug(f"Stream still processing: {stream_id}")
-                    content = ""
-                    finish = False
+                content, finish = self._read_stream_state(stream_key)
+                if not finish:
+                    logger.debug(f"Stream still processing: {stream_id} content_len={len(content)}")
                 else:
                     logger.debug(f"Stream answer ready: {stream_id}")
-                    content = result
-                    finish = True
                     self.session.storage.delete(stream_key)
         
                 res = self._build_wecom_res(
@@ -262,7 +332,7 @@ class WeComMessageEndpoint(Endpoint):
                 return Response(status=200, response=res, mimetype="application/json")
             else:
                 logger.debug(f"Processing new stream: {stream_id}")
-                self.session.storage.set(stream_key, b"processing")
+                self._write_stream_state(stream_key, "", finish=False)
                 res = self._build_wecom_res(
                     message_id=stream_id,
                     content="",
@@ -291,7 +361,7 @@ class WeComMessageEndpoint(Endpoint):
             return Response(status=200, response=res, mimetype="application/json")
         else:
             logger.debug(f"Processing new message: {message_id}")
-            self.session.storage.set(f"wecom_msg_{message_id}", b"processing")
+            self._write_stream_state(f"wecom_msg_{message_id}", "", finish=False)
 
         # ── Upload images to Dify and build the files parameter ──
         # SDK session.file.upload() stores files in the tool_files table (not upload_files)
@@ -340,16 +410,15 @@ class WeComMessageEndpoint(Endpoint):
                 f"query={effective_query!r} "
                 f"inputs={json.dumps(dify_inputs, ensure_ascii=False, default=str)} "
                 f"files={json.dumps(dify_files, ensure_ascii=False)} "
-                f"response_mode='blocking'"
+                f"response_mode='streaming'"
             )
 
-            response = self.session.app.chat.invoke(
+            answer = self._stream_answer(
+                key=f"wecom_msg_{message_id}",
                 app_id=app_id,
                 query=effective_query,
                 inputs=dify_inputs,
-                response_mode="blocking",
             )
-            answer = response.get("answer") or json.dumps(response, ensure_ascii=False)
 
             # ── Log: Dify response ──────────────────────────
             logger.debug(
@@ -361,10 +430,11 @@ class WeComMessageEndpoint(Endpoint):
             logger.debug(f"[Dify] invoke failed: {exc}")
             answer = f"Errors: {exc}"
 
-        if len(answer) > 5000:
-            answer = answer[:5000] + "..."
+        if len(answer) > MAX_ANSWER_LENGTH:
+            answer = answer[:MAX_ANSWER_LENGTH] + "..."
 
-        self.session.storage.set(f"wecom_msg_{message_id}", answer.encode("utf-8"))
+        self._write_stream_state(f"wecom_msg_{message_id}", answer, finish=True)
+        self._remember_finished(f"wecom_msg_{message_id}")
         res = self._build_wecom_res(
             message_id=message_id,
             content=answer,
@@ -0,0 +1,138 @@
+"""Fetching of image URLs in prompts, with a shared byte-bounded cache.
+
+Images given by URL have to be inlined as base64 for the Messages API. They
+are downloaded before the messages are converted: every URL of a request is
+fetched concurrently over one pooled session, with timeouts. The media type
+is sniffed from the magic bytes instead of decoding the image, with PIL only
+as a fallback for formats the API rejects anyway.
+
+Encoded results are cached by URL in an LRU bounded by the size of the base64
+payloads, together with the response's ETag or Last-Modified validator.
+Images that stay in the history are revalidated with a conditional GET on the
+next turn, so an unchanged image costs a 304 instead of a full download and
+re-encode. Responses without a validator are not cached.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+MAX_CONCURRENT_FETCHES = 8
+FETCH_TIMEOUT = (5, 30)
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENT_FETCHES))
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENT_FETCHES))
+
+
+@dataclass(frozen=True)
+class FetchedImage:
+    mime_type: str
+    base64_data: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class ImageCache:
+    """LRU of fetched images by URL, bounded by the total base64 size"""
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, FetchedImage] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[FetchedImage]:
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def put(self, url: str, image: FetchedImage) -> None:
+        size = len(image.base64_data)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(url, None)
+            if previous is not None:
+                self._size -= len(previous.base64_data)
+            self._entries[url] = image
+            self._size += size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.base64_data)
+
+
+_cache = ImageCache()
+
+
+def sniff_image_mime(content: bytes) -> str:
+    """Media type from the leading bytes, falling back to PIL for other formats"""
+    if content.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if content.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if content.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    if content.startswith(b"RIFF") and content[8:12] == b"WEBP":
+        return "image/webp"
+
+    from PIL import Image
+
+    with Image.open(io.BytesIO(content)) as img:
+        img_format = img.format or "jpeg"  # Default to jpeg if format is None
+        return f"image/{img_format.lower()}"
+
+
+def fetch_image(url: str) -> FetchedImage:
+    """Download an image, revalidating a cached copy when there is one"""
+    cached = _cache.get(url)
+    headers = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    response = _session.get(url, headers=headers, timeout=FETCH_TIMEOUT)
+    if cached is not None and response.status_code == 304:
+        return cached
+    response.raise_for_status()
+
+    image = FetchedImage(
+        mime_type=sniff_image_mime(response.content),
+        base64_data=base64.b64encode(response.content).decode("utf-8"),
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+    if image.etag or image.last_modified:
+        _cache.put(url, image)
+    return image
+
+
+def prefetch_images(urls: Iterable[str]) -> dict[str, Union[FetchedImage, Exception]]:
+    """Fetch all URLs concurrently; failures are returned in place of the image"""
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return {}
+
+    def _fetch(url: str) -> Union[FetchedImage, Exception]:
+        try:
+            return fetch_image(url)
+        except Exception as ex:
+            return ex
+
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_FETCHES, len(unique_urls))) as executor:
+        return dict(zip(unique_urls, executor.map(_fetch, unique_urls)))
@@ -0,0 +1,156 @@
+"""Prompt token counting for ``AnthropicLargeLanguageModel.get_num_tokens``.
+
+Dify asks for the prompt size before every request, and an agent resends its
+whole history on each step. Counting through ``messages.count_tokens`` is a
+network round-trip, so this module:
+
+* keeps one ``Anthropic`` client per API key and base URL, so counting reuses
+  pooled HTTP connections instead of building a new client each time;
+* memoizes counts by a hash of the full ``count_tokens`` request (model,
+  system, messages, tools, thinking), so an unchanged prompt is counted once;
+* offers ``estimate_tokens``, an offline estimator for latency-sensitive
+  setups that opt in through the ``token_count_mode`` credential.
+
+The estimator charges ASCII text at ``ASCII_CHARS_PER_TOKEN`` characters per
+token and every other character as a full token, images at the largest size
+Anthropic resizes them to, and PDFs at the top of the per-page range Anthropic
+documents, then adds ``ESTIMATE_MARGIN``. The estimate has not been
+calibrated against ``count_tokens`` and is not an upper bound: scripts the
+tokenizer splits into several tokens per character, such as some CJK text,
+can be undercounted.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+import math
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from anthropic import Anthropic
+
+_MAX_CLIENTS = 32
+_MAX_CACHED_COUNTS = 1024
+
+ASCII_CHARS_PER_TOKEN = 3.0
+ESTIMATE_MARGIN = 0.1
+# tokens per message for role markers and block delimiters
+_MESSAGE_OVERHEAD = 4
+_REQUEST_OVERHEAD = 8
+# system prompt Anthropic adds when tools are offered
+_TOOL_USE_OVERHEAD = 350
+# images are resized to about 1.15 megapixels, roughly width * height / 750 tokens
+_IMAGE_TOKENS = 1600
+_PDF_PAGE_TOKENS = 3000
+_PDF_PAGE_PATTERN = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+
+_clients: OrderedDict[tuple, Anthropic] = OrderedDict()
+_clients_lock = threading.Lock()
+
+_counts: OrderedDict[str, int] = OrderedDict()
+_counts_lock = threading.Lock()
+
+
+def get_client(credentials_kwargs: Mapping[str, Any]) -> Anthropic:
+    """Shared client for the given credential kwargs"""
+    key = (
+        hashlib.sha256(credentials_kwargs["api_key"].encode("utf-8")).hexdigest(),
+        credentials_kwargs.get("base_url"),
+        tuple(sorted((credentials_kwargs.get("default_headers") or {}).items())),
+    )
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is not None:
+            _clients.move_to_end(key)
+            return client
+        client = Anthropic(**credentials_kwargs)
+        _clients[key] = client
+        while len(_clients) > _MAX_CLIENTS:
+            _clients.popitem(last=False)
+        return client
+
+
+def request_key(count_tokens_args: Mapping[str, Any]) -> str:
+    payload = json.dumps(count_tokens_args, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cached_count(count_tokens_args: Mapping[str, Any], count: Callable[[], int]) -> int:
+    """Return the memoized count for the request, calling `count` on a miss"""
+    key = request_key(count_tokens_args)
+    with _counts_lock:
+        tokens = _counts.get(key)
+        if tokens is not None:
+            _counts.move_to_end(key)
+            return tokens
+
+    tokens = count()
+
+    with _counts_lock:
+        _counts[key] = tokens
+        while len(_counts) > _MAX_CACHED_COUNTS:
+            _counts.popitem(last=False)
+    return tokens
+
+
+def _text_tokens(text: str) -> float:
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return ascii_chars / ASCII_CHARS_PER_TOKEN + (len(text) - ascii_chars)
+
+
+def _pdf_tokens(source: Mapping[str, Any]) -> float:
+    if source.get("type") != "base64":
+        return _PDF_PAGE_TOKENS
+    try:
+        pdf = base64.b64decode(source.get("data", ""))
+    except (binascii.Error, ValueError):
+        return _PDF_PAGE_TOKENS
+    pages = len(_PDF_PAGE_PATTERN.findall(pdf))
+    return max(pages, 1) * _PDF_PAGE_TOKENS
+
+
+def _content_tokens(content: Any) -> float:
+    if isinstance(content, str):
+        return _text_tokens(content)
+    if isinstance(content, list):
+        return sum(_content_tokens(block) for block in content)
+    if not isinstance(content, Mapping):
+        return _text_tokens(str(content))
+
+    block_type = content.get("type")
+    if block_type == "text":
+        return _text_tokens(content.get("text", ""))
+    if block_type == "image":
+        return _IMAGE_TOKENS
+    if block_type == "document":
+        return _pdf_tokens(content.get("source", {}))
+    if block_type == "thinking":
+        return _text_tokens(content.get("thinking", ""))
+    if block_type == "tool_result":
+        return _content_tokens(content.get("content", ""))
+    if block_type == "tool_use":
+        return _text_tokens(content.get("name", "")) + _text_tokens(
+            json.dumps(content.get("input", {}), ensure_ascii=False)
+        )
+    block = {key: value for key, value in content.items() if key != "cache_control"}
+    return _text_tokens(json.dumps(block, ensure_ascii=False))
+
+
+def estimate_tokens(count_tokens_args: Mapping[str, Any]) -> int:
+    """Offline approximation of the tokens `messages.count_tokens` would report"""
+    tokens: float = _REQUEST_OVERHEAD
+    system = count_tokens_args.get("system")
+    if system:
+        tokens += _content_tokens(system)
+    for message in count_tokens_args.get("messages", []):
+        tokens += _MESSAGE_OVERHEAD + _content_tokens(message.get("content", ""))
+    tools = count_tokens_args.get("tools")
+    if tools:
+        tokens += _TOOL_USE_OVERHEAD + _text_tokens(json.dumps(tools, ensure_ascii=False))
+    return math.ceil(tokens * (1 + ESTIMATE_MARGIN))
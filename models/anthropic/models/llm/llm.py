@@ -1,5 +1,3 @@
-import base64
-import io
 import json
 import re
 import copy
@@ -8,7 +6,6 @@ from typing import Any, Mapping, Optional, Union, cast
 import logging
 
 import anthropic
-import requests
 from anthropic import Anthropic, Stream
 from anthropic.types import (
     ContentBlockDeltaEvent,
@@ -58,7 +55,9 @@ from dify_plugin.errors.model import (
 )
 from dify_plugin.interfaces.model.large_language_model import LargeLanguageModel
 from httpx import Timeout
-from PIL import Image
+
+from ._image_fetch import FetchedImage, fetch_image, prefetch_images
+from ._token_counting import cached_count, estimate_tokens, get_client
 
 ANTHROPIC_BLOCK_MODE_PROMPT = 'You should always follow the instructions and output a valid {{block}} object.\nThe structure of the {{block}} object you can found in the instructions, use {"answer": "$your_answer"} as the default structure\nif you are not sure about the structure.\n\n<instructions>\n{{instructions}}\n</instructions>\n'
 
@@ -225,6 +224,10 @@ class AnthropicLargeLanguageModel(LargeLanguageModel):
         self._tool_results_cache_enabled = False
         self._message_flow_cache_threshold: int = 0
         self._prompt_cache_ttl: Optional[str] = None
+        # Image URLs of the prompt being converted, fetched up front
+        self._prefetched_images: dict[str, Union[FetchedImage, Exception]] = {}
+        # False while converting a prompt that is only estimated, so URLs are not downloaded
+        self._fetch_image_urls = True
 
     def _uses_adaptive_thinking(self, model: str) -> bool:
         model_id = (model or "").lower()
@@ -864,10 +867,10 @@ class AnthropicLargeLanguageModel(LargeLanguageModel):
         :param tools: tools for tool calling
         :return:
         """
-        credentials_kwargs = self._to_credential_kwargs(credentials)
-        client = Anthropic(**credentials_kwargs)
-        
-        (system, prompt_message_dicts) = self._convert_prompt_messages(prompt_messages)
+        estimate = credentials.get("token_count_mode") == "estimate"
+        (system, prompt_message_dicts) = self._convert_prompt_messages(
+            prompt_messages, fetch_image_urls=not estimate
+        )
         
         if not prompt_message_dicts:
             prompt_message_dicts.append({"role": "user", "content": "Hello"})
@@ -904,8 +907,16 @@ class AnthropicLargeLanguageModel(LargeLanguageModel):
                 self._transform_tool_prompt(tool) for tool in tools
             ]
             
-        response = client.messages.count_tokens(**count_tokens_args) # type: ignore[bad-argument-type]
-        return response.input_tokens
+        if estimate:
+            return estimate_tokens(count_tokens_args)
+
+        client = get_client(self._to_credential_kwargs(credentials))
+
+        def count() -> int:
+            response = client.messages.count_tokens(**count_tokens_args) # type: ignore[bad-argument-type]
+            return response.input_tokens
+
+        return cached_count(count_tokens_args, count)
 
     def validate_credentials(self, model: str, credentials: Mapping) -> None:
         """
@@ -1284,12 +1295,14 @@ class AnthropicLargeLanguageModel(LargeLanguageModel):
         return credentials_kwargs
 
     def _convert_prompt_messages(
-        self, prompt_messages: Sequence[PromptMessage]
+        self, prompt_messages: Sequence[PromptMessage], fetch_image_urls: bool = True
     ) -> tuple[Union[str, list[dict]], list[dict]]:
         """Convert prompt messages to dict list and system.
         
         This method processes different message types using a dispatch pattern,
         making the code more maintainable and following Fluent Python principles.
+        Without `fetch_image_urls`, image URLs are kept as URL sources instead of
+        being downloaded, which is enough for estimating the prompt size.
         """
         caching_handler = PromptCachingHandler(
             prompt_messages, 
@@ -1297,6 +1310,17 @@ class AnthropicLargeLanguageModel(LargeLanguageModel):
             cache_control=self._cache_control(),
         )
         system = caching_handler.get_system_prompt()
+
+        # Download every image URL of the prompt at once instead of one by one
+        self._fetch_image_urls = fetch_image_urls
+        self._prefetched_images = prefetch_images(
+            content.data
+            for message in prompt_messages
+            if isinstance(message, UserPromptMessage) and isinstance(message.content, list)
+            for content in message.content
+            if content.type == PromptMessageContentType.IMAGE
+            and not content.data.startswith("data:")
+        ) if fetch_image_urls else {}
         
         # Find the last user message index
         last_user_msg_index = -1
@@ -1404,6 +1428,12 @@ class AnthropicLargeLanguageModel(LargeLanguageModel):
     
     def _create_image_content(self, content: ImagePromptMessageContent) -> dict:
         """Create image content dict with base64 encoding."""
+        if not self._fetch_image_urls and not content.data.startswith("data:"):
+            result: dict[str, Any] = {"type": "image", "source": {"type": "url", "url": content.data}}
+            if self._image_cache_enabled:
+                result["cache_control"] = self._cache_control()
+            return result
+
         mime_type, base64_data = self._process_image_data(content.data)
         
         # Validate mime type
@@ -1436,17 +1466,14 @@ class AnthropicLargeLanguageModel(LargeLanguageModel):
             mime_type = header.replace("data:", "")
             return mime_type, encoded
         
-        # Fetch from URL
+        # Fetch from URL, normally already done by the prefetch in _convert_prompt_messages
         try:
-            response = requests.get(data)
-            response.raise_for_status()
-            
-            with Image.open(io.BytesIO(response.content)) as img:
-                img_format = img.format or "jpeg"  # Default to jpeg if format is None
-                mime_type = f"image/{img_format.lower()}"
-            
-            base64_data = base64.b64encode(response.content).decode("utf-8")
-            return mime_type, base64_data
+            image = self._prefetched_images.get(data)
+            if image is None:
+                image = fetch_image(data)
+            if isinstance(image, Exception):
+                raise image
+            return image.mime_type, image.base64_data
             
         except Exception as ex:
             raise ValueError(f"Failed to fetch image from {data}: {ex}") from ex
@@ -0,0 +1,91 @@
+import base64
+
+import pytest
+
+from models.llm import _image_fetch
+from models.llm._image_fetch import (
+    FetchedImage,
+    ImageCache,
+    fetch_image,
+    prefetch_images,
+    sniff_image_mime,
+)
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+
+class _Response:
+    def __init__(self, status_code=200, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(_image_fetch, "_cache", ImageCache())
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (b"\xff\xd8\xff\xe0" + b"\x00" * 16, "image/jpeg"),
+        (PNG, "image/png"),
+        (b"GIF89a" + b"\x00" * 16, "image/gif"),
+        (b"RIFF\x00\x00\x00\x00WEBPVP8 ", "image/webp"),
+    ],
+)
+def test_sniff_image_mime_reads_magic_bytes(content, expected):
+    assert sniff_image_mime(content) == expected
+
+
+def test_unchanged_image_is_revalidated_not_downloaded_again(monkeypatch):
+    calls = []
+
+    def get(url, headers, timeout):
+        calls.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return _Response(304)
+        return _Response(200, PNG, {"ETag": '"v1"'})
+
+    monkeypatch.setattr(_image_fetch._session, "get", get)
+
+    first = fetch_image("https://example.com/a.png")
+    second = fetch_image("https://example.com/a.png")
+
+    assert first == second
+    assert first.mime_type == "image/png"
+    assert first.base64_data == base64.b64encode(PNG).decode()
+    assert calls == [{}, {"If-None-Match": '"v1"'}]
+
+
+def test_prefetch_fetches_each_url_once_and_keeps_errors(monkeypatch):
+    calls = []
+
+    def get(url, headers, timeout):
+        calls.append(url)
+        if url.endswith("missing.png"):
+            return _Response(404)
+        return _Response(200, PNG)
+
+    monkeypatch.setattr(_image_fetch._session, "get", get)
+
+    urls = ["https://example.com/a.png", "https://example.com/missing.png", "https://example.com/a.png"]
+    results = prefetch_images(urls)
+
+    assert sorted(calls) == sorted(set(urls))
+    assert isinstance(results["https://example.com/a.png"], FetchedImage)
+    assert isinstance(results["https://example.com/missing.png"], Exception)
+
+
+def test_cache_evicts_oldest_entries_past_byte_limit():
+    cache = ImageCache(max_bytes=10)
+    cache.put("a", FetchedImage("image/png", "x" * 6, etag="a"))
+    cache.put("b", FetchedImage("image/png", "x" * 6, etag="b"))
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
@@ -2,6 +2,7 @@ from unittest.mock import patch
 
 import pytest
 from dify_plugin.entities.model.message import (
+    ImagePromptMessageContent,
     SystemPromptMessage,
     TextPromptMessageContent,
     UserPromptMessage,
@@ -126,3 +127,31 @@ def test_model_classification(model: str, expected: tuple[bool, ...]) -> None:
         llm._supports_task_budget(model),
         llm._enforces_disabled_thinking_effort_cap(model),
     ) == expected
+
+
+def test_estimate_mode_does_not_fetch_image_urls() -> None:
+    llm = AnthropicLargeLanguageModel()
+    messages = [
+        UserPromptMessage(
+            content=[
+                ImagePromptMessageContent(
+                    format="png", url="https://example.com/cat.png", mime_type="image/png"
+                ),
+                TextPromptMessageContent(data="What is this?"),
+            ]
+        )
+    ]
+
+    with (
+        patch("models.llm.llm.prefetch_images") as prefetch,
+        patch("models.llm.llm.fetch_image") as fetch,
+        patch("models.llm.llm.get_client") as get_client,
+    ):
+        tokens = llm.get_num_tokens(
+            "claude-sonnet-4-6", {"token_count_mode": "estimate"}, messages
+        )
+
+    assert tokens > 0
+    prefetch.assert_not_called()
+    fetch.assert_not_called()
+    get_client.assert_not_called()
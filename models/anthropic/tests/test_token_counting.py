@@ -0,0 +1,72 @@
+import base64
+
+from models.llm import _token_counting
+from models.llm._token_counting import cached_count, estimate_tokens, get_client
+
+
+def test_cached_count_calls_api_once_per_request() -> None:
+    calls = []
+
+    def count() -> int:
+        calls.append(1)
+        return 42
+
+    args = {"model": "claude-sonnet-4-5", "messages": [{"role": "user", "content": "cached"}]}
+    assert cached_count(args, count) == 42
+    assert cached_count(dict(args), count) == 42
+    assert len(calls) == 1
+
+    changed = {**args, "system": "a new system prompt"}
+    assert cached_count(changed, count) == 42
+    assert len(calls) == 2
+
+
+def test_get_client_reuses_client_per_credentials(monkeypatch) -> None:
+    created = []
+
+    class _Anthropic:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+
+    monkeypatch.setattr(_token_counting, "Anthropic", _Anthropic)
+    monkeypatch.setattr(_token_counting, "_clients", type(_token_counting._clients)())
+
+    first = get_client({"api_key": "key-a", "max_retries": 1})
+    assert get_client({"api_key": "key-a", "max_retries": 1}) is first
+    assert get_client({"api_key": "key-b", "max_retries": 1}) is not first
+    assert get_client({"api_key": "key-a", "base_url": "https://proxy.example"}) is not first
+    assert len(created) == 3
+
+
+def test_estimate_scales_with_text_length() -> None:
+    text = "The quick brown fox jumps over the lazy dog. " * 100
+    estimate = estimate_tokens({"messages": [{"role": "user", "content": text}]})
+    # about 10 tokens per sentence with the Claude tokenizer
+    assert estimate >= 1000
+    assert estimate <= len(text) // 2
+
+
+def test_estimate_counts_non_ascii_characters_as_tokens() -> None:
+    estimate = estimate_tokens({"messages": [{"role": "user", "content": "你好世界" * 50}]})
+    assert estimate >= 200
+
+
+def test_estimate_charges_images_documents_and_tools() -> None:
+    pdf = base64.b64encode(b"%PDF-1.7 /Type /Pages /Type /Page /Type /Page").decode()
+    base = estimate_tokens({"messages": [{"role": "user", "content": "hi"}]})
+    with_blocks = estimate_tokens(
+        {
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": "hi"},
+                        {"type": "image", "source": {"type": "base64", "data": "AAAA"}},
+                        {"type": "document", "source": {"type": "base64", "data": pdf}},
+                    ],
+                }
+            ],
+            "tools": [{"name": "lookup", "description": "Look it up", "input_schema": {}}],
+        }
+    )
+    assert with_blocks - base >= 1600 + 2 * 3000 + 350
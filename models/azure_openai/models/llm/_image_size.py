@@ -0,0 +1,155 @@
+"""Read the pixel size of base64 images without decoding them.
+
+Counting prompt tokens for vision models only needs the width and height of
+each image, but ``get_num_tokens`` runs before every request and sees the
+whole history, so fully decoding multi-megabyte screenshots and opening them
+with PIL dominated the pre-flight time. ``probe_image_size`` decodes just the
+leading bytes of the base64 payload and parses the PNG, GIF, WebP or JPEG
+header. The decoded prefix is grown geometrically for JPEGs whose frame
+header sits behind large EXIF/ICC segments, and anything that cannot be
+parsed falls back to PIL. Results are memoized per payload, so images that
+reappear in the history on every turn are probed only once.
+
+Sizes match ``PIL.Image.open(...).size``: the stored frame size, without
+applying EXIF orientation.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import io
+import struct
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+_INITIAL_PROBE_CHARS = 1024
+_PROBE_GROWTH = 4
+_CACHE_SIZE = 512
+
+# JPEG markers that carry the frame size: SOF0-SOF15 except DHT (C4), JPG (C8) and DAC (CC)
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+# standalone markers without a length field
+_JPEG_STANDALONE_MARKERS = {0x01, *range(0xD0, 0xD8)}
+
+_cache: OrderedDict[tuple[int, int], tuple[int, int]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class _NeedMoreData(Exception):
+    pass
+
+
+def _png_size(data: bytes) -> tuple[int, int]:
+    if len(data) < 24:
+        raise _NeedMoreData
+    return struct.unpack(">II", data[16:24])
+
+
+def _gif_size(data: bytes) -> tuple[int, int]:
+    if len(data) < 10:
+        raise _NeedMoreData
+    return struct.unpack("<HH", data[6:10])
+
+
+def _webp_size(data: bytes) -> Optional[tuple[int, int]]:
+    if len(data) < 30:
+        raise _NeedMoreData
+    chunk = data[12:16]
+    if chunk == b"VP8 ":
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        b0, b1, b2, b3 = data[21:25]
+        width = 1 + (((b1 & 0x3F) << 8) | b0)
+        height = 1 + (((b3 & 0x0F) << 10) | (b2 << 2) | ((b1 & 0xC0) >> 6))
+        return width, height
+    if chunk == b"VP8X":
+        width = 1 + int.from_bytes(data[24:27], "little")
+        height = 1 + int.from_bytes(data[27:30], "little")
+        return width, height
+    return None
+
+
+def _jpeg_size(data: bytes) -> Optional[tuple[int, int]]:
+    offset = 2
+    while True:
+        # skip fill bytes before the marker
+        while offset < len(data) and data[offset] == 0xFF:
+            offset += 1
+        if offset >= len(data):
+            raise _NeedMoreData
+        if data[offset - 1] != 0xFF:
+            return None
+        marker = data[offset]
+        offset += 1
+        if marker in _JPEG_STANDALONE_MARKERS:
+            continue
+        if marker == 0xD9 or marker == 0xDA:
+            # end of image or start of scan before any frame header
+            return None
+        if offset + 2 > len(data):
+            raise _NeedMoreData
+        (length,) = struct.unpack(">H", data[offset : offset + 2])
+        if marker in _JPEG_SOF_MARKERS:
+            if offset + 7 > len(data):
+                raise _NeedMoreData
+            height, width = struct.unpack(">HH", data[offset + 3 : offset + 7])
+            return width, height
+        offset += length
+
+
+def _parse_header(data: bytes) -> Optional[tuple[int, int]]:
+    """Size from the leading bytes, None if the format is not recognized."""
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return _png_size(data)
+    if data.startswith((b"GIF87a", b"GIF89a")):
+        return _gif_size(data)
+    if data.startswith(b"RIFF") and data[8:12] == b"WEBP":
+        return _webp_size(data)
+    if data.startswith(b"\xff\xd8"):
+        return _jpeg_size(data)
+    if len(data) < 12:
+        raise _NeedMoreData
+    return None
+
+
+def _probe(base64_str: str) -> Optional[tuple[int, int]]:
+    probe_chars = _INITIAL_PROBE_CHARS
+    while True:
+        # keep the prefix a whole number of base64 quanta
+        prefix = base64_str[: probe_chars - probe_chars % 4]
+        try:
+            return _parse_header(base64.b64decode(prefix))
+        except _NeedMoreData:
+            if probe_chars >= len(base64_str):
+                return None
+            probe_chars *= _PROBE_GROWTH
+        except (binascii.Error, ValueError, struct.error):
+            return None
+
+
+def _decode_size(base64_str: str) -> tuple[int, int]:
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(base64.b64decode(base64_str)))
+    return image.size
+
+
+def probe_image_size(base64_str: str) -> tuple[int, int]:
+    """(width, height) of a base64-encoded image."""
+    key = (len(base64_str), hash(base64_str))
+    with _cache_lock:
+        size = _cache.get(key)
+        if size is not None:
+            _cache.move_to_end(key)
+            return size
+
+    size = _probe(base64_str) or _decode_size(base64_str)
+
+    with _cache_lock:
+        _cache[key] = size
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return size
@@ -0,0 +1,78 @@
+"""Per-process memoization of tiktoken counts for prompt token estimation.
+
+``get_num_tokens`` is called before every request with the full conversation
+and tool list, so without caching an agent that runs for dozens of turns
+re-tokenizes its entire history on each step. Counts are cached per message
+and per tool: the caller groups the strings that make up one message (or one
+tool schema) and ``count_token_groups`` looks the group up by encoding name
+and a digest of its contents. Only groups that miss are encoded, so in a
+running conversation only the new turn is tokenized.
+
+Encodings are cached as well; ``tiktoken.encoding_for_model`` resolves the
+model name on every call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+_CACHE_SIZE = 8192
+
+_cache: OrderedDict[bytes, int] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=32)
+def get_encoding(model: str) -> tiktoken.Encoding:
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        logger.warning("Warning: model not found. Using cl100k_base encoding.")
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _group_key(encoding: tiktoken.Encoding, texts: Sequence[str]) -> bytes:
+    digest = hashlib.blake2b(encoding.name.encode("utf-8"), digest_size=16)
+    for text in texts:
+        data = text.encode("utf-8")
+        # length prefix keeps ["ab", "c"] and ["a", "bc"] apart
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.digest()
+
+
+def count_token_groups(
+    encoding: tiktoken.Encoding, groups: Sequence[Sequence[str]]
+) -> list[int]:
+    """Total token count of the strings in each group, in order."""
+    keys = [_group_key(encoding, texts) for texts in groups]
+    counts: list[int | None] = [None] * len(groups)
+    with _cache_lock:
+        for index, key in enumerate(keys):
+            count = _cache.get(key)
+            if count is not None:
+                _cache.move_to_end(key)
+                counts[index] = count
+
+    missing = [index for index, count in enumerate(counts) if count is None]
+    if missing:
+        texts = [text for index in missing for text in groups[index]]
+        # plain encode: encode_batch's thread pool is slower under the plugin's gevent patching
+        lengths = iter(len(encoding.encode(text)) for text in texts)
+        with _cache_lock:
+            for index in missing:
+                count = sum(next(lengths) for _ in groups[index])
+                counts[index] = count
+                _cache[keys[index]] = count
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+    return counts
@@ -1,6 +1,4 @@
-import base64
 import copy
-import io
 import json
 import logging
 import math
@@ -10,7 +8,6 @@ from typing import Any, Optional, Union, cast
 from urllib.parse import urlparse
 
 import tiktoken
-from PIL import Image
 from dify_plugin.entities.model import AIModelEntity, ModelPropertyKey
 from dify_plugin.entities.model.llm import (
     LLMMode,
@@ -47,7 +44,9 @@ from openai.types.responses import ResponseStreamEvent, Response
 
 from ..common import _CommonAzureOpenAI
 from ..constants import LLM_BASE_MODELS, uses_responses_api
+from ._image_size import probe_image_size
 from ._metadata import apply_dify_metadata_if_enabled
+from ._token_cache import count_token_groups, get_encoding
 
 logger = logging.getLogger(__name__)
 
@@ -1433,10 +1432,7 @@ class AzureOpenAILargeLanguageModel(_CommonAzureOpenAI, LargeLanguageModel):
         text: str,
         tools: Optional[list[PromptMessageTool]] = None,
     ) -> int:
-        try:
-            encoding = tiktoken.encoding_for_model(credentials["base_model_name"])
-        except KeyError:
-            encoding = tiktoken.get_encoding("cl100k_base")
+        encoding = get_encoding(credentials["base_model_name"])
         num_tokens = len(encoding.encode(text))
         if tools:
             num_tokens += self._num_tokens_for_tools(encoding, tools)
@@ -1455,12 +1451,7 @@ class AzureOpenAILargeLanguageModel(_CommonAzureOpenAI, LargeLanguageModel):
         model = credentials["base_model_name"]
         if model.startswith(("o1", "o3", "o4", "gpt-4.1", "gpt-4.5", "gpt-5")):
             model = "gpt-4o"
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-        except KeyError:
-            logger.warning("Warning: model not found. Using cl100k_base encoding.")
-            encoding_name = "cl100k_base"
-            encoding = tiktoken.get_encoding(encoding_name)
+        encoding = get_encoding(model)
         if model.startswith("gpt-35-turbo-0301"):
             tokens_per_message = 4
             tokens_per_name = -1
@@ -1479,8 +1470,12 @@ class AzureOpenAILargeLanguageModel(_CommonAzureOpenAI, LargeLanguageModel):
         num_tokens = 0
         messages_dict = [self._convert_prompt_message_to_dict(m) for m in messages]
         image_details: list[dict] = []
+        # strings to encode, grouped per message so counts are cached per message
+        message_texts: list[list[str]] = []
         for message in messages_dict:
             num_tokens += tokens_per_message
+            texts: list[str] = []
+            message_texts.append(texts)
             for key, value in message.items():
                 if isinstance(value, list):
                     text = ""
@@ -1495,18 +1490,19 @@ class AzureOpenAILargeLanguageModel(_CommonAzureOpenAI, LargeLanguageModel):
                     for tool_call in value:
                         assert isinstance(tool_call, dict)
                         for t_key, t_value in tool_call.items():
-                            num_tokens += len(encoding.encode(t_key))
+                            texts.append(t_key)
                             if t_key == "function":
                                 for f_key, f_value in t_value.items():
-                                    num_tokens += len(encoding.encode(f_key))
-                                    num_tokens += len(encoding.encode(f_value))
+                                    texts.append(f_key)
+                                    texts.append(f_value)
                             else:
-                                num_tokens += len(encoding.encode(t_key))
-                                num_tokens += len(encoding.encode(t_value))
+                                texts.append(t_key)
+                                texts.append(t_value)
                 else:
-                    num_tokens += len(encoding.encode(str(value)))
+                    texts.append(str(value))
                 if key == "name":
                     num_tokens += tokens_per_name
+        num_tokens += sum(count_token_groups(encoding, message_texts))
         num_tokens += 3
         if tools:
             num_tokens += self._num_tokens_for_tools(encoding, tools)
@@ -1522,39 +1518,44 @@ class AzureOpenAILargeLanguageModel(_CommonAzureOpenAI, LargeLanguageModel):
         encoding: tiktoken.Encoding, tools: list[PromptMessageTool]
     ) -> int:
         num_tokens = 0
+        # strings to encode, grouped per tool so counts are cached per tool schema
+        tool_texts: list[list[str]] = []
         for tool in tools:
-            num_tokens += len(encoding.encode("type"))
-            num_tokens += len(encoding.encode("function"))
-            num_tokens += len(encoding.encode("name"))
-            num_tokens += len(encoding.encode(tool.name))
-            num_tokens += len(encoding.encode("description"))
-            num_tokens += len(encoding.encode(tool.description))
+            texts: list[str] = []
+            tool_texts.append(texts)
+            texts.append("type")
+            texts.append("function")
+            texts.append("name")
+            texts.append(tool.name)
+            texts.append("description")
+            texts.append(tool.description)
             parameters = tool.parameters
-            num_tokens += len(encoding.encode("parameters"))
+            texts.append("parameters")
             if "title" in parameters:
-                num_tokens += len(encoding.encode("title"))
-                num_tokens += len(encoding.encode(parameters["title"]))
+                texts.append("title")
+                texts.append(parameters["title"])
             if "type" in parameters:
-                num_tokens += len(encoding.encode("type"))
-                num_tokens += len(encoding.encode(parameters["type"]))
+                texts.append("type")
+                texts.append(parameters["type"])
             if "properties" in parameters:
-                num_tokens += len(encoding.encode("properties"))
+                texts.append("properties")
                 for key, value in parameters["properties"].items():
-                    num_tokens += len(encoding.encode(key))
+                    texts.append(key)
                     for field_key, field_value in value.items():
-                        num_tokens += len(encoding.encode(field_key))
+                        texts.append(field_key)
                         if field_key == "enum":
                             for enum_field in field_value:
                                 num_tokens += 3
-                                num_tokens += len(encoding.encode(enum_field))
+                                texts.append(enum_field)
                         else:
-                            num_tokens += len(encoding.encode(field_key))
-                            num_tokens += len(encoding.encode(str(field_value)))
+                            texts.append(field_key)
+                            texts.append(str(field_value))
             if "required" in parameters:
-                num_tokens += len(encoding.encode("required"))
+                texts.append("required")
                 for required_field in parameters["required"]:
                     num_tokens += 3
-                    num_tokens += len(encoding.encode(required_field))
+                    texts.append(required_field)
+        num_tokens += sum(count_token_groups(encoding, tool_texts))
         return num_tokens
 
     @staticmethod
@@ -1590,10 +1591,7 @@ class AzureOpenAILargeLanguageModel(_CommonAzureOpenAI, LargeLanguageModel):
 
         for image_detail in image_details:
             base64_str = image_detail["url"].split(",")[1]
-
-            image_data = base64.b64decode(base64_str)
-            image = Image.open(io.BytesIO(image_data))
-            width, height = image.size
+            width, height = probe_image_size(base64_str)
 
             if base_model_name.startswith(("gpt-4.1-mini", "gpt-4.1-nano", "o4-mini")):
                 width_patches = self._get_image_patches(width)
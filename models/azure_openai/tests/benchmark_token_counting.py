@@ -0,0 +1,136 @@
+"""Benchmark prompt token counting over replayed agent conversations.
+
+Replays conversations turn by turn, counting the whole history on every step
+as get_num_tokens does. The cached counter is compared with the same counter
+run with its caches cleared before every call, which re-encodes everything
+like the implementation before caching. Both must return the same counts.
+
+    uv run python tests/benchmark_token_counting.py --turns 60 --conversations 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PLUGIN_ROOT))
+
+from dify_plugin.entities.model.message import (  # noqa: E402
+    AssistantPromptMessage,
+    PromptMessage,
+    PromptMessageTool,
+    SystemPromptMessage,
+    ToolPromptMessage,
+    UserPromptMessage,
+)
+
+from models.llm import _token_cache  # noqa: E402
+from models.llm.llm import AzureOpenAILargeLanguageModel  # noqa: E402
+
+WORDS = ["token", "agent", "search", "result", "weather", "city", "the", "a", "of", "data"]
+
+
+def count_uncached(llm: AzureOpenAILargeLanguageModel, credentials: dict, messages, tools) -> int:
+    """Count with empty caches, as every call did before counts were cached."""
+    _token_cache._cache.clear()
+    _token_cache.get_encoding.cache_clear()
+    return llm._num_tokens_from_messages(credentials, messages, tools)
+
+
+def make_tools(count: int) -> list[PromptMessageTool]:
+    return [
+        PromptMessageTool(
+            name=f"tool_{i}",
+            description=f"Tool number {i} that looks things up",
+            parameters={
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "What to look up"},
+                    "mode": {"type": "string", "enum": ["fast", "accurate"]},
+                },
+                "required": ["query"],
+            },
+        )
+        for i in range(count)
+    ]
+
+
+def sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def conversation(turns: int, seed: int) -> list[PromptMessage]:
+    """An agent transcript: user asks, assistant calls a tool, tool answers, assistant replies."""
+    rng = random.Random(seed)
+    messages: list[PromptMessage] = [SystemPromptMessage(content=sentence(rng, 400))]
+    for turn in range(turns):
+        call_id = f"call_{seed}_{turn}"
+        messages.append(UserPromptMessage(content=sentence(rng, 60)))
+        messages.append(
+            AssistantPromptMessage(
+                content="",
+                tool_calls=[
+                    AssistantPromptMessage.ToolCall(
+                        id=call_id,
+                        type="function",
+                        function=AssistantPromptMessage.ToolCall.ToolCallFunction(
+                            name="tool_0", arguments='{"query": "%s"}' % sentence(rng, 5)
+                        ),
+                    )
+                ],
+            )
+        )
+        messages.append(ToolPromptMessage(content=sentence(rng, 800), tool_call_id=call_id))
+        messages.append(AssistantPromptMessage(content=sentence(rng, 120)))
+    return messages
+
+
+def replay(llm, messages, tools, count) -> tuple[float, list[int]]:
+    """Count the history after every turn (4 messages per turn)."""
+    counts = []
+    started = time.perf_counter()
+    for end in range(5, len(messages) + 1, 4):
+        counts.append(count(messages[:end], tools))
+    return time.perf_counter() - started, counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=60, help="turns per conversation")
+    parser.add_argument("--conversations", type=int, default=5, help="conversations to replay")
+    parser.add_argument("--tools", type=int, default=20, help="tools offered on every call")
+    parser.add_argument("--model", default="gpt-4o", help="base model name, which selects the encoding")
+    args = parser.parse_args()
+
+    credentials = {"base_model_name": args.model}
+
+    llm = object.__new__(AzureOpenAILargeLanguageModel)
+    tools = make_tools(args.tools)
+    cached_total = uncached_total = 0.0
+    for seed in range(args.conversations):
+        messages = conversation(args.turns, seed)
+        current, counts = replay(
+            llm,
+            messages,
+            tools,
+            lambda m, t: llm._num_tokens_from_messages(credentials, m, t),
+        )
+        entries = len(_token_cache._cache)
+        uncached, expected = replay(llm, messages, tools, lambda m, t: count_uncached(llm, credentials, m, t))
+        assert counts == expected, f"conversation {seed}: cached counts differ from uncached ones"
+        cached_total += current
+        uncached_total += uncached
+        print(
+            f"conversation {seed}  {len(messages):4d} messages  final {counts[-1]:7d} tokens"
+            f"  cached {current:6.2f}s  uncached {uncached:6.2f}s"
+        )
+    print(
+        f"total  cached {cached_total:6.2f}s  uncached {uncached_total:6.2f}s"
+        f"  cache entries {entries}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import base64
+import struct
+
+import pytest
+
+from models.llm import _image_size
+from models.llm._image_size import probe_image_size
+
+
+def b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+def png(width: int, height: int) -> bytes:
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + struct.pack(">I", 13)
+        + b"IHDR"
+        + struct.pack(">II", width, height)
+        + b"\x08\x06\x00\x00\x00"
+        + b"\x00" * 100_000
+    )
+
+
+def jpeg(width: int, height: int, exif_size: int = 0) -> bytes:
+    segments = b""
+    remaining = exif_size
+    while remaining > 0:
+        chunk = min(remaining, 65_000)
+        segments += b"\xff\xe1" + struct.pack(">H", chunk + 2) + b"\x00" * chunk
+        remaining -= chunk
+    sof = b"\xff\xc0" + struct.pack(">HBHHB", 17, 8, height, width, 3) + b"\x00" * 9
+    return b"\xff\xd8" + segments + sof + b"\xff\xda" + b"\x00" * 1000 + b"\xff\xd9"
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (png(1920, 1080), (1920, 1080)),
+        (b"GIF89a" + struct.pack("<HH", 320, 200) + b"\x00" * 50, (320, 200)),
+        (
+            b"RIFF\x00\x00\x00\x00WEBPVP8 \x00\x00\x00\x00\x00\x00\x00\x9d\x01\x2a"
+            + struct.pack("<HH", 640, 480)
+            + b"\x00" * 50,
+            (640, 480),
+        ),
+        (
+            b"RIFF\x00\x00\x00\x00WEBPVP8X\x0a\x00\x00\x00\x00\x00\x00\x00"
+            + (4000 - 1).to_bytes(3, "little")
+            + (3000 - 1).to_bytes(3, "little")
+            + b"\x00" * 50,
+            (4000, 3000),
+        ),
+        (jpeg(800, 600), (800, 600)),
+        # frame header behind large EXIF segments needs a longer prefix
+        (jpeg(4032, 3024, exif_size=200_000), (4032, 3024)),
+    ],
+)
+def test_probe_reads_header_dimensions(data, expected):
+    assert probe_image_size(b64(data)) == expected
+
+
+def test_probe_is_memoized(monkeypatch):
+    payload = b64(png(10, 20) + b"memo")
+    assert probe_image_size(payload) == (10, 20)
+
+    def fail(*args):
+        raise AssertionError("payload probed twice")
+
+    monkeypatch.setattr(_image_size, "_probe", fail)
+    assert probe_image_size(payload) == (10, 20)
@@ -0,0 +1,46 @@
+import tiktoken
+
+from models.llm import _token_cache
+from models.llm._token_cache import count_token_groups, get_encoding
+
+
+def test_group_counts_match_plain_encoding():
+    encoding = tiktoken.get_encoding("cl100k_base")
+    groups = [["role", "user", "content", "Hello there"], [], ["What's the weather?"]]
+
+    assert count_token_groups(encoding, groups) == [
+        sum(len(encoding.encode(text)) for text in texts) for texts in groups
+    ]
+
+
+def test_only_missing_groups_are_encoded(monkeypatch):
+    encoding = tiktoken.get_encoding("cl100k_base")
+    history = [["role", "user", "content", f"turn {i} of a cached conversation"] for i in range(5)]
+    count_token_groups(encoding, history)
+
+    new_turn = ["role", "assistant", "content", "a brand new answer"]
+    expected = sum(len(encoding.encode(text)) for text in new_turn)
+
+    encoded = []
+    original = encoding.encode
+
+    def encode(text, *args, **kwargs):
+        encoded.append(text)
+        return original(text, *args, **kwargs)
+
+    monkeypatch.setattr(encoding, "encode", encode)
+    counts = count_token_groups(encoding, [*history, new_turn])
+
+    assert encoded == new_turn
+    assert counts[-1] == expected
+
+
+def test_groups_with_same_text_split_differently_do_not_collide():
+    encoding = tiktoken.get_encoding("cl100k_base")
+    assert _token_cache._group_key(encoding, ["ab", "c"]) != _token_cache._group_key(
+        encoding, ["a", "bc"]
+    )
+
+
+def test_unknown_model_falls_back_to_cl100k_base():
+    assert get_encoding("not-a-real-model").name == "cl100k_base"
@@ -1,11 +1,65 @@
+from collections import OrderedDict
 from collections.abc import Mapping
 
+import hashlib
 import os
+import threading
 import boto3
 from botocore.config import Config
 
 from dify_plugin.errors.model import InvokeBadRequestError
 
+# boto3 clients are thread-safe, so one client per configuration is shared by
+# every request in the process. Bounded so rotating credentials cannot grow it.
+_CLIENT_CACHE_MAX_SIZE = 32
+_client_cache: OrderedDict = OrderedDict()
+_client_cache_lock = threading.Lock()
+_client_cache_stats = {"hits": 0, "misses": 0}
+
+
+def credential_fingerprint(credentials: Mapping[str, str]) -> str:
+    """Hash the secret parts of the credentials so they can key a cache without being stored."""
+    digest = hashlib.sha256()
+    for key in ("auth_method", "aws_access_key_id", "aws_secret_access_key", "bedrock_api_key"):
+        digest.update(key.encode())
+        digest.update(b"\0")
+        digest.update(str(credentials.get(key) or "").encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get_client_cache_stats() -> dict[str, int]:
+    """Return hit/miss counters and the current size of the client cache."""
+    with _client_cache_lock:
+        return {**_client_cache_stats, "size": len(_client_cache)}
+
+
+def clear_client_cache() -> None:
+    with _client_cache_lock:
+        _client_cache.clear()
+        _client_cache_stats["hits"] = 0
+        _client_cache_stats["misses"] = 0
+
+
+def _get_or_create_client(cache_key: tuple, client_kwargs: dict):
+    with _client_cache_lock:
+        client = _client_cache.get(cache_key)
+        if client is not None:
+            _client_cache.move_to_end(cache_key)
+            _client_cache_stats["hits"] += 1
+            return client
+        _client_cache_stats["misses"] += 1
+
+    # Build outside the lock; a concurrent miss for the same key just builds a
+    # second client and the last one wins.
+    client = boto3.client(**client_kwargs)
+    with _client_cache_lock:
+        _client_cache[cache_key] = client
+        _client_cache.move_to_end(cache_key)
+        while len(_client_cache) > _CLIENT_CACHE_MAX_SIZE:
+            _client_cache.popitem(last=False)
+    return client
+
 
 def get_bedrock_client(service_name: str, credentials: Mapping[str, str]):
     region_name = credentials.get("aws_region")
@@ -76,5 +130,13 @@ def get_bedrock_client(service_name: str, credentials: Mapping[str, str]):
         session = boto3.Session()
         return session.client(**client_kwargs)
 
-    client = boto3.client(**client_kwargs)
-    return client
+    # API keys are read from AWS_BEARER_TOKEN_BEDROCK when the client is
+    # built, so a cached client keeps the key it was created with.
+    cache_key = (
+        service_name,
+        region_name,
+        client_kwargs.get("endpoint_url"),
+        bedrock_proxy_url,
+        credential_fingerprint(credentials),
+    )
+    return _get_or_create_client(cache_key, client_kwargs)
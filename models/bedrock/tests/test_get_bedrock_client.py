@@ -21,6 +21,13 @@ get_bedrock_client = importlib.util.module_from_spec(_spec)
 _spec.loader.exec_module(get_bedrock_client)
 
 
+@pytest.fixture(autouse=True)
+def _clear_client_cache():
+    get_bedrock_client.clear_client_cache()
+    yield
+    get_bedrock_client.clear_client_cache()
+
+
 _BASE_CREDENTIALS = {
     "aws_region": "us-east-1",
 }
@@ -225,3 +232,80 @@ class TestEndpointUrl:
         assert (
             mock_client.call_args.kwargs["endpoint_url"] == "https://vpce.example.com"
         )
+
+
+class TestClientCache:
+    _CREDENTIALS = {
+        **_BASE_CREDENTIALS,
+        "auth_method": "Access_Secret_Key",
+        "aws_access_key_id": "AKIA",
+        "aws_secret_access_key": "secret",
+    }
+
+    def test_same_configuration_reuses_client(self) -> None:
+        with patch.object(
+            get_bedrock_client.boto3, "client", side_effect=lambda **_: MagicMock()
+        ) as mock_client:
+            first = get_bedrock_client.get_bedrock_client("bedrock-runtime", self._CREDENTIALS)
+            second = get_bedrock_client.get_bedrock_client(
+                "bedrock-runtime", dict(self._CREDENTIALS)
+            )
+
+        assert first is second
+        mock_client.assert_called_once()
+        assert get_bedrock_client.get_client_cache_stats() == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+        }
+
+    @pytest.mark.parametrize(
+        ("service_name", "overrides"),
+        [
+            ("bedrock", {}),
+            ("bedrock-runtime", {"aws_region": "eu-west-1"}),
+            ("bedrock-runtime", {"aws_secret_access_key": "rotated"}),
+            ("bedrock-runtime", {"bedrock_proxy_url": "proxy.example.com:8080"}),
+            ("bedrock-runtime", {"bedrock_endpoint_url": "https://vpce.example.com"}),
+        ],
+    )
+    def test_different_configuration_builds_new_client(self, service_name, overrides) -> None:
+        with patch.object(
+            get_bedrock_client.boto3, "client", side_effect=lambda **_: MagicMock()
+        ) as mock_client:
+            first = get_bedrock_client.get_bedrock_client("bedrock-runtime", self._CREDENTIALS)
+            second = get_bedrock_client.get_bedrock_client(
+                service_name, {**self._CREDENTIALS, **overrides}
+            )
+
+        assert first is not second
+        assert mock_client.call_count == 2
+
+    def test_cache_is_bounded(self) -> None:
+        with patch.object(
+            get_bedrock_client.boto3, "client", side_effect=lambda **_: MagicMock()
+        ):
+            for index in range(get_bedrock_client._CLIENT_CACHE_MAX_SIZE + 5):
+                get_bedrock_client.get_bedrock_client(
+                    "bedrock-runtime", {**self._CREDENTIALS, "aws_access_key_id": f"AKIA{index}"}
+                )
+
+        stats = get_bedrock_client.get_client_cache_stats()
+        assert stats["size"] == get_bedrock_client._CLIENT_CACHE_MAX_SIZE
+
+    def test_iam_role_clients_are_not_cached(self) -> None:
+        creds = {**_BASE_CREDENTIALS, "auth_method": "IAM_Role"}
+        with patch.object(get_bedrock_client.boto3, "Session") as mock_session_cls:
+            get_bedrock_client.get_bedrock_client("bedrock-runtime", creds)
+            get_bedrock_client.get_bedrock_client("bedrock-runtime", creds)
+
+        assert mock_session_cls.call_count == 2
+        assert get_bedrock_client.get_client_cache_stats()["size"] == 0
+
+    def test_fingerprint_does_not_contain_secrets(self) -> None:
+        fingerprint = get_bedrock_client.credential_fingerprint(self._CREDENTIALS)
+
+        assert "secret" not in fingerprint
+        assert fingerprint != get_bedrock_client.credential_fingerprint(
+            {**self._CREDENTIALS, "aws_secret_access_key": "other"}
+        )
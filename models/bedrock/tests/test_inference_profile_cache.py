@@ -0,0 +1,69 @@
+"""Unit tests for the inference profile lookup cache in utils.inference_profile."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utils import inference_profile
+
+_CREDENTIALS = {
+    "aws_region": "us-east-1",
+    "aws_access_key_id": "AKIA",
+    "aws_secret_access_key": "secret",
+}
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    inference_profile.clear_inference_profile_cache()
+    yield
+    inference_profile.clear_inference_profile_cache()
+
+
+@pytest.fixture
+def bedrock_client():
+    client = MagicMock()
+    client.get_inference_profile.side_effect = lambda inferenceProfileIdentifier: {
+        "inferenceProfileId": inferenceProfileIdentifier,
+        "status": "ACTIVE",
+    }
+    with patch.object(inference_profile, "get_bedrock_client", return_value=client):
+        yield client
+
+
+def test_repeated_lookup_hits_cache(bedrock_client) -> None:
+    first = inference_profile.get_inference_profile_info("profile-1", _CREDENTIALS)
+    second = inference_profile.get_inference_profile_info("profile-1", _CREDENTIALS)
+
+    assert first is second
+    bedrock_client.get_inference_profile.assert_called_once()
+    assert inference_profile.get_inference_profile_cache_stats() == {
+        "hits": 1,
+        "misses": 1,
+        "size": 1,
+    }
+
+
+def test_expired_entry_is_fetched_again(bedrock_client) -> None:
+    with patch.object(inference_profile.time, "time", side_effect=[0, 0, 0, 1000, 1000, 1000]):
+        inference_profile.get_inference_profile_info("profile-1", _CREDENTIALS)
+        inference_profile.get_inference_profile_info("profile-1", _CREDENTIALS)
+
+    assert bedrock_client.get_inference_profile.call_count == 2
+
+
+def test_different_credentials_do_not_share_entries(bedrock_client) -> None:
+    inference_profile.get_inference_profile_info("profile-1", _CREDENTIALS)
+    inference_profile.get_inference_profile_info(
+        "profile-1", {**_CREDENTIALS, "aws_access_key_id": "AKIA-OTHER"}
+    )
+
+    assert bedrock_client.get_inference_profile.call_count == 2
+
+
+def test_cache_is_bounded(bedrock_client) -> None:
+    with patch.object(inference_profile, "_CACHE_MAX_SIZE", 3):
+        for index in range(5):
+            inference_profile.get_inference_profile_info(f"profile-{index}", _CREDENTIALS)
+
+    assert inference_profile.get_inference_profile_cache_stats()["size"] == 3
@@ -8,14 +8,16 @@ from typing import Dict, Any
 from collections import OrderedDict
 from botocore.exceptions import ClientError
 from dify_plugin.errors.model import CredentialsValidateFailedError
-from provider.get_bedrock_client import get_bedrock_client
+from provider.get_bedrock_client import credential_fingerprint, get_bedrock_client
 
 logger = logging.getLogger(__name__)
 
 # Cache for inference profile info with 5 minutes TTL
-_inference_profile_cache: dict = {}
+_inference_profile_cache: OrderedDict = OrderedDict()
 _CACHE_TTL = 300  # 5 minutes
+_CACHE_MAX_SIZE = 256
 _cache_lock = threading.Lock()
+_cache_stats = {"hits": 0, "misses": 0}
 
 # Per-key locks to prevent thundering herd (multiple threads fetching same profile)
 _fetch_locks: OrderedDict = OrderedDict()
@@ -39,6 +41,19 @@ def _get_fetch_lock(cache_key: str) -> threading.Lock:
         return lock
 
 
+def get_inference_profile_cache_stats() -> dict:
+    """Return hit/miss counters and the current size of the inference profile cache"""
+    with _cache_lock:
+        return {**_cache_stats, "size": len(_inference_profile_cache)}
+
+
+def clear_inference_profile_cache() -> None:
+    with _cache_lock:
+        _inference_profile_cache.clear()
+        _cache_stats["hits"] = 0
+        _cache_stats["misses"] = 0
+
+
 def get_inference_profile_info(inference_profile_id: str, credentials: dict) -> dict:
     """
     Get inference profile information from Bedrock API with 5-minute caching.
@@ -51,9 +66,10 @@ def get_inference_profile_info(inference_profile_id: str, credentials: dict) ->
     """
     current_time = time.time()
 
-    # Create cache key based on profile ID and AWS region
+    # Create cache key based on profile ID, AWS region and credentials, so
+    # profiles with the same ID in different accounts are kept apart
     aws_region = credentials.get("aws_region", "default")
-    cache_key = f"{inference_profile_id}:{aws_region}"
+    cache_key = f"{inference_profile_id}:{aws_region}:{credential_fingerprint(credentials)}"
 
     # Quick check without fetch lock (fast path for cache hits)
     with _cache_lock:
@@ -62,6 +78,8 @@ def get_inference_profile_info(inference_profile_id: str, credentials: dict) ->
             if current_time - timestamp < _CACHE_TTL:
                 # Refresh timestamp on hit to keep active profiles cached
                 _inference_profile_cache[cache_key] = (cached_data, current_time)
+                _inference_profile_cache.move_to_end(cache_key)
+                _cache_stats["hits"] += 1
                 logger.debug(f"Using cached inference profile info for {inference_profile_id}")
                 return cached_data
             else:
@@ -83,10 +101,14 @@ def get_inference_profile_info(inference_profile_id: str, credentials: dict) ->
                 if current_time - timestamp < _CACHE_TTL:
                     # Refresh timestamp on hit
                     _inference_profile_cache[cache_key] = (cached_data, current_time)
+                    _inference_profile_cache.move_to_end(cache_key)
+                    _cache_stats["hits"] += 1
                     logger.debug(f"Using cached inference profile info for {inference_profile_id} (after wait)")
                     return cached_data
 
         # Only one thread reaches here per cache_key
+        with _cache_lock:
+            _cache_stats["misses"] += 1
         try:
             bedrock_client = get_bedrock_client("bedrock", credentials)
 
@@ -96,6 +118,9 @@ def get_inference_profile_info(inference_profile_id: str, credentials: dict) ->
 
             with _cache_lock:
                 _inference_profile_cache[cache_key] = (response, time.time())
+                _inference_profile_cache.move_to_end(cache_key)
+                while len(_inference_profile_cache) > _CACHE_MAX_SIZE:
+                    _inference_profile_cache.popitem(last=False)
                 logger.debug(f"Cached inference profile info for {inference_profile_id} (cache size: {len(_inference_profile_cache)})")
 
             return response
@@ -4,7 +4,8 @@ import logging
 import os
 import tempfile
 import time
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 from enum import Enum
@@ -23,6 +24,11 @@ from .utils import UNSUPPORTED_DOCUMENT_TYPES, UNSUPPORTED_EXTENSIONS, FileCache
 
 FILE_DOWNLOAD_TIMEOUT_SECONDS = 60
 GOOGLE_FILE_CACHE_TTL_SECONDS = 47 * 60 * 60
+# downloads and uploads running at once while preparing a single request
+MAX_CONCURRENT_FILE_TRANSFERS = 8
+# processing-state polling starts sub-second and backs off exponentially
+FILE_STATE_POLL_INITIAL_SECONDS = 0.25
+FILE_STATE_POLL_MAX_SECONDS = 5
 
 
 class GeminiFileMode(Enum):
@@ -63,6 +69,45 @@ class GeminiFilePartFactory:
         self.file_server_url_prefix = file_server_url_prefix
         self.cache = cache
         self.mode = mode
+        # per-request memo: payloads by message content identity, uploads by cache key
+        self._payloads: dict[int, GeminiFilePayload] = {}
+        self._uploads: dict[str, UploadedGeminiFile] = {}
+
+    def prefetch(
+        self, message_contents: Iterable[MultiModalPromptMessageContent]
+    ) -> None:
+        """
+        Download and upload every file of a request concurrently.
+
+        Identical payloads are uploaded once; `build_part` then only assembles
+        parts from the memoized results. The contents must stay alive for as long
+        as the factory is used, since payloads are keyed by object identity.
+        """
+        contents = [
+            content
+            for content in message_contents
+            if self.is_supported(content) and id(content) not in self._payloads
+        ]
+        if not contents:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CONCURRENT_FILE_TRANSFERS, len(contents))
+        ) as executor:
+            payloads = list(executor.map(self.read_payload, contents))
+            for content, payload in zip(contents, payloads):
+                self._payloads[id(content)] = payload
+
+            if self.mode is GeminiFileMode.INLINE or self.genai_client is None:
+                return
+
+            pending: dict[str, GeminiFilePayload] = {}
+            for payload in payloads:
+                cache_key = self._cache_key(payload)
+                if cache_key not in self._uploads:
+                    pending.setdefault(cache_key, payload)
+            # results are memoized by upload_payload itself
+            list(executor.map(self.upload_payload, pending.values()))
 
     def build_part(
         self, message_content: MultiModalPromptMessageContent
@@ -76,7 +121,9 @@ class GeminiFilePartFactory:
             )
             return None
 
-        payload = self.read_payload(message_content)
+        payload = self._payloads.get(id(message_content)) or self.read_payload(
+            message_content
+        )
         if self.mode is GeminiFileMode.INLINE:
             return types.Part.from_bytes(data=payload.data, mime_type=payload.mime_type)
 
@@ -126,11 +173,16 @@ class GeminiFilePartFactory:
             raise ValueError("Gemini client is required to upload files.")
 
         cache_key = self._cache_key(payload)
-        if self.cache.exists(cache_key):
-            cached_uri, cached_mime_type = self.cache.get(cache_key).split(
-                ";", maxsplit=1
-            )
-            return UploadedGeminiFile(uri=cached_uri, mime_type=cached_mime_type)
+        uploaded_file = self._uploads.get(cache_key)
+        if uploaded_file:
+            return uploaded_file
+
+        cached_value = self.cache.get(cache_key)
+        if cached_value:
+            cached_uri, cached_mime_type = cached_value.split(";", maxsplit=1)
+            uploaded_file = UploadedGeminiFile(uri=cached_uri, mime_type=cached_mime_type)
+            self._uploads[cache_key] = uploaded_file
+            return uploaded_file
 
         temp_file_path = None
         try:
@@ -144,11 +196,10 @@ class GeminiFilePartFactory:
                 config=types.UploadFileConfig(mime_type=payload.mime_type),
             )
 
-            while file.state.name == "PROCESSING":
-                time.sleep(5)
-                file = self.genai_client.files.get(name=file.name)
+            file = self._wait_until_processed(file)
 
             uploaded_file = UploadedGeminiFile(uri=file.uri, mime_type=file.mime_type)
+            self._uploads[cache_key] = uploaded_file
             self.cache.setex(
                 cache_key,
                 GOOGLE_FILE_CACHE_TTL_SECONDS,
@@ -160,6 +211,14 @@ class GeminiFilePartFactory:
                 with suppress(FileNotFoundError, PermissionError):
                     os.unlink(temp_file_path)
 
+    def _wait_until_processed(self, file: types.File) -> types.File:
+        delay = FILE_STATE_POLL_INITIAL_SECONDS
+        while file.state.name == "PROCESSING":
+            time.sleep(delay)
+            delay = min(delay * 2, FILE_STATE_POLL_MAX_SECONDS)
+            file = self.genai_client.files.get(name=file.name)
+        return file
+
     def _resolve_file_url(self, message_content: MultiModalPromptMessageContent) -> str:
         file_url = message_content.url
         if not file_url:
@@ -612,6 +612,14 @@ class GoogleLargeLanguageModel(LargeLanguageModel):
             cache=file_cache,
             mode=GeminiFileMode.from_parameters(model_parameters),
         )
+        # fetch and upload every file of the request up front, concurrently
+        file_part_factory.prefetch(
+            part
+            for msg in prompt_messages
+            if not isinstance(msg, ToolPromptMessage) and isinstance(msg.content, list)
+            for part in msg.content
+            if part.type != PromptMessageContentType.TEXT
+        )
 
         for msg in prompt_messages:
             if isinstance(msg, SystemPromptMessage):
@@ -1,12 +1,31 @@
-import os
 import json
+import logging
+import os
 import pathlib
-import time
+import sqlite3
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
 
 
 class FileCache:
-    def __init__(self, cache_file="file_cache.json"):
+    """
+    Cache of uploaded Gemini files shared by all plugin workers.
+
+    Entries live in a SQLite database so concurrent writers from several
+    processes do not lose updates, with a small in-memory LRU in front of it
+    so repeated lookups in one process skip the disk entirely.
+    """
+
+    def __init__(
+        self,
+        cache_file="file_cache.sqlite3",
+        legacy_cache_file="file_cache.json",
+        max_memory_entries=1024,
+    ):
         dir = os.path.dirname(cache_file)
         try:
             # try to check if the cache file is writable
@@ -15,42 +34,99 @@ class FileCache:
         except Exception:
             self.cache_file = str(pathlib.Path(tempfile.gettempdir()) / cache_file)
 
-        self._ensure_cache_file()
+        self._max_memory_entries = max_memory_entries
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        try:
+            self._connection = sqlite3.connect(
+                self.cache_file, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            self._ensure_schema()
+        except sqlite3.Error:
+            # keep caching within this process rather than failing every request
+            logger.warning("Gemini file cache falls back to memory only", exc_info=True)
+            self._connection = None
+            return
+        self._import_legacy_cache(legacy_cache_file)
 
-    def _ensure_cache_file(self):
-        if not os.path.exists(self.cache_file):
-            with open(self.cache_file, "w") as f:
-                json.dump({}, f)
+    def _ensure_schema(self):
+        with self._lock:
+            # WAL lets readers in other workers proceed while one of them writes
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS file_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS file_cache_expires_at ON file_cache (expires_at)"
+            )
 
-    def _load_cache(self):
+    def _import_legacy_cache(self, legacy_cache_file):
+        """Carry over live entries from the JSON file used by earlier versions."""
+        legacy_path = pathlib.Path(self.cache_file).with_name(legacy_cache_file)
+        if not legacy_cache_file or not legacy_path.is_file():
+            return
         try:
-            with open(self.cache_file, "r") as f:
+            with open(legacy_path, "r") as f:
                 cache = json.load(f)
-            return cache
+            now = time.time()
+            rows = [
+                (k, v["value"], v["expires_at"])
+                for k, v in cache.items()
+                if v.get("expires_at", 0) > now
+            ]
+            with self._lock:
+                self._connection.executemany(
+                    "INSERT OR IGNORE INTO file_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    rows,
+                )
+            legacy_path.unlink()
         except Exception:
-            return {}
+            logger.warning("Failed to import legacy Gemini file cache", exc_info=True)
 
-    def _save_cache(self, cache):
-        cleaned_cache = {
-            k: v for k, v in cache.items() if v.get("expires_at", 0) > time.time()
-        }
-        with open(self.cache_file, "w") as f:
-            json.dump(cleaned_cache, f)
+    def _remember(self, key, value, expires_at):
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
 
     def exists(self, key):
-        cache = self._load_cache()
-        return key in cache and cache[key].get("expires_at", 0) > time.time()
+        return self.get(key) is not None
 
     def get(self, key):
-        cache = self._load_cache()
-        if key in cache and cache[key].get("expires_at", 0) > time.time():
-            return cache[key]["value"]
-        return None
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                value, expires_at = cached
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    return value
+                del self._memory[key]
+
+            if self._connection is None:
+                return None
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM file_cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            self._remember(key, row[0], row[1])
+            return row[0]
 
     def setex(self, key, expires_in_seconds, value):
-        cache = self._load_cache()
-        cache[key] = {"value": value, "expires_at": time.time() + expires_in_seconds}
-        self._save_cache(cache)
+        now = time.time()
+        expires_at = now + expires_in_seconds
+        with self._lock:
+            self._remember(key, value, expires_at)
+            if self._connection is None:
+                return
+            self._connection.execute(
+                "INSERT OR REPLACE INTO file_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+            self._connection.execute("DELETE FROM file_cache WHERE expires_at <= ?", (now,))
 
 
 # Gemini API File Type Support Constants
@@ -0,0 +1,68 @@
+import json
+import time
+
+from models.llm.utils import FileCache
+
+
+def _cache(tmp_path, **kwargs) -> FileCache:
+    return FileCache(cache_file=str(tmp_path / "file_cache.sqlite3"), **kwargs)
+
+
+def test_set_and_get(tmp_path):
+    cache = _cache(tmp_path)
+
+    cache.setex("key", 60, "uri;mime")
+
+    assert cache.exists("key")
+    assert cache.get("key") == "uri;mime"
+    assert cache.get("missing") is None
+
+
+def test_expired_entries_are_not_returned(tmp_path, monkeypatch):
+    cache = _cache(tmp_path)
+    cache.setex("key", 60, "uri;mime")
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+
+    assert not cache.exists("key")
+    assert cache.get("key") is None
+
+
+def test_entries_are_shared_between_workers(tmp_path):
+    writer = _cache(tmp_path)
+    reader = _cache(tmp_path)
+    assert reader.get("key") is None
+
+    writer.setex("key", 60, "uri;mime")
+
+    assert reader.get("key") == "uri;mime"
+
+
+def test_memory_layer_is_bounded(tmp_path):
+    cache = _cache(tmp_path, max_memory_entries=2)
+
+    for index in range(5):
+        cache.setex(f"key-{index}", 60, f"value-{index}")
+
+    assert len(cache._memory) == 2
+    # evicted entries are still served from the database
+    assert cache.get("key-0") == "value-0"
+
+
+def test_legacy_json_cache_is_imported(tmp_path):
+    legacy_file = tmp_path / "file_cache.json"
+    legacy_file.write_text(
+        json.dumps(
+            {
+                "live": {"value": "uri;mime", "expires_at": time.time() + 60},
+                "stale": {"value": "old;mime", "expires_at": time.time() - 60},
+            }
+        )
+    )
+
+    cache = _cache(tmp_path)
+
+    assert cache.get("live") == "uri;mime"
+    assert cache.get("stale") is None
+    assert not legacy_file.exists()
@@ -1,5 +1,6 @@
 import base64
 import dataclasses
+import threading
 import time
 from decimal import Decimal
 from unittest.mock import Mock, patch
@@ -328,6 +329,112 @@ class TestContentConversion:
             assert uploaded1.mime_type == uploaded2.mime_type == "image/jpeg"
             assert self.mock_client.files.upload.call_count == 1
 
+    def test_identical_payloads_in_request_are_uploaded_once(self):
+        image_data = base64.b64encode(b"same image").decode()
+        other_data = base64.b64encode(b"other image").decode()
+        messages = [
+            UserPromptMessage(
+                content=[
+                    ImagePromptMessageContent(
+                        format="png", base64_data=image_data, mime_type="image/png"
+                    ),
+                    ImagePromptMessageContent(
+                        format="png", base64_data=other_data, mime_type="image/png"
+                    ),
+                ]
+            ),
+            AssistantPromptMessage(content="ok"),
+            UserPromptMessage(
+                content=[
+                    ImagePromptMessageContent(
+                        format="png", base64_data=image_data, mime_type="image/png"
+                    )
+                ]
+            ),
+        ]
+
+        with (
+            patch("tempfile.NamedTemporaryFile"),
+            patch("os.unlink"),
+            patch("models.llm.llm.file_cache", MemoryFileCache()),
+        ):
+            contents = self.llm._build_gemini_contents(
+                prompt_messages=messages,
+                genai_client=self.mock_client,
+                config=self.mock_config,
+            )
+
+        assert len(contents) == 3
+        assert len(contents[0].parts) == 2
+        assert len(contents[2].parts) == 1
+        assert self.mock_client.files.upload.call_count == 2
+
+    def test_prefetch_uploads_files_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def upload(file, config):
+            barrier.wait()
+            return self.mock_file
+
+        self.mock_client.files.upload.side_effect = upload
+        contents = [
+            ImagePromptMessageContent(
+                format="jpeg",
+                base64_data=base64.b64encode(data).decode(),
+                mime_type="image/jpeg",
+            )
+            for data in (b"first", b"second")
+        ]
+        file_factory = GeminiFilePartFactory(
+            genai_client=self.mock_client,
+            file_server_url_prefix=None,
+            cache=MemoryFileCache(),
+            mode=GeminiFileMode.FILES_API,
+        )
+
+        with patch("tempfile.NamedTemporaryFile"), patch("os.unlink"):
+            # both uploads must be in flight at once to pass the barrier
+            file_factory.prefetch(contents)
+            parts = [file_factory.build_part(content) for content in contents]
+
+        assert self.mock_client.files.upload.call_count == 2
+        assert all(part.file_data.file_uri == self.mock_file.uri for part in parts)
+
+    def test_processing_state_is_polled_with_backoff(self):
+        processing = Mock(uri="gs://test-bucket/test-file", mime_type="image/jpeg")
+        processing.name = "files/test"
+        processing.state.name = "PROCESSING"
+        self.mock_client.files.upload.return_value = processing
+        self.mock_client.files.get.side_effect = [processing] * 3 + [self.mock_file]
+        file_factory = GeminiFilePartFactory(
+            genai_client=self.mock_client,
+            file_server_url_prefix=None,
+            cache=MemoryFileCache(),
+            mode=GeminiFileMode.FILES_API,
+        )
+        payload = file_factory.read_payload(
+            ImagePromptMessageContent(
+                format="jpeg",
+                base64_data=base64.b64encode(b"video frame").decode(),
+                mime_type="image/jpeg",
+            )
+        )
+
+        with (
+            patch("tempfile.NamedTemporaryFile"),
+            patch("os.unlink"),
+            patch("models.llm.file_parts.time.sleep") as mock_sleep,
+        ):
+            uploaded = file_factory.upload_payload(payload)
+
+        assert uploaded.uri == "gs://test-bucket/test-file"
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [
+            0.25,
+            0.5,
+            1,
+            2,
+        ]
+
     def test_file_url_with_prefix(self):
         """Test file URL handling with server prefix"""
         message_content = DocumentPromptMessageContent(
@@ -13,21 +13,27 @@ class TeiModelExtraParameter:
     model_type: str
     max_input_length: int
     max_client_batch_size: int
+    max_batch_tokens: Optional[int]
 
     def __init__(
         self,
         model_type: str,
         max_input_length: int,
         max_client_batch_size: Optional[int] = None,
+        max_batch_tokens: Optional[int] = None,
     ) -> None:
         self.model_type = model_type
         self.max_input_length = max_input_length
         self.max_client_batch_size = max_client_batch_size
+        self.max_batch_tokens = max_batch_tokens
 
 
 cache = {}
 cache_lock = Lock()
 
+# shared client so concurrent batches reuse pooled keep-alive connections
+http_client = httpx.Client(limits=httpx.Limits(max_connections=32, max_keepalive_connections=16))
+
 
 class TeiHelper:
     @staticmethod
@@ -95,11 +101,13 @@ class TeiHelper:
 
         max_input_length = response_json.get("max_input_length", 512)
         max_client_batch_size = response_json.get("max_client_batch_size", 1)
+        max_batch_tokens = response_json.get("max_batch_tokens")
 
         return TeiModelExtraParameter(
             model_type=model_type,
             max_input_length=max_input_length,
             max_client_batch_size=max_client_batch_size,
+            max_batch_tokens=max_batch_tokens,
         )
 
     @staticmethod
@@ -140,7 +148,7 @@ class TeiHelper:
 
         for attempt in range(max_retries + 1):
             try:
-                resp = httpx.post(url, json=json_data, headers=headers, timeout=invoke_timeout)
+                resp = http_client.post(url, json=json_data, headers=headers, timeout=invoke_timeout)
                 resp.raise_for_status()
                 break
             except (httpx.RequestError, httpx.HTTPStatusError) as e:
@@ -185,7 +193,7 @@ class TeiHelper:
 
         for attempt in range(max_retries + 1):
             try:
-                resp = httpx.post(url, json=json_data, headers=headers, timeout=invoke_timeout)
+                resp = http_client.post(url, json=json_data, headers=headers, timeout=invoke_timeout)
                 resp.raise_for_status()
                 break
             except (httpx.RequestError, httpx.HTTPStatusError) as e:
@@ -221,7 +229,7 @@ class TeiHelper:
 
         for attempt in range(max_retries + 1):
             try:
-                resp = httpx.post(url, json=json_data, headers=headers, timeout=invoke_timeout)
+                resp = http_client.post(url, json=json_data, headers=headers, timeout=invoke_timeout)
                 resp.raise_for_status()
                 break
             except (httpx.RequestError, httpx.HTTPStatusError) as e:
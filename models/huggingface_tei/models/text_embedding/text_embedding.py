@@ -1,4 +1,5 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from dify_plugin.entities.model import (
     AIModelEntity,
@@ -27,6 +28,9 @@ from models.helper import TeiHelper
 
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_INVOKE_TIMEOUT = 60
+DEFAULT_MAX_CONCURRENT_BATCHES = 4
+# TEI's own default for --max-batch-tokens
+DEFAULT_MAX_BATCH_TOKENS = 16384
 
 
 class HuggingfaceTeiTextEmbeddingModel(TextEmbeddingModel):
@@ -68,8 +72,13 @@ class HuggingfaceTeiTextEmbeddingModel(TextEmbeddingModel):
             headers["Authorization"] = f"Bearer {api_key}"
         context_size = self._get_context_size(model, credentials)
         max_chunks = self._get_max_chunks(model, credentials)
+        max_batch_tokens = int(credentials.get("max_batch_tokens") or DEFAULT_MAX_BATCH_TOKENS)
+        max_concurrent_batches = max(
+            1, int(credentials.get("max_concurrent_batches") or DEFAULT_MAX_CONCURRENT_BATCHES)
+        )
         inputs = []
         indices = []
+        input_tokens = []
         used_tokens = 0
         
         # Use GPT2 tokenizer instead of server's /tokenize endpoint
@@ -82,17 +91,22 @@ class HuggingfaceTeiTextEmbeddingModel(TextEmbeddingModel):
             else:
                 inputs.append(text)
             indices += [i]
+            input_tokens.append(min(num_tokens, context_size))
             used_tokens += num_tokens
-            
+
+        def _embed(batch: tuple[int, int]) -> list[list[float]]:
+            start, end = batch
+            results = TeiHelper.invoke_embeddings(server_url, inputs[start:end], headers, invoke_timeout, max_retries)
+            return [embedding["embedding"] for embedding in results["data"]]
+
+        # Keep several batches in flight; map() yields them back in input order
+        batches = self._pack_batches(input_tokens, max_chunks, max_batch_tokens)
         batched_embeddings = []
-        _iter = range(0, len(inputs), max_chunks)
         try:
-            for i in _iter:
-                iter_texts = inputs[i : i + max_chunks]
-                results = TeiHelper.invoke_embeddings(server_url, iter_texts, headers, invoke_timeout, max_retries)
-                embeddings = results["data"]
-                embeddings = [embedding["embedding"] for embedding in embeddings]
-                batched_embeddings.extend(embeddings)
+            if batches:
+                with ThreadPoolExecutor(max_workers=min(max_concurrent_batches, len(batches))) as executor:
+                    for embeddings in executor.map(_embed, batches):
+                        batched_embeddings.extend(embeddings)
         except RuntimeError as e:
             raise InvokeServerUnavailableError(str(e))
         usage = self._calc_response_usage(
@@ -103,6 +117,29 @@ class HuggingfaceTeiTextEmbeddingModel(TextEmbeddingModel):
         )
         return result
 
+    @staticmethod
+    def _pack_batches(token_counts: list[int], max_chunks: int, max_batch_tokens: int) -> list[tuple[int, int]]:
+        """
+        Split consecutive inputs into batches bounded by both count and estimated tokens
+
+        :param token_counts: estimated tokens of each input
+        :param max_chunks: max inputs per batch
+        :param max_batch_tokens: max estimated tokens per batch, a single larger input gets its own batch
+        :return: list of (start, end) index ranges, in input order
+        """
+        batches = []
+        start = 0
+        batch_tokens = 0
+        for i, tokens in enumerate(token_counts):
+            if i > start and (i - start >= max_chunks or batch_tokens + tokens > max_batch_tokens):
+                batches.append((start, i))
+                start = i
+                batch_tokens = 0
+            batch_tokens += tokens
+        if start < len(token_counts):
+            batches.append((start, len(token_counts)))
+        return batches
+
     def get_num_tokens(self, model: str, credentials: dict, texts: list[str]) -> list[int]:
         """
         Get number of tokens for given prompt messages using GPT2 tokenizer
@@ -139,6 +176,8 @@ class HuggingfaceTeiTextEmbeddingModel(TextEmbeddingModel):
                 )
             credentials["context_size"] = extra_args.max_input_length
             credentials["max_chunks"] = extra_args.max_client_batch_size
+            if extra_args.max_batch_tokens:
+                credentials["max_batch_tokens"] = extra_args.max_batch_tokens
             self._invoke(model=model, credentials=credentials, texts=["ping"])
         except Exception as ex:
             raise CredentialsValidateFailedError(str(ex))
@@ -0,0 +1,60 @@
+import importlib.util
+import os
+import random
+import re
+import types
+
+PLUGIN_DIR = os.path.join('tools', 'dingo')
+
+
+def load_module_from_path(module_name: str, file_path: str) -> types.ModuleType:
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    assert spec and spec.loader, f"cannot load spec for {module_name} from {file_path}"
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)  # type: ignore
+    return mod
+
+
+AhoCorasick = load_module_from_path(
+    'dingo_aho_corasick', os.path.join(PLUGIN_DIR, 'tools', 'aho_corasick.py')
+).AhoCorasick
+
+
+def regex_counts(patterns, text):
+    return [len(re.findall(rf"(?<!\w){re.escape(p)}(?!\w)", text)) for p in patterns]
+
+
+def test_matches_respect_word_boundaries():
+    matcher = AhoCorasick(['java', 'c++', 'node.js'])
+    text = 'java, javascript, c++ and c++11; node.js/nodejs (java)'
+    assert matcher.count(text) == [2, 1, 1]
+    assert [text[start:end] for start, end, _ in matcher.iter_matches(text)] == ['java', 'c++', 'node.js', 'java']
+
+
+def test_matching_is_case_sensitive():
+    matcher = AhoCorasick(['Go', 'go'])
+    assert matcher.count('Go go GO') == [1, 1]
+    assert matcher.pattern_id('Go') == 0
+    assert matcher.pattern_id('GO') is None
+
+
+def test_overlapping_patterns_are_counted_independently():
+    matcher = AhoCorasick(['machine learning', 'learning', 'deep learning', 'learning'])
+    assert matcher.patterns == ['machine learning', 'learning', 'deep learning']
+    assert matcher.count('machine learning and deep learning') == [1, 2, 1]
+
+
+def test_occurrences_of_one_pattern_do_not_overlap():
+    matcher = AhoCorasick(['a a'])
+    assert matcher.count('a a a a') == regex_counts(['a a'], 'a a a a') == [2]
+    assert len(list(matcher.iter_occurrences('a a a a'))) == 3
+
+
+def test_counts_match_the_regex_implementation():
+    rng = random.Random(0)
+    vocabulary = ['c', 'c++', 'c#', 'sql', 'my sql', 'mysql', 'a', 'a b', 'b a', '.net', 'net', 'x-y', 'é']
+    separators = [' ', ' ', ',', '.', '-', '/', '\n', '']
+    for _ in range(500):
+        patterns = rng.sample(vocabulary, rng.randint(1, len(vocabulary)))
+        text = ''.join(rng.choice(vocabulary) + rng.choice(separators) for _ in range(rng.randint(0, 30)))
+        assert AhoCorasick(patterns).count(text) == regex_counts(patterns, text), (patterns, text)
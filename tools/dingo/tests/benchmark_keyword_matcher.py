@@ -0,0 +1,154 @@
+"""Benchmark the dictionary matching of KeywordMatcher on synthetic resumes.
+
+Compares the KeywordIndex / Aho-Corasick matching with the previous
+implementation, which ran one regex pass per keyword and synonym, and checks
+that both return the same keywords, mention counts and match types.
+
+    uv run python tests/benchmark_keyword_matcher.py --resumes 50
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PLUGIN_ROOT))
+
+from tools.keyword_matcher import KeywordMatcher  # noqa: E402
+
+DICTIONARY_PATH = PLUGIN_ROOT / "data" / "onet_keywords.json"
+FILLER_WORDS = ["led", "built", "the", "team", "with", "and", "for", "a", "scalable", "platform", "using"]
+
+
+class LegacyKeywordMatcher(KeywordMatcher):
+    """The matcher as it was before keywords were matched with automata."""
+
+    def _normalize_synonyms(self, text: str) -> str:
+        normalized = text
+        for synonym, standard in self.SYNONYM_MAP.items():
+            pattern = re.compile(rf'\b{re.escape(synonym)}\b', re.IGNORECASE)
+            normalized = pattern.sub(standard, normalized)
+        return normalized
+
+    def _count_mentions_many(self, keywords: list[str], text: str) -> list[tuple[int, str]]:
+        return [self._legacy_count_mentions(keyword, text) for keyword in keywords]
+
+    def _legacy_count_mentions(self, keyword: str, text: str) -> tuple[int, str]:
+        text_lower = text.lower()
+        keyword_lower = keyword.lower()
+
+        if keyword in self.CASE_SENSITIVE_KEYWORDS:
+            pattern = re.compile(rf"(?<!\w){re.escape(keyword)}(?!\w)")
+            exact_count = len(pattern.findall(text))
+        else:
+            text_normalized = self._prepare_text_for_matching(text)
+            pattern = re.compile(rf"(?<!\w){re.escape(keyword_lower)}(?!\w)")
+            exact_count = len(pattern.findall(text_normalized))
+
+        if exact_count > 0:
+            return exact_count, "exact"
+
+        reverse_synonyms = {}
+        for alias, standard in self.SYNONYM_MAP.items():
+            if standard not in reverse_synonyms:
+                reverse_synonyms[standard] = []
+            reverse_synonyms[standard].append(alias)
+
+        synonym_count = 0
+        matched_synonym = None
+        for synonym in reverse_synonyms.get(keyword, []):
+            pattern = re.compile(rf"(?<!\w){re.escape(synonym.lower())}(?!\w)")
+            count = len(pattern.findall(text_lower))
+            if count > 0:
+                synonym_count += count
+                if matched_synonym is None:
+                    matched_synonym = synonym
+
+        if synonym_count > 0:
+            return synonym_count, f"synonym:{matched_synonym}"
+        return 0, "none"
+
+    def _extract_with_dictionary(self, text: str, keywords: list[str]) -> list[dict[str, Any]]:
+        text_normalized = self._normalize_synonyms(text)
+        text_norm = self._prepare_text_for_matching(text_normalized)
+
+        results = []
+        for keyword in keywords:
+            if keyword in self.CASE_SENSITIVE_KEYWORDS:
+                pattern = re.compile(rf"(?<!\w){re.escape(keyword)}(?!\w)")
+                mentions = len(pattern.findall(text_normalized))
+            else:
+                pattern = re.compile(rf"(?<!\w){re.escape(keyword.lower())}(?!\w)")
+                mentions = len(pattern.findall(text_norm))
+
+            if mentions > 0:
+                results.append({
+                    "skill": keyword,
+                    "mentions": mentions,
+                    "confidence": 1.0,
+                    "source": "dictionary"
+                })
+
+        return results
+
+
+def make_matcher(cls):
+    # the matching methods only use class attributes, so skip the Tool runtime
+    return cls.__new__(cls)
+
+
+def resume_text(keywords: list[str], synonyms: list[str], tokens: int, seed: int) -> str:
+    """Filler words mixed with dictionary terms and synonym aliases."""
+    rng = random.Random(seed)
+    words = []
+    for _ in range(tokens):
+        roll = rng.random()
+        if roll < 0.1:
+            words.append(rng.choice(keywords))
+        elif roll < 0.15:
+            words.append(rng.choice(synonyms))
+        else:
+            words.append(rng.choice(FILLER_WORDS))
+        if rng.random() < 0.05:
+            words[-1] += rng.choice([",", ".", "\n-"])
+    return " ".join(words)
+
+
+def run_matcher(matcher: KeywordMatcher, keywords: list[str], texts: list[str]) -> tuple[float, list]:
+    started = time.perf_counter()
+    results = []
+    for text in texts:
+        found = matcher._extract_with_dictionary(text, keywords)
+        results.append((found, matcher._count_mentions_many([kw["skill"] for kw in found], text)))
+    return time.perf_counter() - started, results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=50, help="number of synthetic resumes")
+    parser.add_argument("--tokens", type=int, default=400, help="words per resume")
+    parser.add_argument("--skip-legacy", action="store_true", help="only time the current matcher")
+    args = parser.parse_args()
+
+    current = make_matcher(KeywordMatcher)
+    keywords = current._load_dictionary(DICTIONARY_PATH)
+    synonyms = list(KeywordMatcher.SYNONYM_MAP)
+    texts = [resume_text(keywords, synonyms, args.tokens, seed) for seed in range(args.resumes)]
+
+    # warm the automata so both sides are timed on steady-state calls
+    run_matcher(current, keywords, texts[:1])
+    elapsed, results = run_matcher(current, keywords, texts)
+    line = f"{args.resumes} resumes x {args.tokens} words, {len(keywords)} keywords  current {elapsed:7.3f}s"
+    if not args.skip_legacy:
+        legacy_elapsed, expected = run_matcher(make_matcher(LegacyKeywordMatcher), keywords, texts)
+        assert results == expected, "matches differ from the legacy matcher"
+        line += f"  legacy {legacy_elapsed:7.3f}s"
+    print(line)
+
+
+if __name__ == "__main__":
+    main()
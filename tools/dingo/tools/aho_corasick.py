@@ -0,0 +1,117 @@
+"""
+Aho–Corasick multi-pattern matcher used by the Dingo keyword matcher.
+
+The automaton is compiled once into a DFA (failure transitions folded into
+each state's transition table), so scanning a text is a single linear pass
+with one dict lookup per character, independent of the number of patterns.
+
+Matching mirrors the `(?<!\\w)pattern(?!\\w)` regexes it replaces: an
+occurrence only counts when it is not glued to a word character on either
+side, and each pattern's occurrences are counted non-overlapping, leftmost
+first, exactly like `re.findall`.
+"""
+
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+
+_WORD_CHAR = re.compile(r"\w")
+
+
+def is_word_char(text: str, index: int) -> bool:
+    """Whether text[index] exists and is a regex word character."""
+    return 0 <= index < len(text) and _WORD_CHAR.match(text[index]) is not None
+
+
+class AhoCorasick:
+    """
+    Word-boundary aware multi-pattern matcher.
+
+    Patterns are matched literally; callers lowercase both patterns and text
+    for case-insensitive matching. Duplicate patterns share one id.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: list[str] = []
+        self._pattern_ids: dict[str, int] = {}
+        # trie transitions, later completed into DFA transitions
+        self._delta: list[dict[str, int]] = [{}]
+        self._outputs: list[tuple[int, ...]] = [()]
+
+        for pattern in patterns:
+            if pattern and pattern not in self._pattern_ids:
+                self._add(pattern)
+        self._build()
+
+    def pattern_id(self, pattern: str) -> int | None:
+        return self._pattern_ids.get(pattern)
+
+    def _add(self, pattern: str) -> None:
+        pattern_id = len(self.patterns)
+        self.patterns.append(pattern)
+        self._pattern_ids[pattern] = pattern_id
+
+        state = 0
+        for ch in pattern:
+            next_state = self._delta[state].get(ch)
+            if next_state is None:
+                next_state = len(self._delta)
+                self._delta.append({})
+                self._outputs.append(())
+                self._delta[state][ch] = next_state
+            state = next_state
+        self._outputs[state] += (pattern_id,)
+
+    def _build(self) -> None:
+        fail = [0] * len(self._delta)
+        queue = deque(self._delta[0].values())
+        while queue:
+            state = queue.popleft()
+            # children of `state` still hold only trie edges at this point
+            children = list(self._delta[state].items())
+            # inherit the failure state's transitions, which is already complete
+            self._delta[state] = {**self._delta[fail[state]], **self._delta[state]}
+            for ch, child in children:
+                fail[child] = self._delta[fail[state]].get(ch, 0)
+                self._outputs[child] += self._outputs[fail[child]]
+                queue.append(child)
+
+    def iter_occurrences(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """
+        Yield every occurrence as (start, end, pattern_id), ordered by end.
+
+        Occurrences may overlap and are not checked against word boundaries.
+        """
+        delta = self._delta
+        outputs = self._outputs
+        patterns = self.patterns
+        state = 0
+        for index, ch in enumerate(text):
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                end = index + 1
+                for pattern_id in outputs[state]:
+                    yield end - len(patterns[pattern_id]), end, pattern_id
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """
+        Yield word-bounded occurrences as (start, end, pattern_id).
+
+        Occurrences of the same pattern never overlap (leftmost first), while
+        occurrences of different patterns may.
+        """
+        last_end = [0] * len(self.patterns)
+        for start, end, pattern_id in self.iter_occurrences(text):
+            if start < last_end[pattern_id]:
+                continue
+            if is_word_char(text, start - 1) or is_word_char(text, end):
+                continue
+            last_end[pattern_id] = end
+            yield start, end, pattern_id
+
+    def count(self, text: str) -> list[int]:
+        """Count word-bounded, non-overlapping matches of every pattern in text."""
+        counts = [0] * len(self.patterns)
+        for _, _, pattern_id in self.iter_matches(text):
+            counts[pattern_id] += 1
+        return counts
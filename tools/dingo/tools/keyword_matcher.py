@@ -19,9 +19,13 @@ Reference:
 - Benchmarked against Jobscan for accuracy validation
 """
 
+import os
 import re
+import sys
 import json
 import time
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from collections.abc import Generator
@@ -31,6 +35,10 @@ from dify_plugin.entities.tool import ToolInvokeMessage
 from dify_plugin.entities.model.llm import LLMModelConfig
 from dify_plugin.entities.model.message import UserPromptMessage, SystemPromptMessage
 
+# the tools directory is not a package when this file is loaded by path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from aho_corasick import AhoCorasick  # noqa: E402
+
 # ============================================================================
 # SYSTEM PROMPT - Core LLM Analysis Logic
 # ============================================================================
@@ -93,6 +101,81 @@ Return ONLY a valid JSON object. No markdown, no code blocks, no commentary.
 """
 
 
+# ============================================================================
+# Dictionary Matching - automata are compiled once and reused across resumes
+# ============================================================================
+
+class KeywordIndex:
+    """
+    Multi-pattern index over a keyword list.
+
+    Case-sensitive keywords are matched against the original text, all others
+    against the prepared (lowercased) text, each in a single linear scan.
+    """
+
+    def __init__(self, keywords: tuple[str, ...], case_sensitive: frozenset[str]):
+        self.keywords = keywords
+        self._sensitive = AhoCorasick(kw for kw in keywords if kw in case_sensitive)
+        self._insensitive = AhoCorasick(kw.lower() for kw in keywords if kw not in case_sensitive)
+        self._lookup = [
+            (True, self._sensitive.pattern_id(kw)) if kw in case_sensitive
+            else (False, self._insensitive.pattern_id(kw.lower()))
+            for kw in keywords
+        ]
+
+    def count(self, text: str, prepared_text: str) -> list[int]:
+        """Count the mentions of every keyword, in keyword order."""
+        sensitive_counts = self._sensitive.count(text) if self._sensitive.patterns else []
+        insensitive_counts = self._insensitive.count(prepared_text) if self._insensitive.patterns else []
+        return [
+            # empty keywords never reach an automaton and count as no mention
+            0 if pattern_id is None
+            else (sensitive_counts if sensitive else insensitive_counts)[pattern_id]
+            for sensitive, pattern_id in self._lookup
+        ]
+
+
+@lru_cache(maxsize=64)
+def _get_keyword_index(keywords: tuple[str, ...], case_sensitive: frozenset[str]) -> KeywordIndex:
+    return KeywordIndex(keywords, case_sensitive)
+
+
+@lru_cache(maxsize=4)
+def _get_synonym_automaton(synonyms: tuple[str, ...]) -> AhoCorasick:
+    # pattern ids follow SYNONYM_MAP order, which is also the rule priority
+    return AhoCorasick(synonym.lower() for synonym in synonyms)
+
+
+@lru_cache(maxsize=4)
+def _get_reverse_synonyms(synonym_items: tuple[tuple[str, str], ...]) -> dict[str, list[str]]:
+    """Standard form -> list of aliases, in SYNONYM_MAP order"""
+    reverse_synonyms: dict[str, list[str]] = {}
+    for alias, standard in synonym_items:
+        reverse_synonyms.setdefault(standard, []).append(alias)
+    return reverse_synonyms
+
+
+@lru_cache(maxsize=4)
+def _read_dictionary(dictionary_path: str) -> tuple[str, ...]:
+    with open(dictionary_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    all_keywords = []
+    for category_keywords in data['keywords'].values():
+        all_keywords.extend(category_keywords)
+
+    return tuple(all_keywords)
+
+
+def _lower_preserving_offsets(text: str) -> str:
+    """Lowercase text while keeping character offsets aligned with the original."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # a few characters (e.g. 'İ') expand when lowercased; leave those as-is
+    return "".join(lower if len(lower := ch.lower()) == 1 else ch for ch in text)
+
+
 class KeywordMatcher(Tool):
     """
     ATS-Optimized Keyword Matcher with Semantic Analysis
@@ -490,21 +573,16 @@ Please analyze and output JSON."""
         if not keywords:
             keywords = self.FALLBACK_KEYWORDS
 
-        # Extract keywords from both texts
+        # Extract keywords from the JD, then count them in the resume in one scan
         jd_keywords = self._extract_with_dictionary(jd_text, keywords)
-        resume_keywords_set = set()
-
-        # Build resume keywords set
-        for kw in self._extract_with_dictionary(resume_text, keywords):
-            resume_keywords_set.add(kw['skill'].lower())
+        mentions = self._count_mentions_many([jd_kw['skill'] for jd_kw in jd_keywords], resume_text)
 
         # Match
         matched = []
         missing = []
 
-        for jd_kw in jd_keywords:
+        for jd_kw, (count, match_type) in zip(jd_keywords, mentions):
             skill = jd_kw['skill']
-            count, match_type = self._count_mentions(skill, resume_text)
 
             if count > 0:
                 matched.append({
@@ -668,23 +746,48 @@ Please analyze and output JSON."""
         return "\n".join(lines)
 
     def _load_dictionary(self, dictionary_path: Path) -> list[str]:
-        """Load O*NET keyword dictionary"""
-        with open(dictionary_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        all_keywords = []
-        for category_keywords in data['keywords'].values():
-            all_keywords.extend(category_keywords)
-        
-        return all_keywords
+        """Load O*NET keyword dictionary (parsed once per path)"""
+        return list(_read_dictionary(str(dictionary_path)))
     
     def _normalize_synonyms(self, text: str) -> str:
-        """Normalize synonyms (K8s→Kubernetes, etc.)"""
-        normalized = text
+        """
+        Normalize synonyms (K8s→Kubernetes, etc.)
+
+        Single scan equivalent to substituting each SYNONYM_MAP entry in turn:
+        where matches overlap, the entry listed first wins.
+        """
+        automaton = _get_synonym_automaton(tuple(self.SYNONYM_MAP))
+        standards: dict[int, str] = {}
         for synonym, standard in self.SYNONYM_MAP.items():
-            pattern = re.compile(rf'\b{re.escape(synonym)}\b', re.IGNORECASE)
-            normalized = pattern.sub(standard, normalized)
-        return normalized
+            standards.setdefault(automaton.pattern_id(synonym.lower()), standard)
+
+        matches_by_rule: list[list[tuple[int, int]]] = [[] for _ in automaton.patterns]
+        for start, end, rule in automaton.iter_matches(_lower_preserving_offsets(text)):
+            matches_by_rule[rule].append((start, end))
+
+        # accepted spans, kept sorted and non-overlapping
+        starts: list[int] = []
+        spans: list[tuple[int, int, int]] = []
+        for rule, matches in enumerate(matches_by_rule):
+            for start, end in matches:
+                position = bisect_left(starts, start)
+                if position > 0 and spans[position - 1][1] > start:
+                    continue
+                if position < len(spans) and spans[position][0] < end:
+                    continue
+                starts.insert(position, start)
+                spans.insert(position, (start, end, rule))
+
+        if not spans:
+            return text
+        parts = []
+        last_end = 0
+        for start, end, rule in spans:
+            parts.append(text[last_end:start])
+            parts.append(standards[rule])
+            last_end = end
+        parts.append(text[last_end:])
+        return "".join(parts)
     
     def _prepare_text_for_matching(self, text: str) -> str:
         """
@@ -706,64 +809,54 @@ Please analyze and output JSON."""
             - count: Total mentions (exact + synonyms)
             - match_type: "exact" | "synonym:{matched_synonym}" | "none"
         """
-        text_lower = text.lower()
-        keyword_lower = keyword.lower()
+        return self._count_mentions_many([keyword], text)[0]
+
+    def _count_mentions_many(self, keywords: list[str], text: str) -> list[tuple[int, str]]:
+        """Batch form of `_count_mentions`, scanning the text once for all keywords."""
+        if not keywords:
+            return []
 
         # 1. Exact match (case-insensitive for most keywords)
-        if keyword in self.CASE_SENSITIVE_KEYWORDS:
-            pattern = re.compile(rf"(?<!\w){re.escape(keyword)}(?!\w)")
-            exact_count = len(pattern.findall(text))
-        else:
-            text_normalized = self._prepare_text_for_matching(text)
-            pattern = re.compile(rf"(?<!\w){re.escape(keyword_lower)}(?!\w)")
-            exact_count = len(pattern.findall(text_normalized))
-
-        if exact_count > 0:
-            return exact_count, "exact"
-
-        # 2. Synonym match (using SYNONYM_MAP)
-        # Build reverse mapping: standard form -> list of aliases
-        reverse_synonyms = {}
-        for alias, standard in self.SYNONYM_MAP.items():
-            if standard not in reverse_synonyms:
-                reverse_synonyms[standard] = []
-            reverse_synonyms[standard].append(alias)
-
-        synonyms = reverse_synonyms.get(keyword, [])
-        synonym_count = 0
-        matched_synonym = None
-
-        for synonym in synonyms:
-            synonym_lower = synonym.lower()
-            # Use word boundary regex for synonym matching
-            pattern = re.compile(rf"(?<!\w){re.escape(synonym_lower)}(?!\w)")
-            count = len(pattern.findall(text_lower))
-            if count > 0:
-                synonym_count += count
-                if matched_synonym is None:
-                    matched_synonym = synonym
+        index = _get_keyword_index(tuple(keywords), frozenset(self.CASE_SENSITIVE_KEYWORDS))
+        exact_counts = index.count(text, self._prepare_text_for_matching(text))
 
-        if synonym_count > 0:
-            return synonym_count, f"synonym:{matched_synonym}"
+        # 2. Synonym match (using SYNONYM_MAP), only needed for keywords without exact hits
+        synonym_automaton = _get_synonym_automaton(tuple(self.SYNONYM_MAP))
+        synonym_counts: list[int] = []
+        if not all(exact_counts):
+            synonym_counts = synonym_automaton.count(text.lower())
+        reverse_synonyms = _get_reverse_synonyms(tuple(self.SYNONYM_MAP.items()))
 
-        # 3. No match
-        return 0, "none"
+        results = []
+        for keyword, exact_count in zip(keywords, exact_counts):
+            if exact_count > 0:
+                results.append((exact_count, "exact"))
+                continue
+
+            synonym_count = 0
+            matched_synonym = None
+            for synonym in reverse_synonyms.get(keyword, []):
+                count = synonym_counts[synonym_automaton.pattern_id(synonym.lower())]
+                if count > 0:
+                    synonym_count += count
+                    if matched_synonym is None:
+                        matched_synonym = synonym
+
+            if synonym_count > 0:
+                results.append((synonym_count, f"synonym:{matched_synonym}"))
+            else:
+                # 3. No match
+                results.append((0, "none"))
+        return results
 
     def _extract_with_dictionary(self, text: str, keywords: list[str]) -> list[dict[str, Any]]:
         """Extract keywords using dictionary matching (Engine 1)"""
         text_normalized = self._normalize_synonyms(text)
         text_norm = self._prepare_text_for_matching(text_normalized)
 
+        index = _get_keyword_index(tuple(keywords), frozenset(self.CASE_SENSITIVE_KEYWORDS))
         results = []
-        for keyword in keywords:
-            if keyword in self.CASE_SENSITIVE_KEYWORDS:
-                pattern = re.compile(rf"(?<!\w){re.escape(keyword)}(?!\w)")
-                mentions = len(pattern.findall(text_normalized))
-            else:
-                kw_lower = keyword.lower()
-                pattern = re.compile(rf"(?<!\w){re.escape(kw_lower)}(?!\w)")
-                mentions = len(pattern.findall(text_norm))
-
+        for keyword, mentions in zip(keywords, index.count(text_normalized, text_norm)):
             if mentions > 0:
                 results.append({
                     "skill": keyword,
@@ -0,0 +1,134 @@
+"""Benchmark FixedRecursiveCharacterTextSplitter on large synthetic inputs.
+
+Compares the current splitter with the previous string-concatenation
+implementation and checks that both return the same chunks.
+
+    uv run python tests/benchmark_fixed_text_splitter.py --size-mb 50
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PLUGIN_ROOT))
+
+from tools.splitter.fixed_text_splitter import FixedRecursiveCharacterTextSplitter  # noqa: E402
+
+
+class LegacyFixedRecursiveCharacterTextSplitter(FixedRecursiveCharacterTextSplitter):
+    """The splitter as it was before chunks were sliced by offset."""
+
+    def _split_by_characters(self, text: str) -> list[str]:
+        splits = [s for s in text if s != "\n"]
+        s_lens = self._length_function(splits)
+        final_chunks = []
+        current_part = ""
+        current_length = 0
+        overlap_part = ""
+        overlap_part_length = 0
+        for s, s_len in zip(splits, s_lens):
+            if current_length + s_len <= self._chunk_size - self._chunk_overlap:
+                current_part += s
+                current_length += s_len
+            elif current_length + s_len <= self._chunk_size:
+                current_part += s
+                current_length += s_len
+                overlap_part += s
+                overlap_part_length += s_len
+            else:
+                final_chunks.append(current_part)
+                current_part = overlap_part + s
+                current_length = s_len + overlap_part_length
+                overlap_part = ""
+                overlap_part_length = 0
+        if current_part:
+            final_chunks.append(current_part)
+        return final_chunks
+
+    def _merge_splits(self, splits, separator, lengths):
+        separator_len = self._length_function([separator])[0]
+        docs = []
+        current_doc: list[str] = []
+        total = 0
+        for index, d in enumerate(splits):
+            _len = lengths[index]
+            if total + _len + (separator_len if len(current_doc) > 0 else 0) > self._chunk_size:
+                if len(current_doc) > 0:
+                    doc = self._join_docs(current_doc, separator)
+                    if doc is not None:
+                        docs.append(doc)
+                    while total > self._chunk_overlap or (
+                        total + _len + (separator_len if len(current_doc) > 0 else 0) > self._chunk_size and total > 0
+                    ):
+                        total -= self._length_function([current_doc[0]])[0] + (
+                            separator_len if len(current_doc) > 1 else 0
+                        )
+                        current_doc = current_doc[1:]
+            current_doc.append(d)
+            total += _len + (separator_len if len(current_doc) > 1 else 0)
+        doc = self._join_docs(current_doc, separator)
+        if doc is not None:
+            docs.append(doc)
+        return docs
+
+
+def make_splitter(cls, chunk_size: int = 1000, chunk_overlap: int = 100):
+    return cls.from_encoder(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        fixed_separator="\n\n\n",
+        separators=["\n\n", "。", ". ", " ", ""],
+    )
+
+
+def cjk_text(size: int, seed: int = 0) -> str:
+    """Text without any separator, which falls through to per-character splitting."""
+    rng = random.Random(seed)
+    return "".join(chr(rng.randint(0x4E00, 0x9FFF)) for _ in range(size))
+
+
+def word_text(size: int, seed: int = 0) -> str:
+    """Short words and no sentence breaks, which exercises _merge_splits."""
+    rng = random.Random(seed)
+    words = ["a", "to", "the", "chunk", "splitter", "data"]
+    parts = []
+    length = 0
+    while length < size:
+        word = rng.choice(words)
+        parts.append(word)
+        length += len(word) + 1
+    return " ".join(parts)
+
+
+def run(name: str, text: str, legacy: bool) -> None:
+    current = make_splitter(FixedRecursiveCharacterTextSplitter)
+    started = time.perf_counter()
+    chunks = current.split_text(text)
+    elapsed = time.perf_counter() - started
+    line = f"{name:<6} {len(text) / 1_000_000:8.1f}M chars  current {elapsed:7.2f}s"
+    if legacy:
+        reference = make_splitter(LegacyFixedRecursiveCharacterTextSplitter)
+        started = time.perf_counter()
+        expected = reference.split_text(text)
+        legacy_elapsed = time.perf_counter() - started
+        assert chunks == expected, f"{name}: chunks differ from the legacy splitter"
+        line += f"  legacy {legacy_elapsed:7.2f}s"
+    print(f"{line}  chunks {len(chunks)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=10, help="size of each synthetic input")
+    parser.add_argument("--skip-legacy", action="store_true", help="only time the current splitter")
+    args = parser.parse_args()
+
+    size = int(args.size_mb * 1_000_000)
+    run("cjk", cjk_text(size), legacy=not args.skip_legacy)
+    run("words", word_text(size), legacy=not args.skip_legacy)
+
+
+if __name__ == "__main__":
+    main()
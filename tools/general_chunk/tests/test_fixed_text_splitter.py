@@ -0,0 +1,88 @@
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PLUGIN_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from benchmark_fixed_text_splitter import (
+    LegacyFixedRecursiveCharacterTextSplitter,
+    cjk_text,
+    word_text,
+)
+from tools.splitter.fixed_text_splitter import FixedRecursiveCharacterTextSplitter
+
+
+def _weighted_length(texts: list[str]) -> list[int]:
+    return [sum(0 if c == "~" else 3 if ord(c) > 0x2FFF else 1 for c in text) for text in texts]
+
+
+class TestFixedRecursiveCharacterTextSplitter(unittest.TestCase):
+    def _assert_same_chunks(self, text: str, **kwargs) -> None:
+        for chunk_size, chunk_overlap in [(1, 0), (5, 2), (7, 7), (50, 10), (200, 0)]:
+            options = {
+                "chunk_size": chunk_size,
+                "chunk_overlap": chunk_overlap,
+                "fixed_separator": "\n\n\n",
+                "separators": ["\n\n", "。", ". ", " ", ""],
+                **kwargs,
+            }
+            with self.subTest(chunk_size=chunk_size, chunk_overlap=chunk_overlap):
+                self.assertEqual(
+                    FixedRecursiveCharacterTextSplitter.from_encoder(**options).split_text(text),
+                    LegacyFixedRecursiveCharacterTextSplitter.from_encoder(**options).split_text(text),
+                )
+
+    def test_text_without_separators_matches_legacy(self):
+        self._assert_same_chunks(cjk_text(2_000))
+
+    def test_text_with_newlines_only_matches_legacy(self):
+        rng = random.Random(1)
+        text = "".join(rng.choice("ab\n") for _ in range(1_000))
+        self._assert_same_chunks(text, separators=["。", ""])
+
+    def test_words_match_legacy(self):
+        self._assert_same_chunks(word_text(5_000))
+
+    def test_mixed_text_matches_legacy(self):
+        rng = random.Random(2)
+        pieces = ["段落", "\n\n", "。", ". ", " ", "\n", "word", cjk_text(40, seed=3)]
+        text = "".join(rng.choice(pieces) for _ in range(600))
+        self._assert_same_chunks(text)
+
+    def test_custom_length_function_matches_legacy(self):
+        rng = random.Random(4)
+        text = "".join(rng.choice(["~", "a", "中"]) for _ in range(3_000))
+        for chunk_size, chunk_overlap in [(2, 0), (5, 2), (40, 10)]:
+            options = {
+                "chunk_size": chunk_size,
+                "chunk_overlap": chunk_overlap,
+                "separators": [""],
+                "length_function": _weighted_length,
+            }
+            with self.subTest(chunk_size=chunk_size, chunk_overlap=chunk_overlap):
+                self.assertEqual(
+                    FixedRecursiveCharacterTextSplitter(**options).split_text(text),
+                    LegacyFixedRecursiveCharacterTextSplitter(**options).split_text(text),
+                )
+
+    def test_small_length_blocks_match_legacy(self):
+        with patch("tools.splitter.fixed_text_splitter._CHARACTER_BLOCK_SIZE", 7):
+            self._assert_same_chunks(cjk_text(500))
+
+    def test_chunks_are_bounded(self):
+        splitter = FixedRecursiveCharacterTextSplitter.from_encoder(
+            chunk_size=100, chunk_overlap=20, separators=[""]
+        )
+
+        chunks = splitter.split_text(cjk_text(10_000))
+
+        self.assertTrue(all(len(chunk) <= 100 for chunk in chunks))
+        self.assertEqual(chunks[0][-20:], chunks[1][:20])
+
+
+if __name__ == "__main__":
+    unittest.main()
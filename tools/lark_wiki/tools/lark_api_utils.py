@@ -1,4 +1,6 @@
 import json
+import threading
+import time
 from typing import Any, Optional, cast
 
 import httpx
@@ -6,6 +8,42 @@ import httpx
 from dify_plugin.errors.tool import ToolProviderCredentialValidationError
 
 
+# refresh cached tokens this long before the expiry reported by the API
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
+# shared connection pool, so consecutive API calls reuse keep-alive connections
+_http_client = httpx.Client(timeout=30)
+
+# (app_id, app_secret) -> (tenant_access_token, refresh deadline)
+_token_cache: dict[tuple[str, str], tuple[str, float]] = {}
+_token_refresh_locks: dict[tuple[str, str], threading.Lock] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _get_cached_token(key: tuple[str, str]) -> Optional[str]:
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached and time.monotonic() < cached[1]:
+        return cached[0]
+    return None
+
+
+def _token_refresh_lock(key: tuple[str, str]) -> threading.Lock:
+    with _token_cache_lock:
+        return _token_refresh_locks.setdefault(key, threading.Lock())
+
+
+def _store_token(key: tuple[str, str], token: Optional[str], expire: Any) -> None:
+    try:
+        ttl = int(expire) - TOKEN_REFRESH_MARGIN_SECONDS
+    except (TypeError, ValueError):
+        return
+    if not token or ttl <= 0:
+        return
+    with _token_cache_lock:
+        _token_cache[key] = (token, time.monotonic() + ttl)
+
+
 def lark_auth(credentials):
     app_id = credentials.get("app_id")
     app_secret = credentials.get("app_secret")
@@ -59,8 +97,19 @@ class LarkRequest:
 
     @property
     def tenant_access_token(self) -> str:
-        res = self.get_tenant_access_token(self.app_id, self.app_secret)
-        return res.get("tenant_access_token", "")
+        key = (self.app_id, self.app_secret)
+        token = _get_cached_token(key)
+        if token:
+            return token
+        # single-flight: concurrent callers wait for one refresh per app
+        with _token_refresh_lock(key):
+            token = _get_cached_token(key)
+            if token:
+                return token
+            res = self.get_tenant_access_token(self.app_id, self.app_secret)
+            token = res.get("tenant_access_token", "")
+            _store_token(key, token, res.get("expire"))
+            return token
 
     def _send_request(
         self,
@@ -76,7 +125,7 @@ class LarkRequest:
         }
         if require_token:
             headers["tenant-access-token"] = f"{self.tenant_access_token}"
-        res = httpx.request(method=method, url=url, headers=headers, json=payload, params=params, timeout=30).json()
+        res = _http_client.request(method=method, url=url, headers=headers, json=payload, params=params).json()
         if res.get("code") != 0:
             raise Exception(res)
         return res
@@ -0,0 +1,91 @@
+import io
+import json
+import os
+import sys
+import zipfile
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+PLUGIN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PLUGIN_DIR not in sys.path:
+    sys.path.insert(0, PLUGIN_DIR)
+
+from dify_plugin.entities.tool import ToolInvokeMessage  # noqa: E402
+import tools.parse as parse_module  # noqa: E402
+from tools.parse import MineruTool  # noqa: E402
+
+CONTENT_LIST = [{"type": "text", "text": "hello"}]
+
+
+def make_zip() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("doc.md", "# hello")
+        archive.writestr("layout.json", json.dumps({"pdf_info": []}))
+        archive.writestr("doc_content_list.json", json.dumps(CONTENT_LIST))
+    return buffer.getvalue()
+
+
+def patch_download(monkeypatch, data: bytes) -> None:
+    @contextmanager
+    def fake_stream(method, url):
+        response = MagicMock()
+        response.iter_bytes.return_value = [data]
+        yield response
+
+    monkeypatch.setattr(parse_module.httpx, "stream", fake_stream)
+
+
+def json_messages(messages):
+    return [m.message.json_object for m in messages if m.type == ToolInvokeMessage.MessageType.JSON]
+
+
+def test_single_file_content_list_is_not_tagged(monkeypatch):
+    patch_download(monkeypatch, make_zip())
+    tool = MineruTool.from_credentials({})
+
+    messages = list(tool._download_and_extract_zip("https://example.com/result.zip"))
+
+    assert json_messages(messages) == [{"content_list": [CONTENT_LIST]}]
+
+
+def test_batch_content_list_is_tagged_with_document_name(monkeypatch):
+    patch_download(monkeypatch, make_zip())
+    tool = MineruTool.from_credentials({})
+
+    messages = list(
+        tool._download_and_extract_zip("https://example.com/result.zip", "report.pdf", [])
+    )
+
+    assert json_messages(messages) == [{"file_name": "report.pdf", "content_list": [CONTENT_LIST]}]
+
+
+def test_local_v1_content_list_is_tagged_per_document(monkeypatch):
+    response = MagicMock(status_code=200)
+    response.json.return_value = {
+        "md_content": "# hello",
+        "content_list": CONTENT_LIST,
+        "images": {"fig.jpg": "data:image/jpeg;base64,"},
+    }
+    monkeypatch.setattr(parse_module, "post", lambda *args, **kwargs: response)
+    tool = MineruTool.from_credentials({})
+    monkeypatch.setattr(
+        tool, "_process_base64_image", lambda data, name: MagicMock(preview_url="https://x/" + name)
+    )
+    credentials = parse_module.Credentials(
+        base_url="http://localhost:8000", token=None, server_type="local"
+    )
+    files = [MagicMock(filename="a.pdf", blob=b"a"), MagicMock(filename="b.pdf", blob=b"b")]
+
+    single = list(tool._parse_local_v1_file(credentials, {}, files[0], []))
+    batch = [
+        m
+        for file in files
+        for m in tool._parse_local_v1_file(credentials, {}, file, [], file.filename)
+    ]
+
+    assert json_messages(single) == [{"content_list": CONTENT_LIST}]
+    assert json_messages(batch) == [
+        {"file_name": "a.pdf", "content_list": CONTENT_LIST},
+        {"file_name": "b.pdf", "content_list": CONTENT_LIST},
+    ]
@@ -3,9 +3,12 @@ import io
 import json
 import logging
 import os
+import re
+import tempfile
 import time
 import zipfile
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
@@ -31,6 +34,19 @@ SUPPORTED_EXTENSIONS = {
 }
 MAX_RETRIES = 50
 SUPPORTED_IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg"}
+# Adaptive polling of remote parse results: start fast, back off to the old fixed 5s pace and beyond
+POLL_INITIAL_INTERVAL = 1.0
+POLL_MAX_INTERVAL = 10.0
+POLL_BACKOFF = 1.5
+POLL_TIMEOUT = MAX_RETRIES * 5
+# Result archives larger than this are spooled to disk instead of memory
+ZIP_SPOOL_MAX_MEMORY = 32 * 1024 * 1024
+ZIP_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Images are uploaded to Dify by this many workers, in batches of IMAGE_UPLOAD_BATCH_SIZE
+IMAGE_UPLOAD_WORKERS = 8
+FILE_UPLOAD_WORKERS = 4
+IMAGE_UPLOAD_BATCH_SIZE = 32
+MD_IMAGE_PATH_PATTERN = re.compile(r"images/([^\s()\[\]<>\"']+)")
 
 
 @dataclass
@@ -145,7 +161,7 @@ class MineruTool(Tool):
     def _parse_local_v1(
         self, credentials: Credentials, tool_parameters: Dict[str, Any]
     ) -> Generator[ToolInvokeMessage, None, None]:
-        """Parse local file by v1 api"""
+        """Parse local files by v1 api, which takes one file per request"""
         params = {
             "parse_method": tool_parameters.get("parse_method", "auto"),
             "return_layout": False,
@@ -154,11 +170,21 @@ class MineruTool(Tool):
             "return_images": True,
         }
 
-        file = tool_parameters.get("file")
-        if not file:
-            logger.error("No file provided for file parsing")
-            raise ValueError("File is required")
+        files = self._get_files(tool_parameters)
+        images: List[UploadFileResponse] = []
+        for file in files:
+            yield from self._parse_local_v1_file(
+                credentials, params, file, images, file.filename if len(files) > 1 else None
+            )
 
+    def _parse_local_v1_file(
+        self,
+        credentials: Credentials,
+        params: Dict[str, Any],
+        file: Any,
+        all_images: List[UploadFileResponse],
+        file_name: Optional[str] = None,
+    ) -> Generator[ToolInvokeMessage, None, None]:
         headers = self._get_headers(credentials)
         task_url = self._build_api_url(credentials.base_url, "file_parse")
         file_data = {"file": (file.filename, file.blob)}
@@ -184,22 +210,23 @@ class MineruTool(Tool):
         file_obj = response_json.get("images", {})
 
         images = []
-        for file_name, encoded_image_data in file_obj.items():
+        for img_name, encoded_image_data in file_obj.items():
             try:
-                file_res = self._process_base64_image(encoded_image_data, file_name)
+                file_res = self._process_base64_image(encoded_image_data, img_name)
                 images.append(file_res)
                 if not file_res.preview_url:
                     yield self.create_blob_message(
                         base64.b64decode(encoded_image_data.split(",")[1]),
-                        meta={"filename": file_name, "mime_type": "image/jpeg"},
+                        meta={"filename": img_name, "mime_type": "image/jpeg"},
                     )
             except Exception as e:
-                logger.error(f"Failed to process image {file_name}: {e}")
+                logger.error(f"Failed to process image {img_name}: {e}")
 
         md_content = self._replace_md_img_path(md_content, images)
-        yield self.create_variable_message("images", images)
+        all_images.extend(images)
+        yield self.create_variable_message("images", list(all_images))
         yield self.create_text_message(md_content)
-        yield self.create_json_message({"content_list": content_list})
+        yield self.create_json_message(self._content_list_message(content_list, file_name))
 
     def _parse_local_v2(
         self, credentials: Credentials, tool_parameters: Dict[str, Any]
@@ -231,10 +258,9 @@ class MineruTool(Tool):
             "return_middle_json": False,
         }
 
-        file = tool_parameters.get("file")
         headers = self._get_headers(credentials)
         task_url = self._build_api_url(credentials.base_url, "file_parse")
-        file_data = [("files", (file.filename, file.blob))]
+        file_data = [("files", (file.filename, file.blob)) for file in self._get_files(tool_parameters)]
 
         try:
             response = post(task_url, headers=headers, data=body, files=file_data)
@@ -255,6 +281,7 @@ class MineruTool(Tool):
         response_json = response.json()
         results = response_json.get("results", {})
 
+        all_images: List[UploadFileResponse] = []
         for file_name, result in results.items():
             result_item = {"filename": file_name}
 
@@ -275,12 +302,17 @@ class MineruTool(Tool):
                     except Exception as e:
                         logger.error(f"Failed to process image {img_name}: {e}")
 
-            yield self.create_variable_message("images", result_item["images"])
+            all_images.extend(result_item["images"])
+            yield self.create_variable_message("images", list(all_images))
 
             if result.get("content_list"):
                 try:
                     result_item["content_list"] = json.loads(result["content_list"])
-                    yield self.create_json_message({"content_list": result_item["content_list"]})
+                    yield self.create_json_message(
+                        self._content_list_message(
+                            result_item["content_list"], file_name if len(results) > 1 else None
+                        )
+                    )
                 except json.JSONDecodeError as e:
                     logger.error(f"Failed to parse content_list JSON: {e}")
 
@@ -314,28 +346,30 @@ class MineruTool(Tool):
     def _parser_file_local(
         self, credentials: Credentials, tool_parameters: Dict[str, Any]
     ) -> Generator[ToolInvokeMessage, None, None]:
+        self._get_files(tool_parameters)
+
+        yield from self._parse_local_v2(credentials, tool_parameters)
+
+    def _get_files(self, tool_parameters: Dict[str, Any]) -> List[Any]:
+        """The main file followed by any additional files, all validated."""
         file = tool_parameters.get("file", None)
         if not file:
             logger.error("No file provided for file parsing")
             raise ValueError("File is required")
 
-        self._validate_file_type(file.filename)
-
-        yield from self._parse_local_v2(credentials, tool_parameters)
+        files = [file, *(tool_parameters.get("files") or [])]
+        for item in files:
+            self._validate_file_type(item.filename)
+        return files
 
     def _parser_file_remote(
         self, credentials: Credentials, tool_parameters: Dict[str, Any]
     ) -> Generator[ToolInvokeMessage, None, None]:
-        file = tool_parameters.get("file", None)
-        if not file:
-            logger.error("No file provided for file parsing")
-            raise ValueError("File is required")
-
-        self._validate_file_type(file.filename)
+        files = self._get_files(tool_parameters)
 
         header = self._get_headers(credentials)
 
-        # Create parsing task
+        # Create one parsing task for the whole batch, data_id maps results back to files
         data = {
             "enable_formula": tool_parameters.get("enable_formula", True),
             "enable_table": tool_parameters.get("enable_table", True),
@@ -346,7 +380,9 @@ class MineruTool(Tool):
                 {
                     "name": file.filename,
                     "is_ocr": tool_parameters.get("enable_ocr", False),
+                    "data_id": str(index),
                 }
+                for index, file in enumerate(files)
             ],
         }
 
@@ -364,19 +400,21 @@ class MineruTool(Tool):
 
         result = response.json()
 
-        if result["code"] == 0:
-            logger.info(f"Apply upload url success, result:{result}")
-            batch_id = result["data"]["batch_id"]
-            urls = result["data"]["file_urls"]
+        if result["code"] != 0:
+            logger.error(f'Apply upload url failed, reason:{result.get("msg", "Unknown error")}')
+            raise Exception(f'Apply upload url failed, reason:{result.get("msg", "Unknown error")}')
 
-            res_upload = put(urls[0], data=file.blob)
-            if res_upload.status_code == 200:
-                logger.info(f"{urls[0]} upload success")
-            else:
-                logger.error(f"{urls[0]} upload failed")
-                raise Exception(f"{urls[0]} upload failed")
+        logger.info(f"Apply upload url success, result:{result}")
+        batch_id = result["data"]["batch_id"]
+        urls = result["data"]["file_urls"]
+
+        self._upload_files(files, urls)
 
-            extract_result = self._poll_get_parse_result(credentials, batch_id)
+        if len(files) == 1:
+            extract_result = next(self._poll_parse_results(credentials, batch_id, 1))
+            if extract_result.get("state") == "failed":
+                err_msg = extract_result.get("err_msg", "Unknown error")
+                raise Exception(f"Parse failed, reason: {err_msg}")
 
             full_zip_url = extract_result.get("full_zip_url")
             if full_zip_url:
@@ -385,16 +423,75 @@ class MineruTool(Tool):
             else:
                 logger.error("No zip URL found in parse result")
                 raise Exception("No zip URL found in parse result")
-        else:
-            logger.error(f'Apply upload url failed, reason:{result.get("msg", "Unknown error")}')
-            raise Exception(f'Apply upload url failed, reason:{result.get("msg", "Unknown error")}')
+            return
+
+        # Several files: hand out each document as soon as MinerU finishes it
+        full_zip_urls: List[Optional[str]] = [None] * len(files)
+        all_images: List[UploadFileResponse] = []
+        for extract_result in self._poll_parse_results(credentials, batch_id, len(files)):
+            index = self._result_index(extract_result, files)
+            file_name = extract_result.get("file_name") or files[index].filename
+            if extract_result.get("state") == "failed":
+                err_msg = extract_result.get("err_msg", "Unknown error")
+                yield self.create_text_message(f"Failed to parse {file_name}, reason: {err_msg}")
+                continue
 
-    def _poll_get_parse_result(self, credentials: Credentials, batch_id: str) -> Dict[str, Any]:
-        """poll get parser result."""
+            full_zip_url = extract_result.get("full_zip_url")
+            if not full_zip_url:
+                logger.error(f"No zip URL found in parse result of {file_name}")
+                yield self.create_text_message(f"Failed to parse {file_name}, reason: no zip URL in parse result")
+                continue
+            full_zip_urls[index] = full_zip_url
+            yield from self._download_and_extract_zip(full_zip_url, file_name, all_images)
+
+        yield self.create_variable_message("full_zip_url", full_zip_urls[0] or "")
+        yield self.create_variable_message("full_zip_urls", full_zip_urls)
+
+    def _upload_files(self, files: List[Any], urls: List[str]) -> None:
+        """PUT every file to its presigned URL, in parallel."""
+
+        def _upload(item) -> None:
+            file, url = item
+            res_upload = put(url, data=file.blob)
+            if res_upload.status_code == 200:
+                logger.info(f"{url} upload success")
+            else:
+                logger.error(f"{url} upload failed")
+                raise Exception(f"{url} upload failed")
+
+        with ThreadPoolExecutor(max_workers=min(FILE_UPLOAD_WORKERS, len(files))) as executor:
+            list(executor.map(_upload, zip(files, urls)))
+
+    @staticmethod
+    def _result_index(extract_result: Dict[str, Any], files: List[Any]) -> int:
+        """Position of the input file an extract result belongs to."""
+        data_id = extract_result.get("data_id")
+        if data_id is not None and str(data_id).isdigit() and int(data_id) < len(files):
+            return int(data_id)
+        file_name = extract_result.get("file_name")
+        for index, file in enumerate(files):
+            if file.filename == file_name:
+                return index
+        return 0
+
+    def _poll_parse_results(
+        self, credentials: Credentials, batch_id: str, expected: int
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Poll a batch, yielding each extract result once it is done or failed.
+
+        The batch gets POLL_TIMEOUT per file; time the caller spends handling a
+        yielded result does not count against it.
+        """
         url = self._build_api_url(credentials.base_url, f"api/v4/extract-results/batch/{batch_id}")
         headers = self._get_headers(credentials)
 
-        for attempt in range(MAX_RETRIES):
+        reported = set()
+        deadline = time.monotonic() + POLL_TIMEOUT * max(expected, 1)
+        interval = POLL_INITIAL_INTERVAL
+        attempt = 0
+        while True:
+            attempt += 1
+            last_attempt = time.monotonic() + interval > deadline
             try:
                 response = get(url, headers=headers)
                 if response.status_code == 200:
@@ -403,65 +500,140 @@ class MineruTool(Tool):
 
                     if not extract_results:
                         logger.warning("No extract results found")
-                        continue
-
-                    extract_result = extract_results[0]
-                    state = extract_result.get("state")
-
-                    if state == "done":
-                        logger.info("Parse completed successfully")
-                        return extract_result
-                    elif state == "failed":
-                        err_msg = extract_result.get("err_msg", "Unknown error")
-                        logger.error(f"Parse failed, reason: {err_msg}")
-                        raise Exception(f"Parse failed, reason: {err_msg}")
-                    else:
-                        logger.info(f"Parse in progress, state: {state}")
+                    for position, extract_result in enumerate(extract_results):
+                        key = extract_result.get("data_id") or extract_result.get("file_name") or position
+                        state = extract_result.get("state")
+                        if key in reported:
+                            continue
+                        if state == "done":
+                            logger.info(f"Parse of {extract_result.get('file_name')} completed successfully")
+                        elif state == "failed":
+                            logger.error(f"Parse failed, reason: {extract_result.get('err_msg', 'Unknown error')}")
+                        else:
+                            logger.info(f"Parse in progress, state: {state}")
+                            continue
+                        reported.add(key)
+                        suspended_at = time.monotonic()
+                        yield extract_result
+                        deadline += time.monotonic() - suspended_at
+                    if len(reported) >= expected:
+                        return
                 else:
                     logger.warning(f"Failed to get parse result, status: {response.status_code}")
-                    if attempt == MAX_RETRIES - 1:
+                    if last_attempt:
                         raise Exception(f"Failed to get parse result, status: {response.status_code}")
             except Exception as e:
-                if attempt == MAX_RETRIES - 1:
+                if last_attempt:
                     raise e
-                logger.warning(f"Poll attempt {attempt + 1} failed: {e}")
+                logger.warning(f"Poll attempt {attempt} failed: {e}")
 
-            time.sleep(5)
+            if time.monotonic() + interval > deadline:
+                break
+            time.sleep(interval)
+            interval = min(interval * POLL_BACKOFF, POLL_MAX_INTERVAL)
 
         logger.error("Polling timeout reached without getting completed result")
         raise TimeoutError("Parse operation timed out")
 
-    def _download_and_extract_zip(self, url: str) -> Generator[ToolInvokeMessage, None, None]:
-        """Download and extract zip file from URL."""
-        try:
-            response = httpx.get(url)
-            response.raise_for_status()
-        except Exception as e:
-            logger.error(f"Failed to download zip file: {e}")
-            raise Exception(f"Failed to download zip file: {e}")
+    def _download_and_extract_zip(
+        self,
+        url: str,
+        file_name: Optional[str] = None,
+        all_images: Optional[List[UploadFileResponse]] = None,
+    ) -> Generator[ToolInvokeMessage, None, None]:
+        """Download zip file from URL into a spooled temp file and extract it.
+
+        For batches, `file_name` tags the document's content_list and the images
+        variable carries `all_images`, the images of every document so far.
+        """
+        with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_MEMORY) as archive:
+            try:
+                with httpx.stream("GET", url) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_bytes(ZIP_DOWNLOAD_CHUNK_SIZE):
+                        archive.write(chunk)
+            except Exception as e:
+                logger.error(f"Failed to download zip file: {e}")
+                raise Exception(f"Failed to download zip file: {e}")
+            archive.seek(0)
 
-        content = ZipContent()
+            content = ZipContent()
 
-        try:
-            with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
-                for file_info in zip_file.infolist():
-                    if file_info.is_dir():
-                        continue
-
-                    file_name = file_info.filename.lower()
-                    with zip_file.open(file_info) as f:
-                        yield from self._process_zip_file(f, file_info, file_name, content)
-        except zipfile.BadZipFile as e:
-            logger.error(f"Invalid zip file: {e}")
-            raise Exception(f"Invalid zip file: {e}")
-        except Exception as e:
-            logger.error(f"Failed to extract zip file: {e}")
-            raise Exception(f"Failed to extract zip file: {e}")
+            try:
+                with zipfile.ZipFile(archive) as zip_file, ThreadPoolExecutor(
+                    max_workers=IMAGE_UPLOAD_WORKERS
+                ) as executor:
+                    pending_images: list[zipfile.ZipInfo] = []
+                    for file_info in zip_file.infolist():
+                        if file_info.is_dir():
+                            continue
+
+                        entry_name = file_info.filename.lower()
+                        if entry_name.startswith("images/") and entry_name.endswith(tuple(SUPPORTED_IMAGE_EXTENSIONS)):
+                            pending_images.append(file_info)
+                            if len(pending_images) >= IMAGE_UPLOAD_BATCH_SIZE:
+                                yield from self._upload_zip_images(zip_file, pending_images, executor, content)
+                                pending_images = []
+                            continue
+
+                        with zip_file.open(file_info) as f:
+                            yield from self._process_zip_file(f, file_info, entry_name, content)
+                    yield from self._upload_zip_images(zip_file, pending_images, executor, content)
+            except zipfile.BadZipFile as e:
+                logger.error(f"Invalid zip file: {e}")
+                raise Exception(f"Invalid zip file: {e}")
+            except Exception as e:
+                logger.error(f"Failed to extract zip file: {e}")
+                raise Exception(f"Failed to extract zip file: {e}")
 
-        yield self.create_json_message({"content_list": content.content_list})
+        yield self.create_json_message(self._content_list_message(content.content_list, file_name))
         content.md_content = self._replace_md_img_path(content.md_content, content.images)
         yield self.create_text_message(content.md_content)
-        yield self.create_variable_message("images", content.images)
+        if all_images is None:
+            yield self.create_variable_message("images", content.images)
+        else:
+            all_images.extend(content.images)
+            yield self.create_variable_message("images", list(all_images))
+
+    @staticmethod
+    def _content_list_message(content_list: Any, file_name: Optional[str] = None) -> Dict[str, Any]:
+        """content_list JSON message, tagged with its document when parsing a batch."""
+        if file_name is None:
+            return {"content_list": content_list}
+        return {"file_name": file_name, "content_list": content_list}
+
+    def _upload_zip_images(
+        self,
+        zip_file: zipfile.ZipFile,
+        file_infos: List[zipfile.ZipInfo],
+        executor: ThreadPoolExecutor,
+        content: ZipContent,
+    ) -> Generator[ToolInvokeMessage, None, None]:
+        """Upload a batch of images from the ZIP archive concurrently, keeping archive order."""
+        if not file_infos:
+            return
+
+        # bytes are read up front, so at most one batch of images is held in memory
+        images = [(file_info, zip_file.read(file_info)) for file_info in file_infos]
+
+        def _upload(item) -> Optional[UploadFileResponse]:
+            file_info, image_bytes = item
+            try:
+                return self._process_image(image_bytes, file_info)
+            except Exception as e:
+                logger.error(f"Failed to process file {file_info.filename.lower()}: {e}")
+                return None
+
+        for (file_info, image_bytes), upload_file_res in zip(images, executor.map(_upload, images)):
+            if upload_file_res is None:
+                continue
+            content.images.append(upload_file_res)
+            if not upload_file_res.preview_url:
+                base_name = os.path.basename(file_info.filename)
+                yield self.create_blob_message(
+                    image_bytes,
+                    meta={"filename": base_name, "mime_type": "image/jpeg"},
+                )
 
     def _process_zip_file(
         self, f, file_info: zipfile.ZipInfo, file_name: str, content: ZipContent
@@ -519,11 +691,13 @@ class MineruTool(Tool):
 
     @staticmethod
     def _replace_md_img_path(md_content: str, images: List[UploadFileResponse]) -> str:
-        """Replace image path in Markdown."""
-        for image in images:
-            if image.preview_url:
-                md_content = md_content.replace(f"images/{image.name}", image.preview_url)
-        return md_content
+        """Replace image path in Markdown in a single pass."""
+        preview_urls = {image.name: image.preview_url for image in images if image.preview_url}
+        if not preview_urls:
+            return md_content
+        return MD_IMAGE_PATH_PATTERN.sub(
+            lambda match: preview_urls.get(match.group(1), match.group(0)), md_content
+        )
 
     @staticmethod
     def _validate_file_type(filename: str) -> str:
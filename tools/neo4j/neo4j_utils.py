@@ -1,9 +1,27 @@
+import hashlib
+import threading
+import time
 from typing import Any
 from neo4j import GraphDatabase
 from neo4j.graph import Node, Relationship, Path
 from neo4j.time import DateTime, Date, Time, Duration
 from neo4j.spatial import Point
 
+# Drivers unused for this long are closed on the next cache access
+DRIVER_IDLE_TIMEOUT = 600
+# Cached drivers are re-verified when last checked longer ago than this
+DRIVER_HEALTH_CHECK_INTERVAL = 60
+# Schema introspection results are reused for this long, unless a write invalidates them
+SCHEMA_CACHE_TTL = 300
+
+# (uri, username) -> {"driver", "password_hash", "last_used", "last_verified"}
+_drivers: dict[tuple[str, str], dict[str, Any]] = {}
+_drivers_lock = threading.Lock()
+
+# (uri, username) -> (expires_at, password hash, schema)
+_schema_cache: dict[tuple[str, str], tuple[float, str, dict[str, Any]]] = {}
+_schema_cache_lock = threading.Lock()
+
 
 class Neo4jUtils:
     """Utility class for Neo4j database operations."""
@@ -85,6 +103,91 @@ class Neo4jUtils:
         """
         return GraphDatabase.driver(uri, auth=(username, password))
 
+    @staticmethod
+    def get_cached_driver(uri: str, username: str, password: str):
+        """
+        Get a process-level Neo4j driver, reusing its connection pool and routing table.
+
+        Drivers are keyed by uri and username, replaced when the password changes or a
+        periodic connectivity check fails, and closed after being idle too long.
+        The returned driver must not be closed by the caller.
+
+        Args:
+            uri: Neo4j connection URI
+            username: Neo4j username
+            password: Neo4j password
+
+        Returns:
+            Neo4j driver instance
+        """
+        key = (uri, username)
+        password_hash = hashlib.sha256(password.encode("utf-8")).hexdigest()
+        now = time.monotonic()
+        stale = []
+        with _drivers_lock:
+            for other_key, other in list(_drivers.items()):
+                if other_key != key and now - other["last_used"] > DRIVER_IDLE_TIMEOUT:
+                    stale.append(_drivers.pop(other_key)["driver"])
+
+            entry = _drivers.get(key)
+            if entry and (entry["password_hash"] != password_hash or now - entry["last_used"] > DRIVER_IDLE_TIMEOUT):
+                stale.append(_drivers.pop(key)["driver"])
+                entry = None
+            if entry is None:
+                entry = {
+                    "driver": Neo4jUtils.get_driver(uri, username, password),
+                    "password_hash": password_hash,
+                    "last_verified": now,
+                }
+                _drivers[key] = entry
+            entry["last_used"] = now
+            driver = entry["driver"]
+            needs_check = now - entry["last_verified"] > DRIVER_HEALTH_CHECK_INTERVAL
+
+        for stale_driver in stale:
+            try:
+                stale_driver.close()
+            except Exception:
+                pass
+
+        if needs_check:
+            try:
+                driver.verify_connectivity()
+                entry["last_verified"] = time.monotonic()
+            except Exception:
+                Neo4jUtils.close_driver(uri, username)
+                return Neo4jUtils.get_cached_driver(uri, username, password)
+        return driver
+
+    @staticmethod
+    def close_driver(uri: str, username: str) -> None:
+        """
+        Close and forget the cached driver for uri and username, if any.
+
+        Args:
+            uri: Neo4j connection URI
+            username: Neo4j username
+        """
+        with _drivers_lock:
+            entry = _drivers.pop((uri, username), None)
+        if entry:
+            try:
+                entry["driver"].close()
+            except Exception:
+                pass
+
+    @staticmethod
+    def invalidate_schema(uri: str, username: str) -> None:
+        """
+        Drop the cached schema for uri and username, e.g. after a write query.
+
+        Args:
+            uri: Neo4j connection URI
+            username: Neo4j username
+        """
+        with _schema_cache_lock:
+            _schema_cache.pop((uri, username), None)
+
     @staticmethod
     def verify_connectivity(uri: str, username: str, password: str) -> bool:
         """
@@ -119,50 +222,61 @@ class Neo4jUtils:
             password: Neo4j password
 
         Returns:
-            Dictionary containing schema information
+            Dictionary containing schema information, cached for SCHEMA_CACHE_TTL seconds
         """
-        driver = Neo4jUtils.get_driver(uri, username, password)
-        try:
-            with driver.session() as session:
-                # Get node labels
-                labels_result = session.run("CALL db.labels()")
-                labels = [record["label"] for record in labels_result]
-
-                # Get relationship types
-                rel_types_result = session.run("CALL db.relationshipTypes()")
-                relationship_types = [record["relationshipType"] for record in rel_types_result]
-
-                # Get property keys
-                property_keys_result = session.run("CALL db.propertyKeys()")
-                property_keys = [record["propertyKey"] for record in property_keys_result]
-
-                # Get constraints
-                constraints = []
-                try:
-                    constraints_result = session.run("SHOW CONSTRAINTS")
-                    constraints = [dict(record) for record in constraints_result]
-                except Exception:
-                    # Older Neo4j versions may not support SHOW CONSTRAINTS
-                    pass
-
-                # Get indexes
-                indexes = []
-                try:
-                    indexes_result = session.run("SHOW INDEXES")
-                    indexes = [dict(record) for record in indexes_result]
-                except Exception:
-                    # Older Neo4j versions may not support SHOW INDEXES
-                    pass
-
-                return Neo4jUtils.convert_neo4j_types({
-                    "labels": labels,
-                    "relationship_types": relationship_types,
-                    "property_keys": property_keys,
-                    "constraints": constraints,
-                    "indexes": indexes
-                })
-        finally:
-            driver.close()
+        key = (uri, username)
+        password_hash = hashlib.sha256(password.encode("utf-8")).hexdigest()
+        with _schema_cache_lock:
+            cached = _schema_cache.get(key)
+        if cached and cached[0] > time.monotonic() and cached[1] == password_hash:
+            return cached[2]
+
+        schema = Neo4jUtils._fetch_schema(Neo4jUtils.get_cached_driver(uri, username, password))
+        with _schema_cache_lock:
+            _schema_cache[key] = (time.monotonic() + SCHEMA_CACHE_TTL, password_hash, schema)
+        return schema
+
+    @staticmethod
+    def _fetch_schema(driver) -> dict[str, Any]:
+        """Run the schema introspection procedures on the given driver."""
+        with driver.session() as session:
+            # Get node labels
+            labels_result = session.run("CALL db.labels()")
+            labels = [record["label"] for record in labels_result]
+
+            # Get relationship types
+            rel_types_result = session.run("CALL db.relationshipTypes()")
+            relationship_types = [record["relationshipType"] for record in rel_types_result]
+
+            # Get property keys
+            property_keys_result = session.run("CALL db.propertyKeys()")
+            property_keys = [record["propertyKey"] for record in property_keys_result]
+
+            # Get constraints
+            constraints = []
+            try:
+                constraints_result = session.run("SHOW CONSTRAINTS")
+                constraints = [dict(record) for record in constraints_result]
+            except Exception:
+                # Older Neo4j versions may not support SHOW CONSTRAINTS
+                pass
+
+            # Get indexes
+            indexes = []
+            try:
+                indexes_result = session.run("SHOW INDEXES")
+                indexes = [dict(record) for record in indexes_result]
+            except Exception:
+                # Older Neo4j versions may not support SHOW INDEXES
+                pass
+
+            return Neo4jUtils.convert_neo4j_types({
+                "labels": labels,
+                "relationship_types": relationship_types,
+                "property_keys": property_keys,
+                "constraints": constraints,
+                "indexes": indexes
+            })
 
     @staticmethod
     def execute_read_cypher(uri: str, username: str, password: str, query: str,
@@ -180,15 +294,12 @@ class Neo4jUtils:
         Returns:
             List of result records as dictionaries
         """
-        driver = Neo4jUtils.get_driver(uri, username, password)
-        try:
-            with driver.session() as session:
-                result = session.execute_read(
-                    lambda tx: list(tx.run(query, parameters or {}).data())
-                )
-                return Neo4jUtils.convert_neo4j_types(result)
-        finally:
-            driver.close()
+        driver = Neo4jUtils.get_cached_driver(uri, username, password)
+        with driver.session() as session:
+            result = session.execute_read(
+                lambda tx: list(tx.run(query, parameters or {}).data())
+            )
+            return Neo4jUtils.convert_neo4j_types(result)
 
     @staticmethod
     def execute_write_cypher(uri: str, username: str, password: str, query: str,
@@ -206,34 +317,33 @@ class Neo4jUtils:
         Returns:
             Dictionary containing query results and statistics
         """
-        driver = Neo4jUtils.get_driver(uri, username, password)
-        try:
-            with driver.session() as session:
-                def write_transaction(tx):
-                    result = tx.run(query, parameters or {})
-                    data = list(result.data())
-                    summary = result.consume()
-                    counters = summary.counters
-                    return {
-                        "data": Neo4jUtils.convert_neo4j_types(data),
-                        "statistics": {
-                            "nodes_created": counters.nodes_created,
-                            "nodes_deleted": counters.nodes_deleted,
-                            "relationships_created": counters.relationships_created,
-                            "relationships_deleted": counters.relationships_deleted,
-                            "properties_set": counters.properties_set,
-                            "labels_added": counters.labels_added,
-                            "labels_removed": counters.labels_removed,
-                            "indexes_added": counters.indexes_added,
-                            "indexes_removed": counters.indexes_removed,
-                            "constraints_added": counters.constraints_added,
-                            "constraints_removed": counters.constraints_removed
-                        }
+        driver = Neo4jUtils.get_cached_driver(uri, username, password)
+        with driver.session() as session:
+            def write_transaction(tx):
+                result = tx.run(query, parameters or {})
+                data = list(result.data())
+                summary = result.consume()
+                counters = summary.counters
+                return {
+                    "data": Neo4jUtils.convert_neo4j_types(data),
+                    "statistics": {
+                        "nodes_created": counters.nodes_created,
+                        "nodes_deleted": counters.nodes_deleted,
+                        "relationships_created": counters.relationships_created,
+                        "relationships_deleted": counters.relationships_deleted,
+                        "properties_set": counters.properties_set,
+                        "labels_added": counters.labels_added,
+                        "labels_removed": counters.labels_removed,
+                        "indexes_added": counters.indexes_added,
+                        "indexes_removed": counters.indexes_removed,
+                        "constraints_added": counters.constraints_added,
+                        "constraints_removed": counters.constraints_removed
                     }
-                result = session.execute_write(write_transaction)
-                return result
-        finally:
-            driver.close()
+                }
+            result = session.execute_write(write_transaction)
+        # labels, relationship types, properties, indexes or constraints may have changed
+        Neo4jUtils.invalidate_schema(uri, username)
+        return result
 
     @staticmethod
     def list_gds_procedures(uri: str, username: str, password: str) -> list[dict[str, Any]]:
@@ -248,26 +358,23 @@ class Neo4jUtils:
         Returns:
             List of GDS procedures with their descriptions
         """
-        driver = Neo4jUtils.get_driver(uri, username, password)
-        try:
-            with driver.session() as session:
-                # Check if GDS is available
-                try:
-                    result = session.run("""
-                        CALL dbms.procedures()
-                        YIELD name, description, signature, mode
-                        WHERE name STARTS WITH 'gds.'
-                        RETURN name, description, signature, mode
-                        ORDER BY name
-                    """)
-                    procedures = [dict(record) for record in result]
-                    return Neo4jUtils.convert_neo4j_types(procedures)
-                except Exception as e:
-                    if "gds" in str(e).lower() or "procedure" in str(e).lower():
-                        return []
-                    raise
-        finally:
-            driver.close()
+        driver = Neo4jUtils.get_cached_driver(uri, username, password)
+        with driver.session() as session:
+            # Check if GDS is available
+            try:
+                result = session.run("""
+                    CALL dbms.procedures()
+                    YIELD name, description, signature, mode
+                    WHERE name STARTS WITH 'gds.'
+                    RETURN name, description, signature, mode
+                    ORDER BY name
+                """)
+                procedures = [dict(record) for record in result]
+                return Neo4jUtils.convert_neo4j_types(procedures)
+            except Exception as e:
+                if "gds" in str(e).lower() or "procedure" in str(e).lower():
+                    return []
+                raise
 
     @staticmethod
     def is_read_only_query(query: str) -> bool:
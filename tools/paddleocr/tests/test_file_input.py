@@ -26,6 +26,7 @@ from tools.utils import (  # noqa: E402
     _parse_doc_parsing_result,
     _submit_job,
     iter_docx_exports,
+    iter_paddleocr_api_results,
     normalize_file_input,
 )
 
@@ -278,6 +279,94 @@ def test_malformed_docx_export_warns_and_does_not_fail():
     warning_logger.warning.assert_called_once()
 
 
+def test_batch_results_are_yielded_in_completion_order(monkeypatch):
+    import tools.utils as utils_module
+
+    submitted = []
+    polls = {"job-a": ["running", "done"], "job-b": ["done"], "job-c": ["failed"]}
+
+    def fake_submit(model, file_url, file_path, options, base_url, headers, page_ranges=None):
+        submitted.append((file_url, file_path, page_ranges))
+        return {"a.pdf": "job-a", "b.pdf": "job-b", "c.pdf": "job-c"}[file_url or file_path]
+
+    def fake_check(job_id, base_url, headers):
+        state = polls[job_id].pop(0)
+        if state == "failed":
+            raise RuntimeError(f"Job {job_id} failed")
+        return state, {"job_id": job_id}
+
+    def fake_fetch(data):
+        return [
+            {
+                "result": {
+                    "layoutParsingResults": [
+                        {"markdown": {"text": data["job_id"], "images": {}}, "outputImages": {}}
+                    ]
+                }
+            }
+        ]
+
+    monkeypatch.setattr(utils_module, "_submit_job", fake_submit)
+    monkeypatch.setattr(utils_module, "_check_job", fake_check)
+    monkeypatch.setattr(utils_module, "_fetch_job_result", fake_fetch)
+    monkeypatch.setattr(utils_module.time, "sleep", lambda seconds: None)
+
+    results = list(
+        iter_paddleocr_api_results(
+            model="PP-StructureV3",
+            file_inputs=[("a.pdf", None), (None, "b.pdf"), ("c.pdf", None)],
+            options={},
+            client_config={"base_url": "https://example.com", "headers": {}},
+            is_document_parsing=True,
+            page_ranges="1-2",
+        )
+    )
+
+    assert set(submitted) == {("a.pdf", None, "1-2"), (None, "b.pdf", "1-2"), ("c.pdf", None, "1-2")}
+    assert [index for index, _ in results] == [1, 2, 0]
+    assert results[0][1]["job_id"] == "job-b"
+    assert isinstance(results[1][1], RuntimeError)
+    assert results[2][1]["pages"][0]["markdown_text"] == "job-a"
+
+
+def test_batch_deadline_pauses_while_caller_handles_a_result(monkeypatch):
+    import tools.utils as utils_module
+
+    clock = [0.0]
+    polls = {"job-a": ["done"], "job-b": ["running", "done"]}
+
+    def fake_submit(model, file_url, file_path, options, base_url, headers, page_ranges=None):
+        return {"a.pdf": "job-a", "b.pdf": "job-b"}[file_url]
+
+    def fake_check(job_id, base_url, headers):
+        return polls[job_id].pop(0), {"job_id": job_id}
+
+    def fake_sleep(seconds):
+        clock[0] += seconds
+
+    monkeypatch.setattr(utils_module, "_submit_job", fake_submit)
+    monkeypatch.setattr(utils_module, "_check_job", fake_check)
+    monkeypatch.setattr(utils_module, "_fetch_job_result", lambda data: [])
+    monkeypatch.setattr(utils_module.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(utils_module.time, "sleep", fake_sleep)
+
+    results = []
+    for index, result in iter_paddleocr_api_results(
+        model="PP-StructureV3",
+        file_inputs=[("a.pdf", None), ("b.pdf", None)],
+        options={},
+        client_config={"base_url": "https://example.com", "headers": {}},
+        is_document_parsing=True,
+        max_wait_time=10,
+    ):
+        # the caller spends longer than the whole budget on the first document
+        clock[0] += 60
+        results.append((index, result))
+
+    assert [index for index, _ in results] == [0, 1]
+    assert not any(isinstance(result, RuntimeError) for _, result in results)
+
+
 def invoke_tool_with_mocked_api(
     monkeypatch,
     tool_cls,
@@ -537,4 +626,4 @@ def test_manifest_version_is_bumped():
     with open(os.path.join(PLUGIN_DIR, "manifest.yaml"), encoding="utf-8") as manifest_file:
         manifest = yaml.safe_load(manifest_file)
 
-    assert manifest["version"] == "0.2.10"
+    assert manifest["version"] == "0.2.11"
@@ -11,10 +11,11 @@ from tools.utils import (
     cleanup_temp_file,
     get_api_client_config,
     iter_docx_exports,
+    iter_paddleocr_api_results,
     normalize_file_input,
 )
 
-_SKIP_KEYS = {"file", "fileType", "model", "pageRanges"}
+_SKIP_KEYS = {"file", "files", "fileType", "model", "pageRanges"}
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +48,11 @@ class DocumentParsingTool(Tool):
         # Get base_url (optional, uses default if not provided)
         base_url = self.runtime.credentials.get("base_url")
 
+        files = [tool_parameters.get("file"), *(tool_parameters.get("files") or [])]
+        if len(files) > 1:
+            yield from self._invoke_batch(access_token, base_url, files, tool_parameters)
+            return
+
         # Normalize file input - returns (input_value, is_temp_file, file_type_code)
         file_input, is_temp_file, file_type_code = normalize_file_input(
             tool_parameters.get("file"), tool_parameters.get("fileType")
@@ -85,79 +91,131 @@ class DocumentParsingTool(Tool):
                     page_ranges=page_ranges,
                 )
 
-            # Process images from result
-            images = []
-            image_path_map = {}
-            failed_images = []
-
-            for page in result["pages"]:
-                if page["markdown_images"]:
-                    image_dict = page["markdown_images"]
-                    if image_dict:
-                        for image_path, image_url in image_dict.items():
-                            if image_path in image_path_map:
-                                continue
-                            try:
-                                import requests
-
-                                image_bytes = requests.get(image_url, timeout=(10, 600)).content
-                                file_name = f"paddleocr_image_{len(images)}.jpg"
-                                upload_response = self.session.file.upload(
-                                    file_name, image_bytes, "image/jpeg"
-                                )
-                                images.append(upload_response)
-                                image_path_map[image_path] = upload_response
-                                if not upload_response.preview_url:
-                                    failed_images.append(image_path)
-                            except Exception as e:
-                                logger.warning(f"Failed to process image {image_path}: {e}")
-                                failed_images.append(image_path)
-
-            # Build markdown with image replacement
-            markdown_text_list = []
-            for page in result["pages"]:
-                markdown_text = page["markdown_text"]
-                if markdown_text is not None:
-                    # Replace image paths with uploaded URLs
-                    for image_path, upload_response in image_path_map.items():
-                        if upload_response.preview_url:
-                            markdown_text = markdown_text.replace(
-                                f'src="{image_path}"',
-                                f'src="{upload_response.preview_url}"',
-                            )
-                        else:
-                            markdown_text = markdown_text.replace(
-                                f'src="{image_path}"', 'src="[Image unavailable]"'
-                            )
-                    markdown_text_list.append(markdown_text)
-
-            yield self.create_text_message("\n\n".join(markdown_text_list))
-
-            for filename, document_bytes in iter_docx_exports(
-                result,
-                filename_prefix="paddleocr-document",
-                warning_logger=logger,
-            ):
-                yield self.create_blob_message(
-                    blob=document_bytes,
-                    meta={"filename": filename, "mime_type": DOCX_MIME_TYPE},
-                )
-
-            # Return raw result as JSON
-            yield self.create_json_message(
-                {
-                    "job_id": result["job_id"],
-                    "pages": [
-                        {
-                            "markdown_text": page["markdown_text"],
-                            "markdown_images": page["markdown_images"],
-                            "output_images": page["output_images"],
-                        }
-                        for page in result["pages"]
-                    ],
-                }
-            )
+            yield from self._result_messages(result)
 
         finally:
             # Clean up temporary file if created
             cleanup_temp_file(file_input, is_temp_file)
+
+    def _invoke_batch(
+        self,
+        access_token: str,
+        base_url: str | None,
+        files: list[Any],
+        tool_parameters: dict[str, Any],
+    ) -> Generator[ToolInvokeMessage]:
+        """Parse several files as concurrent jobs, yielding each document as soon as it finishes."""
+        normalized = []
+        try:
+            for file_value in files:
+                normalized.append(normalize_file_input(file_value, tool_parameters.get("fileType")))
+
+            file_inputs = [
+                (file_input, None)
+                if file_input.startswith(("http://", "https://"))
+                else (None, file_input)
+                for file_input, _, _ in normalized
+            ]
+            results = iter_paddleocr_api_results(
+                model=tool_parameters.get("model") or "PP-StructureV3",
+                file_inputs=file_inputs,
+                options=build_pp_structure_v3_options(tool_parameters),
+                client_config=get_api_client_config(access_token, base_url=base_url),
+                is_document_parsing=True,
+                page_ranges=tool_parameters.get("pageRanges"),
+            )
+            for index, result in results:
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to parse file {index + 1}: {result}")
+                    yield self.create_text_message(f"Failed to parse file {index + 1}: {result}")
+                    continue
+                yield from self._result_messages(
+                    result,
+                    image_prefix=f"{index + 1}_",
+                    docx_prefix=f"paddleocr-document-{index + 1}",
+                )
+        finally:
+            # Clean up temporary files if created
+            for file_input, is_temp_file, _ in normalized:
+                cleanup_temp_file(file_input, is_temp_file)
+
+    def _result_messages(
+        self,
+        result: dict[str, Any],
+        image_prefix: str = "",
+        docx_prefix: str = "paddleocr-document",
+    ) -> Generator[ToolInvokeMessage]:
+        """Upload images and yield the markdown, DOCX exports and raw JSON of one parsed document."""
+        # Process images from result
+        images = []
+        image_path_map = {}
+        failed_images = []
+
+        for page in result["pages"]:
+            if page["markdown_images"]:
+                image_dict = page["markdown_images"]
+                if image_dict:
+                    for image_path, image_url in image_dict.items():
+                        if image_path in image_path_map:
+                            continue
+                        try:
+                            import requests
+
+                            image_bytes = requests.get(image_url, timeout=(10, 600)).content
+                            file_name = f"paddleocr_image_{image_prefix}{len(images)}.jpg"
+                            upload_response = self.session.file.upload(
+                                file_name, image_bytes, "image/jpeg"
+                            )
+                            images.append(upload_response)
+                            image_path_map[image_path] = upload_response
+                            if not upload_response.preview_url:
+                                failed_images.append(image_path)
+                        except Exception as e:
+                            logger.warning(f"Failed to process image {image_path}: {e}")
+                            failed_images.append(image_path)
+
+        # Build markdown with image replacement
+        markdown_text_list = []
+        for page in result["pages"]:
+            markdown_text = page["markdown_text"]
+            if markdown_text is not None:
+                # Replace image paths with uploaded URLs
+                for image_path, upload_response in image_path_map.items():
+                    if upload_response.preview_url:
+                        markdown_text = markdown_text.replace(
+                            f'src="{image_path}"',
+                            f'src="{upload_response.preview_url}"',
+                        )
+                    else:
+                        markdown_text = markdown_text.replace(
+                            f'src="{image_path}"', 'src="[Image unavailable]"'
+                        )
+                markdown_text_list.append(markdown_text)
+
+        yield self.create_text_message("\n\n".join(markdown_text_list))
+
+        for filename, document_bytes in iter_docx_exports(
+            result,
+            filename_prefix=docx_prefix,
+            warning_logger=logger,
+        ):
+            yield self.create_blob_message(
+                blob=document_bytes,
+                meta={"filename": filename, "mime_type": DOCX_MIME_TYPE},
+            )
+
+        # Return raw result as JSON
+        yield self.create_json_message(
+            {
+                "job_id": result["job_id"],
+                "pages": [
+                    {
+                        "markdown_text": page["markdown_text"],
+                        "markdown_images": page["markdown_images"],
+                        "output_images": page["output_images"],
+                    }
+                    for page in result["pages"]
+                ],
+            }
+        )
+
@@ -476,6 +476,7 @@ DEFAULT_POLL_TIMEOUT = 600.0
 DEFAULT_INITIAL_INTERVAL = 3.0
 DEFAULT_MULTIPLIER = 1.5
 DEFAULT_MAX_INTERVAL = 15.0
+DEFAULT_MAX_CONCURRENT_SUBMISSIONS = 4
 
 
 def get_api_client_config(access_token: str, *, base_url: str | None = None) -> dict[str, Any]:
@@ -588,6 +589,109 @@ def _submit_job(
         raise RuntimeError(f"Failed to parse job submission response: {e}") from e
 
 
+def _check_job(
+    job_id: str,
+    base_url: str,
+    headers: dict[str, str],
+) -> tuple[str | None, dict[str, Any]]:
+    """Fetch job status once, return (state, status_data).
+
+    Args:
+        job_id: Job ID
+        base_url: Base API URL
+        headers: Request headers
+
+    Returns:
+        Tuple of (state, status_data dict)
+
+    Raises:
+        RuntimeError: If the status request fails
+    """
+    import requests
+
+    status_url = f"{base_url}{API_PATH}/{job_id}"
+
+    try:
+        resp = requests.get(status_url, headers=headers, timeout=DEFAULT_REQUEST_TIMEOUT)
+    except requests.Timeout as e:
+        raise RuntimeError(f"Request timed out: {e}") from e
+    except requests.ConnectionError as e:
+        raise RuntimeError(f"Connection failed: {e}") from e
+
+    if not 200 <= resp.status_code < 300:
+        try:
+            payload = resp.json()
+            msg = (
+                payload.get("msg")
+                or payload.get("message")
+                or payload.get("error")
+                or resp.text
+            )
+        except ValueError:
+            msg = resp.text
+        raise RuntimeError(f"Poll failed (HTTP {resp.status_code}): {msg}")
+
+    try:
+        data = resp.json()
+        state = data.get("data", {}).get("state") or data.get("state")
+    except (ValueError, KeyError) as e:
+        raise RuntimeError(f"Failed to parse poll response: {e}") from e
+
+    if state == "failed":
+        error_msg = (
+            data.get("data", {}).get("errorMsg") or data.get("errorMsg") or "Unknown error"
+        )
+        raise RuntimeError(f"Job {job_id} failed: {error_msg}")
+
+    return state, data
+
+
+def _fetch_job_result(data: dict[str, Any]) -> list[dict[str, Any]]:
+    """Download and parse the JSONL result of a finished job.
+
+    Args:
+        data: Status data of a job in the "done" state
+
+    Returns:
+        JSONL data list
+
+    Raises:
+        RuntimeError: If the result cannot be downloaded or parsed
+    """
+    import requests
+
+    # Get result URL — handle both response formats
+    result_data = data.get("data", {})
+    result_json_url = (
+        result_data.get("resultJsonUrl")
+        or (result_data.get("resultUrl") or {}).get("jsonUrl")
+        or data.get("resultJsonUrl")
+    )
+    if not result_json_url:
+        raise RuntimeError(f"Result URL not found in response: {data}")
+
+    # Fetch JSONL result
+    try:
+        resp = requests.get(result_json_url, timeout=DEFAULT_REQUEST_TIMEOUT)
+        resp.raise_for_status()
+    except requests.Timeout as e:
+        raise RuntimeError(f"Result download timed out: {e}") from e
+    except requests.ConnectionError as e:
+        raise RuntimeError(f"Result download failed: {e}") from e
+
+    # Parse JSONL
+    lines = resp.text.strip().split("\n")
+    jsonl_data = []
+    for line in lines:
+        line = line.strip()
+        if line:
+            try:
+                jsonl_data.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise RuntimeError(f"Malformed JSONL result: {e}") from e
+    return jsonl_data
+
+
 def _poll_job(
     job_id: str,
     base_url: str,
@@ -608,11 +712,6 @@ def _poll_job(
     Raises:
         RuntimeError: If polling fails or job fails
     """
-    import requests
-
-    jobs_url = f"{base_url}{API_PATH}"
-    status_url = f"{jobs_url}/{job_id}"
-
     interval = DEFAULT_INITIAL_INTERVAL
     start = time.monotonic()
     deadline = start + max_wait_time
@@ -622,70 +721,9 @@ def _poll_job(
         if now >= deadline:
             raise RuntimeError(f"Job {job_id} timed out after {max_wait_time:.1f} seconds")
 
-        try:
-            resp = requests.get(status_url, headers=headers, timeout=DEFAULT_REQUEST_TIMEOUT)
-        except requests.Timeout as e:
-            raise RuntimeError(f"Request timed out: {e}") from e
-        except requests.ConnectionError as e:
-            raise RuntimeError(f"Connection failed: {e}") from e
-
-        if not 200 <= resp.status_code < 300:
-            try:
-                payload = resp.json()
-                msg = (
-                    payload.get("msg")
-                    or payload.get("message")
-                    or payload.get("error")
-                    or resp.text
-                )
-            except ValueError:
-                msg = resp.text
-            raise RuntimeError(f"Poll failed (HTTP {resp.status_code}): {msg}")
-
-        try:
-            data = resp.json()
-            state = data.get("data", {}).get("state") or data.get("state")
-        except (ValueError, KeyError) as e:
-            raise RuntimeError(f"Failed to parse poll response: {e}") from e
-
+        state, data = _check_job(job_id, base_url, headers)
         if state == "done":
-            # Get result URL — handle both response formats
-            result_data = data.get("data", {})
-            result_json_url = (
-                result_data.get("resultJsonUrl")
-                or (result_data.get("resultUrl") or {}).get("jsonUrl")
-                or data.get("resultJsonUrl")
-            )
-            if not result_json_url:
-                raise RuntimeError(f"Result URL not found in response: {data}")
-
-            # Fetch JSONL result
-            try:
-                resp = requests.get(result_json_url, timeout=DEFAULT_REQUEST_TIMEOUT)
-                resp.raise_for_status()
-            except requests.Timeout as e:
-                raise RuntimeError(f"Result download timed out: {e}") from e
-            except requests.ConnectionError as e:
-                raise RuntimeError(f"Result download failed: {e}") from e
-
-            # Parse JSONL
-            lines = resp.text.strip().split("\n")
-            jsonl_data = []
-            for line in lines:
-                line = line.strip()
-                if line:
-                    try:
-                        jsonl_data.append(json.loads(line))
-                    except json.JSONDecodeError as e:
-                        raise RuntimeError(f"Malformed JSONL result: {e}") from e
-
-            return jsonl_data, data
-
-        if state == "failed":
-            error_msg = (
-                data.get("data", {}).get("errorMsg") or data.get("errorMsg") or "Unknown error"
-            )
-            raise RuntimeError(f"Job {job_id} failed: {error_msg}")
+            return _fetch_job_result(data), data
 
         # Continue polling
         remaining = deadline - time.monotonic()
@@ -804,3 +842,81 @@ def call_paddleocr_api(
         return _parse_doc_parsing_result(job_id, jsonl_data)
     else:
         return _parse_ocr_result(job_id, jsonl_data)
+
+
+def iter_paddleocr_api_results(
+    model: str,
+    file_inputs: list[tuple[str | None, str | None]],
+    options: dict[str, Any],
+    client_config: dict[str, Any],
+    is_document_parsing: bool = False,
+    page_ranges: str | None = None,
+    max_wait_time: float = DEFAULT_POLL_TIMEOUT,
+):
+    """Run several files through the async job API at once.
+
+    Jobs are submitted concurrently and polled together, sharing one backoff
+    schedule; each document is yielded as soon as its job finishes. Time the
+    caller spends handling a yielded document does not count against
+    max_wait_time.
+
+    Args:
+        model: Model name (e.g., "PP-StructureV3", "PaddleOCR-VL-1.6")
+        file_inputs: (file_url, file_path) pairs, one per file
+        options: Optional payload parameters
+        client_config: Client config from get_api_client_config()
+        is_document_parsing: True for doc parsing, False for OCR
+        page_ranges: Page ranges applied to every file
+        max_wait_time: Maximum wait time in seconds for all jobs
+
+    Yields:
+        (index into file_inputs, parsed result dict or RuntimeError), in completion order
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    base_url = client_config["base_url"]
+    headers = client_config["headers"]
+    parse_result = _parse_doc_parsing_result if is_document_parsing else _parse_ocr_result
+
+    def _submit(file_input: tuple[str | None, str | None]) -> str:
+        file_url, file_path = file_input
+        return _submit_job(model, file_url, file_path, options, base_url, headers, page_ranges)
+
+    pending: dict[str, int] = {}
+    if file_inputs:
+        with ThreadPoolExecutor(
+            max_workers=min(DEFAULT_MAX_CONCURRENT_SUBMISSIONS, len(file_inputs))
+        ) as executor:
+            futures = [executor.submit(_submit, file_input) for file_input in file_inputs]
+            for index, future in enumerate(futures):
+                try:
+                    pending[future.result()] = index
+                except RuntimeError as e:
+                    yield index, e
+
+    interval = DEFAULT_INITIAL_INTERVAL
+    deadline = time.monotonic() + max_wait_time
+    while pending:
+        for job_id, index in list(pending.items()):
+            try:
+                state, data = _check_job(job_id, base_url, headers)
+                if state != "done":
+                    continue
+                result = parse_result(job_id, _fetch_job_result(data))
+            except RuntimeError as e:
+                result = e
+            del pending[job_id]
+            suspended_at = time.monotonic()
+            yield index, result
+            deadline += time.monotonic() - suspended_at
+
+        if not pending:
+            break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            for job_id, index in pending.items():
+                yield index, RuntimeError(f"Job {job_id} timed out after {max_wait_time:.1f} seconds")
+            break
+
+        time.sleep(min(interval, remaining))
+        interval = min(interval * DEFAULT_MULTIPLIER, DEFAULT_MAX_INTERVAL)
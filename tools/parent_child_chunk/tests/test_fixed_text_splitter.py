@@ -0,0 +1,75 @@
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PLUGIN_ROOT))
+
+from tools.splitter.fixed_text_splitter import FixedRecursiveCharacterTextSplitter
+
+
+def _legacy_character_split(splitter: FixedRecursiveCharacterTextSplitter, text: str) -> list[str]:
+    """Per-character assembly as it was before chunks were sliced by offset."""
+    chunk_size = splitter._chunk_size
+    chunk_overlap = splitter._chunk_overlap
+    splits = [s for s in text if s != "\n"]
+    final_chunks = []
+    current_part = ""
+    current_length = 0
+    overlap_part = ""
+    overlap_part_length = 0
+    for s, s_len in zip(splits, splitter._length_function(splits)):
+        if current_length + s_len <= chunk_size - chunk_overlap:
+            current_part += s
+            current_length += s_len
+        elif current_length + s_len <= chunk_size:
+            current_part += s
+            current_length += s_len
+            overlap_part += s
+            overlap_part_length += s_len
+        else:
+            final_chunks.append(current_part)
+            current_part = overlap_part + s
+            current_length = s_len + overlap_part_length
+            overlap_part = ""
+            overlap_part_length = 0
+    if current_part:
+        final_chunks.append(current_part)
+    return final_chunks
+
+
+class TestFixedRecursiveCharacterTextSplitter(unittest.TestCase):
+    def _assert_same_chunks(self, text: str) -> None:
+        for chunk_size, chunk_overlap in [(1, 0), (5, 2), (7, 7), (50, 10)]:
+            splitter = FixedRecursiveCharacterTextSplitter.from_encoder(
+                chunk_size=chunk_size, chunk_overlap=chunk_overlap, separators=[""]
+            )
+            with self.subTest(chunk_size=chunk_size, chunk_overlap=chunk_overlap):
+                self.assertEqual(
+                    splitter.recursive_split_text(text),
+                    _legacy_character_split(splitter, text),
+                )
+
+    def test_character_split_matches_legacy(self):
+        rng = random.Random(0)
+        self._assert_same_chunks("".join(rng.choice("中文ab\n") for _ in range(2_000)))
+
+    def test_character_split_across_length_blocks_matches_legacy(self):
+        rng = random.Random(1)
+        with patch("tools.splitter.fixed_text_splitter._CHARACTER_BLOCK_SIZE", 7):
+            self._assert_same_chunks("".join(rng.choice("中文ab") for _ in range(500)))
+
+    def test_merge_keeps_overlap(self):
+        splitter = FixedRecursiveCharacterTextSplitter.from_encoder(
+            chunk_size=12, chunk_overlap=6, separators=[" "]
+        )
+
+        chunks = splitter.split_text("aa bb cc dd ee ff gg")
+
+        self.assertEqual(chunks, ["aa bb cc dd", "cc dd ee ff", "ee ff gg"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PLUGIN_ROOT))
+
+from tools.entities.entities import Rule, Segmentation
+from tools.index_processor import parent_child_index_processor
+from tools.index_processor.parent_child_index_processor import ParentChildIndexProcessor
+
+TEXT = "\n\n".join(
+    f"Section {i}. " + " ".join(f"sentence {i}-{j} of the manual." for j in range(12))
+    for i in range(20)
+)
+
+
+def _rules() -> Rule:
+    return Rule(
+        parent_mode="paragraph",
+        segmentation=Segmentation(max_tokens=300, separator="\n\n"),
+        subchunk_segmentation=Segmentation(max_tokens=60, separator=". "),
+    )
+
+
+class TestParentChildIndexProcessor(unittest.TestCase):
+    def test_iter_chunks_matches_transform(self):
+        processor = ParentChildIndexProcessor()
+
+        chunks = list(processor.iter_chunks(TEXT, _rules()))
+
+        self.assertEqual(chunks, processor.transform(TEXT, _rules()).parent_child_chunks)
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(chunk.child_contents for chunk in chunks))
+
+    def test_iter_chunks_is_lazy(self):
+        processor = ParentChildIndexProcessor()
+        with patch.object(
+            parent_child_index_processor,
+            "_split_child_texts",
+            wraps=parent_child_index_processor._split_child_texts,
+        ) as split_child_texts:
+            next(processor.iter_chunks(TEXT, _rules()))
+
+        self.assertEqual(split_child_texts.call_count, 1)
+
+    def test_splitters_are_built_once_per_rule_set(self):
+        parent_child_index_processor._get_cached_splitter.cache_clear()
+
+        ParentChildIndexProcessor().transform(TEXT, _rules())
+        ParentChildIndexProcessor().transform(TEXT, _rules())
+
+        info = parent_child_index_processor._get_cached_splitter.cache_info()
+        self.assertEqual(info.misses, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
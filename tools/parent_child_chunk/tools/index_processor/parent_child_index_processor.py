@@ -1,12 +1,15 @@
 """Paragraph index processor."""
 
 import uuid
+from collections.abc import Generator
+from functools import lru_cache
 from hashlib import sha256
 from tools.cleaner.clean_processor import CleanProcessor
 from tools.document import ChildDocument, Document
 from tools.entities.entities import (
     ParentMode,
     Rule,
+    Segmentation,
     ParentChildStructureChunk,
     ParentChildChunk,
 )
@@ -22,32 +25,42 @@ class ParentChildIndexProcessor:
         else:
             raise ValueError(f"Unsupported parent mode: {rules.parent_mode}")
 
+    def iter_chunks(
+        self, input_text: str, rules: Rule
+    ) -> Generator[ParentChildChunk, None, None]:
+        """Yield parent/child chunk groups in document order as they are produced."""
+        if rules.parent_mode == ParentMode.PARAGRAPH:
+            yield from self._iter_paragraph_chunks(input_text, rules)
+        elif rules.parent_mode == ParentMode.FULL_DOC:
+            yield from self._process_full_doc_mode(input_text, rules).parent_child_chunks
+        else:
+            raise ValueError(f"Unsupported parent mode: {rules.parent_mode}")
+
     def _process_paragraph_mode(
         self, input_text: str, rules: Rule
     ) -> ParentChildStructureChunk:
-        all_documents = ParentChildStructureChunk(parent_child_chunks=[])
-        splitter = FixedRecursiveCharacterTextSplitter.from_encoder(
-            chunk_size=rules.segmentation.max_tokens,
-            chunk_overlap=rules.segmentation.chunk_overlap,
-            fixed_separator=rules.segmentation.separator,
-            separators=["\n\n", "。", ". ", " ", ""],
+        return ParentChildStructureChunk(
+            parent_child_chunks=list(self._iter_paragraph_chunks(input_text, rules))
         )
+
+    def _iter_paragraph_chunks(
+        self, input_text: str, rules: Rule
+    ) -> Generator[ParentChildChunk, None, None]:
+        splitter = _get_splitter(rules.segmentation)
         # Clean text content
         input_text = self._clean_content(input_text, rules)
         # Split text into nodes
-        text_nodes = splitter.split_text(text=input_text)
+        text_nodes = [
+            text_node
+            for text_node in splitter.split_text(text=input_text)
+            if text_node.strip()
+        ]
         for text_node in text_nodes:
-            if text_node.strip():
-                # Split text into child nodes
-                child_nodes = self._split_child_nodes(text_node, rules)
-                all_documents.parent_child_chunks.append(
-                    ParentChildChunk(
-                        parent_content=text_node,
-                        child_contents=child_nodes,
-                        parent_mode="paragraph",
-                    )
-                )
-        return all_documents
+            yield ParentChildChunk(
+                parent_content=text_node,
+                child_contents=self._split_child_nodes(text_node, rules),
+                parent_mode="paragraph",
+            )
 
     def _process_full_doc_mode(
         self, input_text: str, rules: Rule
@@ -66,20 +79,7 @@ class ParentChildIndexProcessor:
         """Split a document node into child nodes."""
         if not rules.subchunk_segmentation:
             raise ValueError("No subchunk segmentation found in rules.")
-        child_splitter = FixedRecursiveCharacterTextSplitter.from_encoder(
-            chunk_size=rules.subchunk_segmentation.max_tokens,
-            chunk_overlap=rules.subchunk_segmentation.chunk_overlap,
-            fixed_separator=rules.subchunk_segmentation.separator,
-            separators=["\n\n", "。", ". ", " ", ""],
-        )
-        child_nodes = []
-        child_texts = child_splitter.split_text(input_text)
-        for child_text in child_texts:
-            if child_text.strip():
-                child_text = self._clean_page_content(child_text)
-                if child_text:
-                    child_nodes.append(child_text)
-        return child_nodes
+        return _split_child_texts(input_text, rules.subchunk_segmentation)
 
     def _clean_content(self, content: str, rules: Rule) -> str:
         """Clean the content of a document."""
@@ -87,9 +87,43 @@ class ParentChildIndexProcessor:
 
     def _clean_page_content(self, page_content: str) -> str:
         """Clean the page content by removing unwanted characters."""
-        if page_content.startswith(".") or page_content.startswith("。"):
-            page_content = page_content[1:].strip()
-        return page_content
+        return _clean_page_content(page_content)
+
+
+def _clean_page_content(page_content: str) -> str:
+    if page_content.startswith(".") or page_content.startswith("。"):
+        page_content = page_content[1:].strip()
+    return page_content
+
+
+@lru_cache(maxsize=32)
+def _get_cached_splitter(
+    max_tokens: int, chunk_overlap: int, separator: str
+) -> FixedRecursiveCharacterTextSplitter:
+    return FixedRecursiveCharacterTextSplitter.from_encoder(
+        chunk_size=max_tokens,
+        chunk_overlap=chunk_overlap,
+        fixed_separator=separator,
+        separators=["\n\n", "。", ". ", " ", ""],
+    )
+
+
+def _get_splitter(segmentation: Segmentation) -> FixedRecursiveCharacterTextSplitter:
+    """Return the splitter for a segmentation rule, built once per rule set."""
+    return _get_cached_splitter(
+        segmentation.max_tokens, segmentation.chunk_overlap, segmentation.separator
+    )
+
+
+def _split_child_texts(input_text: str, segmentation: Segmentation) -> list[str]:
+    child_nodes = []
+    child_texts = _get_splitter(segmentation).split_text(input_text)
+    for child_text in child_texts:
+        if child_text.strip():
+            child_text = _clean_page_content(child_text)
+            if child_text:
+                child_nodes.append(child_text)
+    return child_nodes
 
 
 def generate_text_hash(text: str) -> str:
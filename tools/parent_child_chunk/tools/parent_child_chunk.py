@@ -20,6 +20,7 @@ class ParentChildChunkTool(Tool):
         subchunk_separator = tool_parameters.get("subchunk_separator", "\n")
         remove_urls_emails = tool_parameters.get("remove_urls_emails", False)
         remove_extra_spaces = tool_parameters.get("remove_extra_spaces", False)
+        stream_chunks = tool_parameters.get("stream_chunks", False)
 
         rule = Rule()
         rule.parent_mode = parent_mode
@@ -28,7 +29,17 @@ class ParentChildChunkTool(Tool):
         rule.remove_urls_emails = remove_urls_emails
         rule.remove_extra_spaces = remove_extra_spaces
         parent_child_processor = ParentChildIndexProcessor()
-        parent_child_structure_chunk = parent_child_processor.transform(
-            input_text=input_text, rules=rule
-        )
-        yield self.create_variable_message("result", parent_child_structure_chunk)
+        if not stream_chunks:
+            parent_child_structure_chunk = parent_child_processor.transform(
+                input_text=input_text, rules=rule
+            )
+            yield self.create_variable_message("result", parent_child_structure_chunk)
+            return
+
+        chunk_count = 0
+        for parent_child_chunk in parent_child_processor.iter_chunks(input_text=input_text, rules=rule):
+            yield self.create_json_message(
+                {"index": chunk_count, "parent_child_chunk": parent_child_chunk.model_dump()}
+            )
+            chunk_count += 1
+        yield self.create_json_message({"parent_mode": parent_mode, "chunk_count": chunk_count})
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, islice
 from typing import Any, Optional
 import codecs
 
@@ -17,6 +20,10 @@ from .text_splitter import (
 )
 
 
+# characters measured per length_function call when splitting without a separator
+_CHARACTER_BLOCK_SIZE = 65536
+
+
 class EnhanceRecursiveCharacterTextSplitter(RecursiveCharacterTextSplitter):
     """
     This class is used to implement from_gpt2_encoder, to prevent using of tiktoken
@@ -33,7 +40,7 @@ class EnhanceRecursiveCharacterTextSplitter(RecursiveCharacterTextSplitter):
             if not texts:
                 return []
 
-            return [len(text) for text in texts]
+            return list(map(len, texts))
 
         if issubclass(cls, TokenTextSplitter):
             extra_kwargs = {
@@ -90,57 +97,82 @@ class FixedRecursiveCharacterTextSplitter(EnhanceRecursiveCharacterTextSplitter)
                 new_separators = self._separators[i + 1 :]
                 break
 
+        if separator == "":
+            return self._split_by_characters(text)
+
         # Now that we have the separator, split the text
         splits = _split_text_with_regex(text, separator, self._keep_separator)
         _good_splits = []
         _good_splits_lengths = []  # cache the lengths of the splits
         _separator = "" if self._keep_separator else separator
         s_lens = self._length_function(splits)
-        if separator != "":
-            for s, s_len in zip(splits, s_lens):
-                if s_len < self._chunk_size:
-                    _good_splits.append(s)
-                    _good_splits_lengths.append(s_len)
-                else:
-                    if _good_splits:
-                        merged_text = self._merge_splits(
-                            _good_splits, _separator, _good_splits_lengths
-                        )
-                        final_chunks.extend(merged_text)
-                        _good_splits = []
-                        _good_splits_lengths = []
-                    if not new_separators:
-                        final_chunks.append(s)
-                    else:
-                        other_info = self._split_text(s, new_separators)
-                        final_chunks.extend(other_info)
-
-            if _good_splits:
-                merged_text = self._merge_splits(
-                    _good_splits, _separator, _good_splits_lengths
-                )
-                final_chunks.extend(merged_text)
-        else:
-            current_part = ""
-            current_length = 0
-            overlap_part = ""
-            overlap_part_length = 0
-            for s, s_len in zip(splits, s_lens):
-                if current_length + s_len <= self._chunk_size - self._chunk_overlap:
-                    current_part += s
-                    current_length += s_len
-                elif current_length + s_len <= self._chunk_size:
-                    current_part += s
-                    current_length += s_len
-                    overlap_part += s
-                    overlap_part_length += s_len
+        for s, s_len in zip(splits, s_lens):
+            if s_len < self._chunk_size:
+                _good_splits.append(s)
+                _good_splits_lengths.append(s_len)
+            else:
+                if _good_splits:
+                    merged_text = self._merge_splits(
+                        _good_splits, _separator, _good_splits_lengths
+                    )
+                    final_chunks.extend(merged_text)
+                    _good_splits = []
+                    _good_splits_lengths = []
+                if not new_separators:
+                    final_chunks.append(s)
                 else:
-                    final_chunks.append(current_part)
-                    current_part = overlap_part + s
-                    current_length = s_len + overlap_part_length
-                    overlap_part = ""
-                    overlap_part_length = 0
-            if current_part:
-                final_chunks.append(current_part)
+                    other_info = self._split_text(s, new_separators)
+                    final_chunks.extend(other_info)
+
+        if _good_splits:
+            merged_text = self._merge_splits(
+                _good_splits, _separator, _good_splits_lengths
+            )
+            final_chunks.extend(merged_text)
+
+        return final_chunks
+
+    def _split_by_characters(self, text: str) -> list[str]:
+        """Split text into character windows of at most chunk_size.
+
+        Chunk boundaries are found by binary search over prefix sums of the
+        character lengths and each chunk is sliced out of the source string
+        once, so inputs without any separator (e.g. CJK text) stay linear in
+        time and memory instead of being grown one character at a time.
+        """
+        # newlines are dropped from per-character splits, so offsets refer to
+        # the text without them
+        stream = text.replace("\n", "")
+        text_length = len(stream)
+        soft_limit = self._chunk_size - self._chunk_overlap
+        final_chunks = []
+        # prefix[k] is the total length of stream[base : base + k]
+        base = 0
+        prefix = array("q", [0])
+        start = 0  # first offset of the current chunk
+        pos = 0  # first offset not yet placed in any chunk
+        while True:
+            limit = prefix[start - base] + self._chunk_size
+            while prefix[-1] <= limit and base + len(prefix) - 1 < text_length:
+                block_start = base + len(prefix) - 1
+                block = stream[block_start : block_start + _CHARACTER_BLOCK_SIZE]
+                lengths = self._length_function(list(block))
+                prefix.extend(islice(accumulate(lengths, initial=prefix[-1]), 1, None))
+            # the character that no longer fits closes the chunk
+            end = max(bisect_right(prefix, limit) - 1 + base, pos)
+            if end >= text_length:
+                break
+            # characters past the soft limit are carried over as overlap
+            overlap_start = max(
+                bisect_right(prefix, prefix[start - base] + soft_limit) - 1 + base, pos
+            )
+            final_chunks.append(stream[start:end])
+            start = overlap_start if overlap_start < end else end
+            pos = end + 1
+            if start - base > _CHARACTER_BLOCK_SIZE:
+                del prefix[: start - base]
+                base = start
+        if start < text_length:
+            final_chunks.append(stream[start:])
 
         return final_chunks
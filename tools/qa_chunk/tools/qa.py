@@ -1,6 +1,7 @@
+import codecs
 import io
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 from typing import Any
 
 import pandas as pd
@@ -10,24 +11,95 @@ from dify_plugin.file.file import File
 
 logger = logging.getLogger(__name__)
 
+# rows parsed per read_csv chunk, so large exports never hold every column at once
+CSV_CHUNK_SIZE = 50_000
+# bytes decoded up front to pick the encoding before the full parse
+ENCODING_SAMPLE_SIZE = 64 * 1024
+CANDIDATE_ENCODINGS = ("utf-8", "gbk", "latin-1")
 
-def _get_cell_by_column(row: pd.Series, column: Any) -> Any:
+
+def _detect_encodings(blob: bytes) -> list[str]:
+    """Return the candidate encodings to try, starting with the first one that decodes a sample."""
+    sample = blob[:ENCODING_SAMPLE_SIZE]
+    final = len(blob) <= ENCODING_SAMPLE_SIZE
+    for index, encoding in enumerate(CANDIDATE_ENCODINGS):
+        try:
+            # an incremental decoder tolerates a multi-byte character cut off by the sample
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=final)
+        except UnicodeDecodeError:
+            continue
+        return list(CANDIDATE_ENCODINGS[index:])
+    return [CANDIDATE_ENCODINGS[-1]]
+
+
+def _resolve_column(columns: pd.Index, column: Any) -> int:
+    """Resolve a column name or position to a column position."""
     if isinstance(column, str):
         column = column.strip()
 
-    if column in row.index:
-        return row.loc[column]
+    if column in columns:
+        # duplicated header names resolve to the first match
+        return list(columns).index(column)
+
+    if isinstance(column, float) and column.is_integer():
+        column = int(column)
+    elif isinstance(column, str) and column.isdigit():
+        column = int(column)
 
     if isinstance(column, int):
-        return row.iloc[column]
+        position = column + len(columns) if column < 0 else column
+        if not 0 <= position < len(columns):
+            raise IndexError(f"column position {column} is out of bounds")
+        return position
 
-    if isinstance(column, float) and column.is_integer():
-        return row.iloc[int(column)]
+    raise KeyError(column)
 
-    if isinstance(column, str) and column.isdigit():
-        return row.iloc[int(column)]
 
-    return row.loc[column]
+def _read_header(blob: bytes, encodings: Sequence[str]) -> tuple[list[str], pd.Index]:
+    """Read the header row, returning the encodings still worth trying and the columns."""
+    for index, encoding in enumerate(encodings):
+        try:
+            columns = pd.read_csv(io.BytesIO(blob), encoding=encoding, nrows=0).columns
+        except UnicodeDecodeError:
+            if index == len(encodings) - 1:
+                raise
+            continue
+        return list(encodings[index:]), columns
+    raise ValueError("no encoding candidates")
+
+
+def _read_columns(
+    blob: bytes, encodings: Sequence[str], positions: Sequence[int]
+) -> list[list[str]]:
+    """
+    Read only the given column positions as strings, streaming the file in chunks.
+
+    Falls back to the next encoding when the current one fails to decode the file.
+    """
+    usecols = sorted(set(positions))
+    for index, encoding in enumerate(encodings):
+        values: list[list[str]] = [[] for _ in positions]
+        try:
+            reader = pd.read_csv(
+                io.BytesIO(blob),
+                encoding=encoding,
+                usecols=usecols,
+                # keep cells as written; per-chunk type inference would
+                # format the same column differently across chunks
+                dtype=str,
+                chunksize=CSV_CHUNK_SIZE,
+            )
+            with reader:
+                for chunk in reader:
+                    for column_values, position in zip(values, positions):
+                        column = chunk.iloc[:, usecols.index(position)]
+                        column_values.extend(map(str, column.tolist()))
+        except UnicodeDecodeError:
+            if index == len(encodings) - 1:
+                raise
+            continue
+        return values
+    raise ValueError("no encoding candidates")
 
 
 class QAChunkTool(Tool):
@@ -41,41 +113,44 @@ class QAChunkTool(Tool):
         if not file:
             yield self.create_text_message("No input file provided")
             return
-        
+
         if not file.filename or not file.filename.endswith(".csv"):
             yield self.create_text_message("Input file must be a CSV file")
             return
-        
+
         question_column = tool_parameters.get("question_column", 0)
         answer_column = tool_parameters.get("answer_column", 1)
-        
-        try:
-            file_stream = io.BytesIO(file.blob)
 
-            df = pd.read_csv(file_stream, encoding='utf-8')
-        except UnicodeDecodeError:
-            file_stream.seek(0)
-            try:
-                df = pd.read_csv(file_stream, encoding='gbk')
-            except Exception as e:
-                file_stream.seek(0)
-                df = pd.read_csv(file_stream, encoding='latin-1')
+        try:
+            blob = file.blob
+            encodings, columns = _read_header(blob, _detect_encodings(blob))
         except Exception as e:
             logger.error(f"Get CSV file failed: {e}", exc_info=True)
             yield self.create_text_message(f"Get CSV file failed: {e}")
             return
-        qa_chunks = []
+
         try:
-            for _, row in df.iterrows():
-                question = str(_get_cell_by_column(row, question_column))
-                answer = str(_get_cell_by_column(row, answer_column))
-                qa_chunks.append({"question": question, "answer": answer})
+            positions = (
+                _resolve_column(columns, question_column),
+                _resolve_column(columns, answer_column),
+            )
         except (IndexError, KeyError) as e:
             yield self.create_text_message(
-                f"Column not found: {e}. Available columns: {list(df.columns)}"
+                f"Column not found: {e}. Available columns: {list(columns)}"
             )
             return
-        
+
+        try:
+            questions, answers = _read_columns(blob, encodings, positions)
+        except Exception as e:
+            logger.error(f"Get CSV file failed: {e}", exc_info=True)
+            yield self.create_text_message(f"Get CSV file failed: {e}")
+            return
+        qa_chunks = [
+            {"question": question, "answer": answer}
+            for question, answer in zip(questions, answers)
+        ]
+
         result = {
             "qa_chunks": qa_chunks,
         }
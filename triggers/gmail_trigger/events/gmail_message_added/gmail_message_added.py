@@ -5,12 +5,16 @@ import binascii
 import json
 import quopri
 import re
+import threading
+import time
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from html.parser import HTMLParser
 from typing import Any
 from urllib.parse import unquote, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from werkzeug import Request
 
 from dify_plugin.entities.trigger import Variables
@@ -18,11 +22,47 @@ from dify_plugin.errors.trigger import EventIgnoreError
 from dify_plugin.interfaces.trigger import Event
 from dify_plugin.invocations.file import UploadFileResponse
 
+# Upper bound on concurrent Gmail API requests within one dispatch
+_MAX_CONCURRENT_REQUESTS = 8
+
+# Shared session so message and attachment fetches reuse keep-alive connections
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=_MAX_CONCURRENT_REQUESTS))
+
+
+class _AttachmentBudget:
+    """Time and byte allowance for attachment downloads across one dispatch."""
+
+    def __init__(self, seconds: float, max_bytes: int):
+        self._deadline = time.monotonic() + seconds
+        self._remaining_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def time_left(self) -> float:
+        return max(0.0, self._deadline - time.monotonic())
+
+    def allows(self, size: int | None) -> bool:
+        if self.time_left() <= 0:
+            return False
+        with self._lock:
+            return self._remaining_bytes > 0 and (size is None or size <= self._remaining_bytes)
+
+    def consume(self, size: int) -> bool:
+        """Charge downloaded bytes; False when they no longer fit the budget."""
+        with self._lock:
+            if size > self._remaining_bytes:
+                return False
+            self._remaining_bytes -= size
+            return True
+
 
 class GmailMessageAddedEvent(Event):
     _GMAIL_BASE = "https://gmail.googleapis.com/gmail/v1"
     _MAX_ATTACHMENT_UPLOAD_COUNT = 20
     _MAX_ATTACHMENT_UPLOAD_SIZE = 5 * 1024 * 1024  # 5 MiB
+    # Per-dispatch limits for attachment downloads; anything beyond keeps its Gmail URL
+    _ATTACHMENT_DOWNLOAD_TIME_BUDGET = 30.0  # seconds
+    _ATTACHMENT_DOWNLOAD_BYTE_BUDGET = 50 * 1024 * 1024  # 50 MiB
 
     def _on_event(self, request: Request, parameters: Mapping[str, Any], payload: Mapping[str, Any]) -> Variables:
         # Prefer payload delivered from Trigger.dispatch_event
@@ -67,18 +107,13 @@ class GmailMessageAddedEvent(Event):
         prop_label_ids: list[str] = (self.runtime.subscription.properties or {}).get("label_ids") or []
         selected: set[str] = set(prop_label_ids)
 
+        message_ids: list[str] = [str(it.get("id")) for it in items if it.get("id")]
+        budget = _AttachmentBudget(self._ATTACHMENT_DOWNLOAD_TIME_BUDGET, self._ATTACHMENT_DOWNLOAD_BYTE_BUDGET)
+
         messages: list[dict[str, Any]] = []
-        for it in items:
-            mid = it.get("id")
-            if not mid:
-                continue
-            mid_str = str(mid)
-            murl = f"{self._GMAIL_BASE}/users/me/messages/{mid_str}"
-            mparams: dict[str, str] = {"format": "full"}
-            mresp: requests.Response = requests.get(murl, headers=headers, params=mparams, timeout=10)
-            if mresp.status_code != 200:
+        for mid_str, m in zip(message_ids, self._fetch_messages(message_ids, headers)):
+            if m is None:
                 continue
-            m = mresp.json() or {}
             headers_list = (m.get("payload") or {}).get("headers") or []
             headers_map = {h.get("name"): h.get("value") for h in headers_list if h.get("name")}
 
@@ -150,6 +185,7 @@ class GmailMessageAddedEvent(Event):
                 message_id=mid_str,
                 attachments=attachments_meta,
                 headers=headers,
+                budget=budget,
             )
 
             messages.append(
@@ -177,6 +213,21 @@ class GmailMessageAddedEvent(Event):
 
         return Variables(variables={"history_id": str(history_id or ""), "messages": messages})
 
+    def _fetch_messages(self, message_ids: list[str], headers: Mapping[str, str]) -> list[dict[str, Any] | None]:
+        """Fetch full messages concurrently, in the order of message_ids (None when unavailable)."""
+        if not message_ids:
+            return []
+
+        def _fetch(message_id: str) -> dict[str, Any] | None:
+            url = f"{self._GMAIL_BASE}/users/me/messages/{message_id}"
+            resp: requests.Response = _session.get(url, headers=headers, params={"format": "full"}, timeout=10)
+            if resp.status_code != 200:
+                return None
+            return resp.json() or {}
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_REQUESTS, len(message_ids))) as executor:
+            return list(executor.map(_fetch, message_ids))
+
     def _extract_external_attachment_links(
         self,
         inline_parts: list[Mapping[str, Any]],
@@ -230,6 +281,7 @@ class GmailMessageAddedEvent(Event):
         message_id: str,
         attachments: list[Mapping[str, Any]],
         headers: Mapping[str, str],
+        budget: _AttachmentBudget,
     ) -> list[dict[str, Any]]:
         processed: list[dict[str, Any]] = []
         upload_candidates = sum(
@@ -239,6 +291,7 @@ class GmailMessageAddedEvent(Event):
         )
         allow_upload = upload_candidates <= self._MAX_ATTACHMENT_UPLOAD_COUNT
 
+        prepared: list[tuple[dict[str, Any], str | None]] = []
         for meta in attachments:
             attachment: dict[str, Any] = dict(meta)
             attachment.setdefault("original_url", None)
@@ -247,28 +300,41 @@ class GmailMessageAddedEvent(Event):
             attachment["file_url"] = None
             attachment["upload_file_id"] = None
             attachment["file_source"] = "gmail"
+            prepared.append((attachment, inline_data))
+
+        # Download contents in parallel; uploads below stay sequential
+        fetched: list[tuple[bytes | None, int | None] | None] = [None] * len(prepared)
+        if allow_upload:
+            to_fetch = [
+                index
+                for index, (attachment, _) in enumerate(prepared)
+                if not self._exceeds_upload_size(attachment.get("size"))
+            ]
+            if to_fetch:
+
+                def _fetch(index: int) -> tuple[bytes | None, int | None]:
+                    attachment, inline_data = prepared[index]
+                    return self._fetch_attachment_content(
+                        message_id=message_id,
+                        attachment=attachment,
+                        inline_data=inline_data,
+                        headers=headers,
+                        budget=budget,
+                    )
 
-            if not allow_upload:
-                attachment["file_url"] = attachment.get("original_url")
-                self._finalize_attachment_urls(attachment)
-                processed.append(attachment)
-                continue
-
-            size_hint_raw = attachment.get("size")
-            size_hint = size_hint_raw if isinstance(size_hint_raw, int) else None
+                with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_REQUESTS, len(to_fetch))) as executor:
+                    for index, result in zip(to_fetch, executor.map(_fetch, to_fetch)):
+                        fetched[index] = result
 
-            if isinstance(size_hint, int) and size_hint > self._MAX_ATTACHMENT_UPLOAD_SIZE:
+        for (attachment, _), result in zip(prepared, fetched):
+            if result is None:
+                # Not uploaded: too many attachments or larger than the upload limit
                 attachment["file_url"] = attachment.get("original_url")
                 self._finalize_attachment_urls(attachment)
                 processed.append(attachment)
                 continue
 
-            content, resolved_size = self._fetch_attachment_content(
-                message_id=message_id,
-                attachment=attachment,
-                inline_data=inline_data,
-                headers=headers,
-            )
+            content, resolved_size = result
             actual_size = resolved_size if isinstance(resolved_size, int) else None
             if actual_size is None and content is not None:
                 actual_size = len(content)
@@ -302,12 +368,16 @@ class GmailMessageAddedEvent(Event):
 
         return processed
 
+    def _exceeds_upload_size(self, size: Any) -> bool:
+        return isinstance(size, int) and size > self._MAX_ATTACHMENT_UPLOAD_SIZE
+
     def _fetch_attachment_content(
         self,
         message_id: str,
         attachment: Mapping[str, Any],
         inline_data: str | None,
         headers: Mapping[str, str],
+        budget: _AttachmentBudget,
     ) -> tuple[bytes | None, int | None]:
         if inline_data:
             try:
@@ -320,9 +390,13 @@ class GmailMessageAddedEvent(Event):
         if not attachment_id:
             return None, None
 
+        size_hint = attachment.get("size")
+        if not budget.allows(size_hint if isinstance(size_hint, int) else None):
+            return None, None
+
         url = f"{self._GMAIL_BASE}/users/me/messages/{message_id}/attachments/{attachment_id}"
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _session.get(url, headers=headers, timeout=max(0.1, min(10.0, budget.time_left())))
         except requests.RequestException:
             return None, None
         if response.status_code != 200:
@@ -337,6 +411,8 @@ class GmailMessageAddedEvent(Event):
             content = self._decode_base64url(encoded)
         except binascii.Error:
             return None, None
+        if not budget.consume(len(content)):
+            return None, None
 
         size = data.get("size")
         size_value = size if size is not None else len(content)
@@ -6,7 +6,7 @@ import json
 import secrets
 import time
 import urllib.parse
-from collections.abc import Mapping
+from collections.abc import Callable, Iterator, Mapping
 from typing import Any
 
 import requests
@@ -38,6 +38,12 @@ class GmailTrigger(Trigger):
     """
 
     _GMAIL_BASE = "https://gmail.googleapis.com/gmail/v1"
+    # History paging limits per dispatch; the remainder resumes on the next notification
+    _HISTORY_PAGE_SIZE = 500
+    _MAX_HISTORY_PAGES_PER_DISPATCH = 10
+    _MAX_HISTORY_RECORDS_PER_DISPATCH = 2000
+    # Notifications a saved page token may fail transiently before paging restarts from the checkpoint
+    _MAX_HISTORY_CURSOR_RETRIES = 3
 
     def _dispatch_event(self, subscription: Subscription, request: Request) -> EventDispatch:
         props = subscription.properties or {}
@@ -66,16 +72,34 @@ class GmailTrigger(Trigger):
             return EventDispatch(events=[], response=self._ok())
 
         start_history_id: str = session.storage.get(checkpoint_key).decode("utf-8")
+        cursor_key = f"gmail:{sub_key}:history_cursor"
+        page_token, retries = self._load_history_cursor(cursor_key, start_history_id)
+        saved_cursor = {"pageToken": page_token, "retries": retries}
+
+        def _save_cursor(next_page_token: str) -> None:
+            # The same token coming back means its page failed transiently again
+            if next_page_token == saved_cursor["pageToken"]:
+                saved_cursor["retries"] += 1
+            else:
+                saved_cursor.update(pageToken=next_page_token, retries=0)
+            cursor = {"startHistoryId": start_history_id, **saved_cursor}
+            session.storage.set(cursor_key, json.dumps(cursor).encode("utf-8"))
 
-        # 5) Fetch history delta since last checkpoint
-        messages, added, deleted, labels_added, labels_removed = self._fetch_history_delta(
+        # 5) Fetch history delta since last checkpoint, bounded per dispatch
+        messages, added, deleted, labels_added, labels_removed, next_page_token = self._fetch_history_delta(
             headers=headers,
             user_id=user_id,
             start_history_id=start_history_id,
+            page_token=page_token,
+            save_cursor=_save_cursor,
         )
 
-        # Always advance checkpoint to current notification's historyId
-        session.storage.set(checkpoint_key, str(notification["historyId"]).encode("utf-8"))
+        if next_page_token is None:
+            # History drained: advance checkpoint to current notification's historyId
+            if session.storage.exist(cursor_key):
+                session.storage.delete(cursor_key)
+            session.storage.set(checkpoint_key, str(notification["historyId"]).encode("utf-8"))
+        # Otherwise keep the checkpoint; the saved cursor resumes on the next notification
 
         # 6) Build combined payload and select events (no storage stashing)
         events: list[str] = []
@@ -137,14 +161,40 @@ class GmailTrigger(Trigger):
             raise TriggerDispatchError("Missing historyId or emailAddress in Gmail notification")
         return notification
 
+    def _load_history_cursor(self, cursor_key: str, start_history_id: str) -> tuple[str | None, int]:
+        """Return the saved page token and its failed attempts when it belongs to the current checkpoint."""
+        storage = self.runtime.session.storage
+        if not storage.exist(cursor_key):
+            return None, 0
+        try:
+            cursor = json.loads(storage.get(cursor_key).decode("utf-8"))
+        except Exception:
+            cursor = None
+        if not isinstance(cursor, dict) or cursor.get("startHistoryId") != start_history_id:
+            # Stale or corrupted cursor: restart paging from the checkpoint
+            storage.delete(cursor_key)
+            return None, 0
+        retries = cursor.get("retries") or 0
+        if retries >= self._MAX_HISTORY_CURSOR_RETRIES:
+            # The page keeps failing: restart paging from the checkpoint
+            storage.delete(cursor_key)
+            return None, 0
+        return cursor.get("pageToken") or None, retries
+
     def _fetch_history_delta(
         self,
         headers: Mapping[str, str],
         user_id: str,
         start_history_id: str,
+        page_token: str | None = None,
+        save_cursor: Callable[[str], None] | None = None,
     ):
         """Fetch Gmail history delta and return categorized changes.
 
+        Pages are consumed until the history is exhausted or the per-dispatch page/record
+        budget is reached. After each page with a successor, save_cursor receives its page
+        token; the last element of the result is that token when history remains, else None.
+
         If the start_history_id is invalid/out-of-date, reset the pointer and return empty changes.
         """
         added: list[dict[str, Any]] = []
@@ -153,16 +203,13 @@ class GmailTrigger(Trigger):
         labels_removed: list[dict[str, Any]] = []
         messages: list[dict[str, Any]] = []
 
-        url = f"{self._GMAIL_BASE}/users/{user_id}/history"
-        params: dict[str, Any] = {"startHistoryId": start_history_id}
-
-        while True:
-            resp: requests.Response = requests.get(url, headers=headers, params=params, timeout=10)
-            if resp.status_code != 200:
-                # history id may be invalid/out of range; swallow this batch and move checkpoint forward by caller
-                return [], [], [], [], []
-            data: dict[str, Any] = resp.json() or {}
-            for h in data.get("history", []) or []:
+        pages = 0
+        records = 0
+        next_page_token: str | None = None
+        for history, next_page_token in self._iter_history_pages(headers, user_id, start_history_id, page_token):
+            pages += 1
+            records += len(history)
+            for h in history:
                 for item in h.get("messagesAdded", []) or []:
                     msg = item.get("message") or {}
                     if not msg.get("id"):
@@ -192,13 +239,60 @@ class GmailTrigger(Trigger):
                                 "labelIds": item.get("labelIds") or [],
                             }
                         )
-            page_token = data.get("nextPageToken")
-            if not page_token:
+            if next_page_token and save_cursor:
+                save_cursor(next_page_token)
+            if pages >= self._MAX_HISTORY_PAGES_PER_DISPATCH or records >= self._MAX_HISTORY_RECORDS_PER_DISPATCH:
                 break
-            params["pageToken"] = page_token
 
         messages.extend(added + deleted)
-        return messages, added, deleted, labels_added, labels_removed
+        return messages, added, deleted, labels_added, labels_removed, next_page_token
+
+    def _iter_history_pages(
+        self,
+        headers: Mapping[str, str],
+        user_id: str,
+        start_history_id: str,
+        page_token: str | None = None,
+    ) -> Iterator[tuple[list[dict[str, Any]], str | None]]:
+        """Yield (history records, next page token) one users.history page at a time.
+
+        When a page other than the first one of the checkpoint fails transiently (network error,
+        429 or 5xx), an empty page pointing back at the failed token is yielded, so the caller
+        keeps the cursor and retries it on the next notification instead of skipping the rest
+        of the history. Any other failure of such a page (e.g. 400 for an expired token) restarts
+        paging once from start_history_id.
+        """
+        url = f"{self._GMAIL_BASE}/users/{user_id}/history"
+        params: dict[str, Any] = {"startHistoryId": start_history_id, "maxResults": self._HISTORY_PAGE_SIZE}
+        if page_token:
+            params["pageToken"] = page_token
+
+        restarted = False
+        while True:
+            try:
+                resp: requests.Response = requests.get(url, headers=headers, params=params, timeout=10)
+            except requests.RequestException:
+                if not params.get("pageToken"):
+                    raise
+                yield [], params["pageToken"]
+                return
+            if resp.status_code != 200:
+                if params.get("pageToken") and resp.status_code != 404:
+                    transient = resp.status_code == 429 or resp.status_code >= 500
+                    if not transient and not restarted:
+                        restarted = True
+                        del params["pageToken"]
+                        continue
+                    yield [], params["pageToken"]
+                    return
+                # 404: history id is out of range; swallow this batch and move checkpoint forward by caller
+                return
+            data: dict[str, Any] = resp.json() or {}
+            next_page_token = data.get("nextPageToken") or None
+            yield data.get("history", []) or [], next_page_token
+            if not next_page_token:
+                return
+            params["pageToken"] = next_page_token
 
     def _verify_oidc_token(self, token: str, audience: str, expected_email: str | None = None) -> None:
         """Verify OIDC token from Pub/Sub push using google-auth if available."""
@@ -0,0 +1,148 @@
+import base64
+import json
+from types import SimpleNamespace
+
+import provider.gmail_trigger as gmail_module
+import requests
+from dify_plugin.entities.trigger import Subscription
+from provider.gmail_trigger import GmailTrigger
+from werkzeug.test import EnvironBuilder
+from werkzeug.wrappers import Request
+
+CHECKPOINT_KEY = "gmail:sub:history_checkpoint"
+CURSOR_KEY = "gmail:sub:history_cursor"
+
+
+class FakeStorage:
+    def __init__(self, data: dict[str, bytes]) -> None:
+        self.data = data
+
+    def exist(self, key: str) -> bool:
+        return key in self.data
+
+    def get(self, key: str) -> bytes:
+        return self.data[key]
+
+    def set(self, key: str, value: bytes) -> None:
+        self.data[key] = value
+
+    def delete(self, key: str) -> None:
+        del self.data[key]
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, payload: dict | None = None) -> None:
+        self.status_code = status_code
+        self._payload = payload or {}
+
+    def json(self) -> dict:
+        return self._payload
+
+
+def make_trigger(storage: FakeStorage) -> GmailTrigger:
+    runtime = SimpleNamespace(
+        credentials={"access_token": "token"}, session=SimpleNamespace(storage=storage)
+    )
+    return GmailTrigger(runtime)
+
+
+def dispatch(trigger: GmailTrigger, history_id: str = "200"):
+    data = base64.b64encode(
+        json.dumps({"historyId": history_id, "emailAddress": "a@example.com"}).encode()
+    )
+    request = Request(
+        EnvironBuilder(method="POST", json={"message": {"data": data.decode()}}).get_environ()
+    )
+    subscription = Subscription(
+        endpoint="https://example.com/hook", properties={"subscription_key": "sub"}
+    )
+    return trigger._dispatch_event(subscription, request)
+
+
+def saved_cursor(storage: FakeStorage) -> dict | None:
+    if not storage.exist(CURSOR_KEY):
+        return None
+    return json.loads(storage.get(CURSOR_KEY))
+
+
+def history_page(message_id: str, next_page_token: str | None = None) -> FakeResponse:
+    payload = {"history": [{"messagesAdded": [{"message": {"id": message_id, "threadId": "t"}}]}]}
+    if next_page_token:
+        payload["nextPageToken"] = next_page_token
+    return FakeResponse(200, payload)
+
+
+def cursor_storage(retries: int = 0) -> FakeStorage:
+    cursor = {"startHistoryId": "100", "pageToken": "p2", "retries": retries}
+    return FakeStorage({CHECKPOINT_KEY: b"100", CURSOR_KEY: json.dumps(cursor).encode()})
+
+
+def test_transient_failure_keeps_the_cursor_and_counts_the_retry(monkeypatch) -> None:
+    storage = cursor_storage()
+    calls = []
+
+    def fake_get(url, headers, params, timeout):
+        calls.append(dict(params))
+        return FakeResponse(503)
+
+    monkeypatch.setattr(gmail_module.requests, "get", fake_get)
+
+    result = dispatch(make_trigger(storage))
+
+    assert result.events == []
+    assert [call.get("pageToken") for call in calls] == ["p2"]
+    assert saved_cursor(storage) == {"startHistoryId": "100", "pageToken": "p2", "retries": 1}
+    assert storage.get(CHECKPOINT_KEY) == b"100"
+
+
+def test_network_error_keeps_the_cursor(monkeypatch) -> None:
+    storage = cursor_storage(retries=1)
+
+    def fake_get(url, headers, params, timeout):
+        raise requests.ConnectionError("connection reset")
+
+    monkeypatch.setattr(gmail_module.requests, "get", fake_get)
+
+    dispatch(make_trigger(storage))
+
+    assert saved_cursor(storage) == {"startHistoryId": "100", "pageToken": "p2", "retries": 2}
+    assert storage.get(CHECKPOINT_KEY) == b"100"
+
+
+def test_rejected_page_token_restarts_from_the_checkpoint(monkeypatch) -> None:
+    storage = cursor_storage()
+    calls = []
+
+    def fake_get(url, headers, params, timeout):
+        calls.append(dict(params))
+        if params.get("pageToken") == "p2":
+            return FakeResponse(400)
+        return history_page("m1")
+
+    monkeypatch.setattr(gmail_module.requests, "get", fake_get)
+
+    result = dispatch(make_trigger(storage))
+
+    assert [call.get("pageToken") for call in calls] == ["p2", None]
+    assert all(call["startHistoryId"] == "100" for call in calls)
+    assert result.events == ["gmail_message_added"]
+    assert saved_cursor(storage) is None
+    assert storage.get(CHECKPOINT_KEY) == b"200"
+
+
+def test_exhausted_retries_restart_from_the_checkpoint(monkeypatch) -> None:
+    storage = cursor_storage(retries=GmailTrigger._MAX_HISTORY_CURSOR_RETRIES)
+    calls = []
+
+    def fake_get(url, headers, params, timeout):
+        calls.append(dict(params))
+        return history_page("m1", next_page_token="p1b")
+
+    monkeypatch.setattr(gmail_module.requests, "get", fake_get)
+    monkeypatch.setattr(GmailTrigger, "_MAX_HISTORY_PAGES_PER_DISPATCH", 1)
+
+    dispatch(make_trigger(storage))
+
+    assert [call.get("pageToken") for call in calls] == [None]
+    assert saved_cursor(storage) == {"startHistoryId": "100", "pageToken": "p1b", "retries": 0}
+    assert storage.get(CHECKPOINT_KEY) == b"100"